@@ -0,0 +1,55 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from watcher_cli.alerts import AlertEngine, AlertNotifier, load_rules, parse_rule
+from watcher_cli.models import QuoteSnapshot
+
+
+def _quote(symbol: str, price: str, rate: str = "0.00") -> QuoteSnapshot:
+    return QuoteSnapshot(symbol, symbol, "KR", price, price, None, rate)
+
+
+def test_parse_rule_supports_price_and_percent_change():
+    price = parse_rule("005930 >= 80000")
+    change = parse_rule("AAPL change <= -3%")
+
+    assert (price.symbol, price.field, price.operator, price.threshold) == ("005930", "price", ">=", 80000)
+    assert (change.symbol, change.field, change.operator, change.threshold) == ("AAPL", "change", "<=", -3)
+    with pytest.raises(ValueError):
+        parse_rule("005930 price >= 3%")
+
+
+def test_load_rules_reports_line_number(tmp_path: Path):
+    path = tmp_path / "alerts.txt"
+    path.write_text("# 알림\n005930 >= 80000\n005930 ~ 1\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="alerts.txt:3"):
+        load_rules(path)
+
+
+def test_alert_engine_fires_only_rules_crossed_between_updates(tmp_path: Path):
+    rules = [parse_rule(text) for text in ("005930 >= 80000", "005930 > 81000", "005930 < 79000", "AAPL >= 1")]
+    stream = io.StringIO()
+    log_path = tmp_path / "alerts.jsonl"
+    engine = AlertEngine(rules, notifier=AlertNotifier("bell", stream=stream), log_path=log_path)
+
+    assert engine.evaluate([_quote("005930", "79500")]) == []
+    assert [event.rule.text for event in engine.evaluate([_quote("005930", "81000")])] == ["005930 >= 80000"]
+    assert engine.evaluate([_quote("005930", "80500")]) == []
+    assert [event.rule.text for event in engine.evaluate([_quote("005930", "82000")])] == ["005930 > 81000"]
+    assert [event.rule.text for event in engine.evaluate([_quote("005930", "78000")])] == ["005930 < 79000"]
+
+    assert stream.getvalue() == "\a" * 3
+    records = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    assert [record["value"] for record in records] == [81000, 82000, 78000]
+
+
+def test_alert_engine_fires_satisfied_rules_on_first_quote():
+    engine = AlertEngine([parse_rule("AAPL change <= -3%"), parse_rule("AAPL change >= 3%")])
+
+    events = engine.evaluate([QuoteSnapshot("AAPL", "Apple", "US", "200", None, None, "-4.10")])
+
+    assert [event.rule.text for event in events] == ["AAPL change <= -3%"]
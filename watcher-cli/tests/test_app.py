@@ -3,10 +3,11 @@ import sys
 
 import pytest
 
-from watcher_cli.app import _run_add, _run_monitor, build_parser, main
+from watcher_cli.app import _run_add, _run_import, _run_monitor, _run_stream, build_parser, main
 from watcher_cli.config import load_config
 from watcher_cli.catalog import StockCatalog
-from watcher_cli.models import CatalogEntry, WatchItem
+from watcher_cli.models import CatalogEntry, QuoteSnapshot, WatchItem
+from watcher_cli.monitor import MonitorView
 from watcher_cli.storage import JsonWatchlistStorage
 
 
@@ -66,8 +67,32 @@ def test_run_add_handles_missing_stdin_for_ambiguous_result(tmp_path, monkeypatc
     assert "취소되었습니다." in captured.out
 
 
+def test_run_import_adds_resolved_rows_and_reports_the_rest(tmp_path, monkeypatch, capsys):
+    storage = JsonWatchlistStorage(tmp_path / "watchlist.json")
+    storage.add(WatchItem(symbol="005930", name="삼성전자", market="KR"))
+    path = tmp_path / "codes.txt"
+    path.write_text("005930\nAAPL\nApp\n", encoding="utf-8")
+
+    monkeypatch.setattr(
+        "watcher_cli.app.StockCatalog.from_default_files",
+        lambda: StockCatalog.from_entries(
+            [
+                CatalogEntry(symbol="005930", name="삼성전자", market="KR", exchange=None),
+                CatalogEntry(symbol="AAPL", name="Apple", market="US", exchange="NAS"),
+            ]
+        ),
+    )
+
+    _run_import(storage, path)
+
+    captured = capsys.readouterr()
+    assert [item.symbol for item in storage.list_items()] == ["005930", "AAPL"]
+    assert "3행 'App': 종목을 찾을 수 없습니다." in captured.out
+    assert "추가됨 1건, 이미 저장됨 1건, 모호함 0건, 찾을 수 없음 1건" in captured.out
+
+
 def test_main_prints_monitor_error_without_traceback(monkeypatch, capsys):
-    async def failing_monitor(_storage, _interval):
+    async def failing_monitor(_storage, _interval, **_options):
         raise ValueError("KIS_APP_KEY 환경 변수가 설정되지 않았습니다.")
 
     monkeypatch.setattr("watcher_cli.app._run_monitor", failing_monitor)
@@ -111,8 +136,89 @@ async def test_monitor_does_not_require_kis_client_for_empty_watchlist(tmp_path,
     async def stop_after_first_tick(_interval: float):
         raise RuntimeError("stop")
 
-    monkeypatch.setattr("watcher_cli.app.QuoteService", RaisingQuoteService)
-    monkeypatch.setattr("watcher_cli.app.asyncio.sleep", stop_after_first_tick)
+    monkeypatch.setattr("watcher_cli.quotes.QuoteService", RaisingQuoteService)
+    monkeypatch.setattr("asyncio.sleep", stop_after_first_tick)
 
     with pytest.raises(RuntimeError, match="stop"):
         await _run_monitor(storage, 5.0)
+
+
+@pytest.mark.asyncio
+async def test_monitor_fits_viewport_to_terminal_without_key_input(tmp_path, monkeypatch):
+    storage = JsonWatchlistStorage(tmp_path / "watchlist.json")
+    storage.add(WatchItem(symbol="005930", name="삼성전자", market="KR"))
+    views = []
+
+    class FakeQuoteService:
+        def __init__(self, metrics=None):
+            pass
+
+        async def fetch_many(self, items):
+            return [
+                QuoteSnapshot(item.symbol, item.name, item.market, "71000", "71000", None, "0.10")
+                for item in items
+            ]
+
+        async def close(self):
+            return None
+
+    class TtyRenderer:
+        is_tty = True
+
+        def __init__(self, background=False):
+            pass
+
+        def start(self):
+            return None
+
+        def render(self, text, highlights=None):
+            return None
+
+        def stop(self):
+            return None
+
+    class RecordingView(MonitorView):
+        def __init__(self):
+            super().__init__()
+            views.append(self)
+
+    async def stop_after_first_tick(_interval: float):
+        raise RuntimeError("stop")
+
+    monkeypatch.setattr("watcher_cli.quotes.QuoteService", FakeQuoteService)
+    monkeypatch.setattr("watcher_cli.keys.KeyReader.is_supported", staticmethod(lambda stream=None: False))
+    monkeypatch.setattr("watcher_cli.app.ScreenRenderer", TtyRenderer)
+    monkeypatch.setattr("watcher_cli.app.MonitorView", RecordingView)
+    monkeypatch.setattr("watcher_cli.app.terminal_viewport_height", lambda reserved: 7)
+    monkeypatch.setattr("asyncio.sleep", stop_after_first_tick)
+
+    with pytest.raises(RuntimeError, match="stop"):
+        await _run_monitor(storage, 5.0)
+
+    assert views[0].viewport.height == 7
+
+
+@pytest.mark.asyncio
+async def test_stream_once_writes_single_snapshot_without_screen(tmp_path, monkeypatch):
+    storage = JsonWatchlistStorage(tmp_path / "watchlist.json")
+    storage.add(WatchItem(symbol="005930", name="삼성전자", market="KR"))
+    output = tmp_path / "quotes.jsonl"
+
+    class FakeQuoteService:
+        async def fetch_many(self, items):
+            return [
+                QuoteSnapshot(item.symbol, item.name, item.market, "71000", "71000", None, "0.10")
+                for item in items
+            ]
+
+        async def close(self):
+            return None
+
+    monkeypatch.setattr("watcher_cli.quotes.QuoteService", FakeQuoteService)
+    monkeypatch.setattr("watcher_cli.app.ScreenRenderer", None)
+
+    await _run_stream(storage, 5.0, "jsonl", str(output), once=True)
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert '"symbol": "005930"' in lines[0]
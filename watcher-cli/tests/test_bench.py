@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from watcher_cli.bench import BenchResult, compare, load_baseline, save_baseline
+
+
+def _result(name: str, median_ms: float) -> BenchResult:
+    return BenchResult(
+        name=name,
+        runs=3,
+        median_ms=median_ms,
+        mean_ms=median_ms,
+        min_ms=median_ms,
+        max_ms=median_ms,
+    )
+
+
+def test_compare_flags_only_results_beyond_threshold(tmp_path: Path):
+    baseline_path = tmp_path / "baseline.json"
+    save_baseline([_result("catalog.search.exact", 10.0), _result("storage.list_items.100", 2.0)], baseline_path)
+
+    baseline = load_baseline(baseline_path)
+    regressions = compare(
+        baseline,
+        [
+            _result("catalog.search.exact", 11.5),
+            _result("storage.list_items.100", 3.0),
+            _result("quotes.fetch_many.10", 50.0),
+        ],
+        threshold=0.2,
+    )
+
+    assert [regression.name for regression in regressions] == ["storage.list_items.100"]
+    assert regressions[0].ratio == 1.5
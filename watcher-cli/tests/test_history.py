@@ -0,0 +1,52 @@
+from dataclasses import replace
+from datetime import datetime
+
+from watcher_cli.history import HistoryStore, PriceHistory, format_price
+from watcher_cli.models import QuoteSnapshot
+
+
+def _ts(hour: int, minute: int, second: int = 0, day: int = 26) -> int:
+    return int(datetime(2026, 1, day, hour, minute, second).timestamp())
+
+
+def test_price_history_is_bounded_and_keeps_session_high_low():
+    history = PriceHistory(capacity=3, resolution_sec=60)
+
+    for minute, price in enumerate([100.0, 130.0, 90.0, 110.0, 120.0]):
+        history.append(_ts(10, minute), price, volume=minute)
+    history.append(_ts(10, 4, 30), 125.0, volume=9)
+
+    assert len(history.prices) == 3
+    assert history.values() == [90.0, 110.0, 125.0]
+    assert (history.high, history.low) == (130.0, 90.0)
+
+
+def test_price_history_resets_on_new_session():
+    history = PriceHistory(capacity=10)
+    history.append(_ts(15, 0), 100.0)
+    history.append(_ts(9, 0, day=27), 105.0)
+
+    assert history.values() == [105.0]
+    assert (history.high, history.low) == (105.0, 105.0)
+
+
+def test_us_history_spans_midnight_in_one_session():
+    store = HistoryStore()
+    quote = QuoteSnapshot("AAPL", "Apple", "US", "200", None, None, "0.10")
+    store.record([quote], timestamp=_ts(23, 40))
+    store.record([replace(quote, best_price="210")], timestamp=_ts(1, 0, day=27))
+
+    assert store.get("AAPL").values() == [200.0, 210.0]
+
+
+def test_sparkline_downsamples_to_width():
+    history = PriceHistory(capacity=100, resolution_sec=1)
+    for second in range(40):
+        history.append(_ts(10, 0, second), float(second))
+
+    line = history.sparkline(width=8)
+
+    assert len(line) == 8
+    assert line[0] == "▁" and line[-1] == "█"
+    assert format_price(71000.0) == "71000"
+    assert format_price(214.33) == "214.33"
@@ -0,0 +1,64 @@
+import io
+from pathlib import Path
+
+from watcher_cli.catalog import StockCatalog
+from watcher_cli.importer import ImportRow, export_items, read_rows, resolve_rows
+from watcher_cli.models import CatalogEntry, WatchItem
+
+
+def _catalog() -> StockCatalog:
+    return StockCatalog.from_entries(
+        [
+            CatalogEntry(symbol="005930", name="삼성전자", market="KR", exchange="KRX"),
+            CatalogEntry(symbol="000660", name="SK하이닉스", market="KR", exchange="KRX"),
+            CatalogEntry(symbol="AAPL", name="Apple", market="US", exchange="NAS", aliases=("애플",)),
+            CatalogEntry(symbol="TWNA", name="Twin", market="US", exchange="NAS"),
+            CatalogEntry(symbol="TWNB", name="Twin", market="US", exchange="NYS"),
+        ]
+    )
+
+
+def test_read_rows_prefers_code_column_and_reads_plain_lists(tmp_path: Path):
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_text("name,종목코드,market\n삼성,5930,KR\n애플,AAPL,us\n", encoding="utf-8")
+    plain_path = tmp_path / "codes.txt"
+    plain_path.write_text("# 관심 종목\n005930\n\n애플\n", encoding="utf-8")
+
+    assert read_rows(csv_path) == [
+        ImportRow(line=2, query="5930", market="KR"),
+        ImportRow(line=3, query="AAPL", market="us"),
+    ]
+    assert read_rows(plain_path) == [ImportRow(line=2, query="005930"), ImportRow(line=4, query="애플")]
+
+
+def test_resolve_rows_reports_ambiguous_and_missing_rows():
+    rows = [
+        ImportRow(line=1, query="5930"),
+        ImportRow(line=2, query="애플"),
+        ImportRow(line=3, query="twin"),
+        ImportRow(line=4, query="없는종목"),
+        ImportRow(line=5, query="005930"),
+        ImportRow(line=6, query="sk하이닉스", market="KR"),
+    ]
+
+    result = resolve_rows(_catalog(), rows)
+
+    assert [item.symbol for item in result.items] == ["005930", "AAPL", "000660"]
+    assert result.duplicates == 1
+    assert [issue.row.line for issue in result.ambiguous] == [3]
+    assert {entry.symbol for entry in result.ambiguous[0].candidates} == {"TWNA", "TWNB"}
+    assert [issue.row.line for issue in result.missing] == [4]
+
+
+def test_export_round_trips_through_import(tmp_path: Path):
+    items = [
+        WatchItem(symbol="005930", name="삼성전자", market="KR"),
+        WatchItem(symbol="AAPL", name="Apple", market="US", exchange="NAS", aliases=("애플",)),
+    ]
+    stream = io.StringIO()
+    export_items(items, stream)
+    path = tmp_path / "watchlist.csv"
+    path.write_text(stream.getvalue(), encoding="utf-8")
+
+    assert stream.getvalue().splitlines()[0] == "symbol,name,market,exchange,aliases"
+    assert resolve_rows(_catalog(), read_rows(path)).items == items
@@ -1,10 +1,14 @@
 from datetime import datetime, timedelta
 from pathlib import Path
+import time
+from types import SimpleNamespace
 
+import httpx
 import pytest
 
-from watcher_cli.config import KISConfig
-from watcher_cli.kis import TokenInfo, TokenManager
+from watcher_cli.config import KISConfig, KISCredential, load_config
+from watcher_cli.kis import APIError, KISClient, RateLimiter, ShardedKISClient, TokenInfo, TokenManager
+from watcher_cli.metrics import MonitorMetrics
 
 
 @pytest.mark.asyncio
@@ -36,3 +40,108 @@ async def test_token_manager_reuses_persisted_token(tmp_path: Path):
 
     assert token == "persisted-token"
     assert called is False
+
+
+def test_token_manager_reports_only_unexpired_cached_token(tmp_path: Path):
+    config = KISConfig(app_key="key", app_secret="secret")
+    manager = TokenManager(config, cache_path=tmp_path / "token.json")
+    assert manager.cached_token() is None
+
+    manager._save_token(TokenInfo(access_token="stale", expires_at=datetime.now() + timedelta(minutes=10)))
+    assert manager.cached_token() is None
+
+    manager._save_token(TokenInfo(access_token="fresh", expires_at=datetime.now() + timedelta(hours=1)))
+    assert manager.cached_token().access_token == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_kis_client_records_latency_throttle_and_retry():
+    responses = iter(
+        [
+            httpx.Response(500, json={"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."}),
+            httpx.Response(200, json={"rt_cd": "0", "output": {"stck_prpr": "72000"}}),
+        ]
+    )
+    config = KISConfig(app_key="key", app_secret="secret", retry_backoff_sec=0.0)
+    http_client = httpx.AsyncClient(
+        base_url=config.base_url,
+        transport=httpx.MockTransport(lambda _request: next(responses)),
+    )
+    metrics = MonitorMetrics()
+    client = KISClient(config=config, client=http_client, metrics=metrics)
+    client.token_manager._token_info = TokenInfo(
+        access_token="token",
+        expires_at=datetime.now() + timedelta(hours=1),
+    )
+
+    payload = await client.get_current_price("005930")
+    await client.close()
+
+    assert payload["output"]["stck_prpr"] == "72000"
+    assert metrics.requests["FHKST01010100"].total == 2
+    assert metrics.throttled == 1
+    assert metrics.retries == 1
+
+
+def test_load_config_reads_numbered_credentials(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("KIS_APP_KEY", "key-1")
+    monkeypatch.setenv("KIS_APP_SECRET", "secret-1")
+    monkeypatch.setenv("KIS_APP_KEY_2", "key-2")
+    monkeypatch.setenv("KIS_APP_SECRET_2", "secret-2")
+    monkeypatch.setenv("KIS_RATE_LIMIT_PER_SEC", "15")
+    monkeypatch.delenv("KIS_APP_KEY_3", raising=False)
+    monkeypatch.delenv("KIS_APP_SECRET_3", raising=False)
+
+    config = load_config()
+
+    assert config.credentials == (KISCredential("key-1", "secret-1"), KISCredential("key-2", "secret-2"))
+    assert config.rate_limit_per_sec == 15
+    assert config.for_credential(config.credentials[1]).app_key == "key-2"
+
+
+class FakeShardClient:
+    def __init__(self, app_key: str):
+        self.config = SimpleNamespace(app_key=app_key)
+        self.calls: list[str] = []
+        self.throttled = False
+
+    async def get_current_price(self, stock_code: str, market: str = "J") -> dict:
+        self.calls.append(stock_code)
+        if self.throttled:
+            raise APIError("API 요청 실패: 500", response={"msg_cd": "EGW00201"}, status_code=500)
+        return {"rt_cd": "0", "output": {"stck_prpr": "1000"}}
+
+
+@pytest.mark.asyncio
+async def test_sharded_client_spreads_symbols_and_rebalances_throttled_key():
+    clients = [FakeShardClient(f"key-{index}") for index in range(3)]
+    now = [0.0]
+    sharded = ShardedKISClient(clients, clock=lambda: now[0])
+    symbols = [f"{index:06d}" for index in range(300)]
+
+    owners = {symbol: sharded.shard_for(symbol) for symbol in symbols}
+    assert all(60 <= list(owners.values()).count(index) <= 140 for index in range(3))
+
+    clients[0].throttled = True
+    moved = next(symbol for symbol in symbols if owners[symbol] == 0)
+    kept = next(symbol for symbol in symbols if owners[symbol] == 1)
+
+    assert (await sharded.get_current_price(moved))["rt_cd"] == "0"
+    assert clients[0].calls == [moved]
+    assert sharded.shard_for(moved) != 0
+    assert sharded.shard_for(kept) == 1
+
+    now[0] += 2.0
+    assert sharded.shard_for(moved) == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_requests_per_key():
+    limiter = RateLimiter(rate_per_sec=100)
+
+    started = time.perf_counter()
+    for _ in range(5):
+        await limiter.acquire()
+
+    assert time.perf_counter() - started >= 0.035
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from watcher_cli.memwatch import MemoryWatchdog, read_rss_bytes
+
+
+def test_read_rss_bytes_reports_current_process():
+    rss = read_rss_bytes()
+
+    assert rss is None or rss > 0
+
+
+def test_memory_watchdog_logs_growth_sites_and_warns_over_threshold(tmp_path: Path):
+    now = [0.0]
+    log_path = tmp_path / "memory.log"
+    watchdog = MemoryWatchdog(interval_sec=60, threshold_mb=0.5, log_path=log_path, clock=lambda: now[0])
+    watchdog.start()
+
+    assert watchdog.maybe_sample() is False
+    retained = [f"error-{index}" * 20 for index in range(20000)]
+    now[0] = 61
+    assert watchdog.maybe_sample() is True
+    watchdog.stop()
+
+    log = log_path.read_text(encoding="utf-8")
+    assert "test_memwatch.py" in log
+    assert "경고: 메모리 증가" in log
+    assert watchdog.warning is not None
+    assert len(retained) == 20000
@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from watcher_cli.metrics import Histogram, MonitorMetrics, StatsRecorder, summarize_stats
+
+
+def test_histogram_reports_bucket_upper_bound_percentiles():
+    histogram = Histogram()
+    for value in [3.0] * 90 + [150.0] * 9 + [4000.0]:
+        histogram.observe(value)
+
+    assert histogram.percentile(50) == 5.0
+    assert histogram.percentile(95) == 200.0
+    assert histogram.percentile(99) == 200.0
+    assert histogram.percentile(100) == 5000.0
+
+
+def test_footer_reads_preallocated_request_histogram(monkeypatch):
+    metrics = MonitorMetrics()
+    metrics.record_request("FHKST01010100", 3.0)
+    metrics.record_request("HHDFS76200200", 150.0)
+    metrics.record_request("CUSTOM", 150.0)
+
+    monkeypatch.setattr("watcher_cli.metrics.Histogram", None)
+    footer = metrics.footer()
+
+    assert metrics.all_requests.total == 3
+    assert "요청 3건 p50 200ms p95 200ms" in footer
+
+
+def test_stats_recorder_rolls_snapshots_into_summary(tmp_path: Path):
+    path = tmp_path / "monitor-stats.jsonl"
+    metrics = MonitorMetrics()
+    recorder = StatsRecorder(path, flush_cycles=2)
+
+    for _ in range(4):
+        metrics.begin_cycle()
+        metrics.record_request("FHKST01010100", 40.0)
+        metrics.record_throttle()
+        metrics.record_render(2.0)
+        metrics.end_cycle(45.0)
+        recorder.tick(metrics)
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+    assert metrics.cycles == 0
+
+    summary = summarize_stats(path)
+
+    assert "주기 4회" in summary
+    assert "제한 4" in summary
+    assert "request FHKST01010100" in summary
+    assert "50ms" in summary
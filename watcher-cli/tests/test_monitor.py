@@ -0,0 +1,158 @@
+from watcher_cli.keys import parse_keys
+from watcher_cli.models import QuoteSnapshot, WatchItem
+from watcher_cli.monitor import FetchScheduler, MonitorView, Viewport
+
+
+def _items(count: int) -> list[WatchItem]:
+    return [WatchItem(symbol=f"{index:06d}", name=f"종목{index}", market="KR") for index in range(count)]
+
+
+def _quote(symbol: str, price: str, rate: str = "0.10") -> QuoteSnapshot:
+    return QuoteSnapshot(symbol, symbol, "KR", price, price, None, rate)
+
+
+def test_viewport_scrolls_pages_and_clamps_to_list_bounds():
+    viewport = Viewport(height=40)
+
+    assert viewport.visible_range(500) == range(0, 40)
+    assert viewport.handle_key("pagedown", 500) is True
+    assert viewport.visible_range(500) == range(40, 80)
+    assert viewport.handle_key("end", 500) is True
+    assert viewport.visible_range(500) == range(460, 500)
+    assert viewport.handle_key("down", 500) is False
+    assert viewport.visible_range(100) == range(60, 100)
+
+
+def test_fetch_scheduler_budget_does_not_grow_with_list_length():
+    items = _items(1000)
+    scheduler = FetchScheduler(background_batch=10)
+
+    first_visible, first_background = scheduler.plan(items, items[:40])
+    _, second_background = scheduler.plan(items, items[:40])
+
+    assert first_visible == items[:40]
+    assert first_background == items[40:50]
+    assert second_background == items[50:60]
+
+
+def test_fetch_scheduler_reprioritizes_after_scroll():
+    items = _items(200)
+    scheduler = FetchScheduler(background_batch=5)
+
+    visible, background = scheduler.plan(items, items[100:140])
+
+    assert visible == items[100:140]
+    assert len(background) == 5
+    assert all(item not in items[100:140] for item in background)
+
+
+def test_monitor_view_scroll_only_needs_unfetched_visible_rows():
+    items = _items(10)
+    view = MonitorView(Viewport(height=3))
+    view.set_items(items)
+    view.update([_quote(item.symbol, "100") for item in items[:4]])
+
+    assert view.unfetched_visible_items() == []
+    view.handle_key("down")
+    view.handle_key("down")
+    assert view.unfetched_visible_items() == [items[4]]
+
+
+def test_monitor_view_background_update_keeps_visible_highlights():
+    view = MonitorView(Viewport(height=1))
+    view.set_items(_items(3))
+    view.update([_quote("000000", "100")])
+    view.update([_quote("000000", "110")])
+    view.update([_quote("000002", "100")], new_cycle=False)
+
+    _, highlights = view.render()
+    assert highlights == {3: 1}
+
+
+def test_monitor_view_renders_visible_window_with_highlights():
+    view = MonitorView(Viewport(height=2))
+    view.set_items(_items(5))
+    view.update([_quote("000000", "100"), _quote("000001", "200")])
+    view.update([_quote("000001", "190")])
+
+    text, highlights = view.render()
+
+    lines = text.splitlines()
+    assert lines[0].endswith("[1-2/5]")
+    assert len(lines) == 5
+    assert highlights == {4: -1}
+
+
+def test_monitor_view_keeps_rate_order_as_quotes_change():
+    view = MonitorView()
+    view.set_items(_items(4))
+    view.handle_key("s")
+    view.update([_quote(f"{index:06d}", "100", f"{index}.00") for index in range(4)])
+
+    assert [item.symbol for item in view.displayed_items()] == ["000003", "000002", "000001", "000000"]
+
+    view.update([_quote("000000", "100", "9.00")])
+    assert [item.symbol for item in view.displayed_items()] == ["000000", "000003", "000002", "000001"]
+
+    view.handle_key("r")
+    assert [item.symbol for item in view.displayed_items()] == ["000001", "000002", "000003", "000000"]
+
+
+def test_monitor_view_filters_and_groups_by_market():
+    items = [
+        WatchItem(symbol="AAPL", name="Apple", market="US", exchange="NAS"),
+        WatchItem(symbol="005930", name="삼성전자", market="KR", aliases=("samsung",)),
+        WatchItem(symbol="000660", name="SK하이닉스", market="KR"),
+    ]
+    view = MonitorView()
+    view.set_items(items)
+
+    view.handle_key("m")
+    assert [item.symbol for item in view.displayed_items()] == ["005930", "000660", "AAPL"]
+
+    for key in "/sam":
+        view.handle_key(key)
+    assert view.editing_filter is True
+    assert [item.symbol for item in view.displayed_items()] == ["005930"]
+
+    view.handle_key("enter")
+    text, _ = view.render()
+    assert "필터: sam" in text.splitlines()[0]
+    assert "시장" in text.splitlines()[1]
+
+    view.handle_key("escape")
+    assert len(view.displayed_items()) == 3
+
+
+def test_monitor_view_descending_name_sort_keeps_market_groups():
+    items = [
+        WatchItem(symbol="AAPL", name="Apple", market="US", exchange="NAS"),
+        WatchItem(symbol="MSFT", name="Microsoft", market="US", exchange="NAS"),
+        WatchItem(symbol="005930", name="삼성전자", market="KR"),
+        WatchItem(symbol="000660", name="SK하이닉스", market="KR"),
+    ]
+    view = MonitorView()
+    view.set_items(items)
+    view.handle_key("m")
+    for _ in range(3):
+        view.handle_key("s")
+    assert view.sort_mode == "name"
+
+    view.handle_key("r")
+
+    assert [item.symbol for item in view.displayed_items()] == ["005930", "000660", "MSFT", "AAPL"]
+
+
+def test_monitor_view_reports_filter_without_matches():
+    view = MonitorView()
+    view.set_items(_items(3))
+    for key in "/zzz":
+        view.handle_key(key)
+
+    text, _ = view.render()
+
+    assert text.splitlines()[1] == "필터와 일치하는 종목이 없습니다."
+
+
+def test_parse_keys_decodes_escape_sequences():
+    assert parse_keys("\033[Aj\033[6~q\033") == ["up", "j", "pagedown", "q", "escape"]
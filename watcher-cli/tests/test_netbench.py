@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+
+from watcher_cli.config import KISConfig
+from watcher_cli.fakekis import FakeKISServer
+from watcher_cli.kis import APIError, KISClient
+from watcher_cli.metrics import MonitorMetrics
+from watcher_cli.models import WatchItem
+from watcher_cli.netbench import format_report, run_diagnostic, temporary_token_cache
+
+
+def _fake_config(base_url: str) -> KISConfig:
+    return KISConfig(app_key="fake", app_secret="fake", retry_backoff_sec=0.0, base_url_override=base_url)
+
+
+@pytest.mark.asyncio
+async def test_run_diagnostic_measures_each_phase_against_fake_server(tmp_path: Path):
+    items = [
+        WatchItem(symbol="005930", name="삼성전자", market="KR"),
+        WatchItem(symbol="AAPL", name="Apple", market="US", exchange="NAS"),
+    ]
+
+    async with FakeKISServer(latency_sec=0.0, seed=1) as server:
+        report = await run_diagnostic(
+            _fake_config(server.base_url),
+            items,
+            runs=3,
+            token_cache_path=tmp_path / "token.json",
+        )
+
+    assert report.base_url == server.base_url
+    assert report.token_cached is False
+    assert [timings.name for timings in report.endpoints] == ["국내 현재가", "해외 현재가"]
+    for timings in report.endpoints:
+        assert len(timings.total_ms) == 3
+        assert len(timings.ttfb_ms) == 3
+        assert len(timings.connect_ms) == 1
+        assert timings.tls_ms == []
+        assert timings.statuses == {200: 3}
+        assert timings.errors == 0
+    assert len(report.cycle_ms) == 3
+    assert report.cycle_errors == 0
+    assert server.stats.tokens == 1
+    assert server.stats.throttled == 0
+
+    text = format_report(report)
+    assert "토큰:" in text
+    assert "관심 종목 2개 주기" in text
+
+
+@pytest.mark.asyncio
+async def test_fake_server_throttling_is_recorded_by_client(tmp_path: Path):
+    metrics = MonitorMetrics()
+
+    async with FakeKISServer(latency_sec=0.0, throttle_rate=1.0, seed=1) as server:
+        config = _fake_config(server.base_url)
+        async with KISClient(config=config, metrics=metrics, token_cache_path=tmp_path / "token.json") as client:
+            with pytest.raises(APIError):
+                await client.get_current_price("005930")
+
+    assert server.stats.throttled == config.max_retries + 1
+    assert metrics.throttled == config.max_retries + 1
+
+
+def test_temporary_token_cache_removes_its_directory():
+    with temporary_token_cache() as token_cache_path:
+        token_cache_path.write_text("{}", encoding="utf-8")
+        directory = token_cache_path.parent
+
+    assert not directory.exists()
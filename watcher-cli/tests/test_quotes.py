@@ -58,6 +58,7 @@ async def test_quote_service_fetches_krx_and_nxt_for_korean_stocks():
     assert quote.krx_price == "72000"
     assert quote.nxt_price == "72100"
     assert quote.change_rate == "0.70"
+    assert quote.volume == 2000000
 
 
 @pytest.mark.asyncio
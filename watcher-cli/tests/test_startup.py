@@ -0,0 +1,61 @@
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+IMPORT_BUDGET_MS = 300
+ATTEMPTS = 3
+HEAVY_MODULES = (
+    "asyncio",
+    "httpx",
+    "dotenv",
+    "watcher_cli.config",
+    "watcher_cli.kis",
+    "watcher_cli.quotes",
+)
+SCRIPT = """
+import sys
+sys.argv = ["watcher", *sys.argv[1:]]
+from watcher_cli.app import main
+main()
+print(",".join(name for name in {heavy!r} if name in sys.modules), file=sys.stderr)
+"""
+
+
+def _run(args: list[str], home: Path) -> tuple[float, list[str]]:
+    env = {**os.environ, "HOME": str(home), "PYTHONPATH": str(ROOT)}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT.format(heavy=HEAVY_MODULES), *args],
+        cwd=home,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lines = completed.stderr.splitlines()
+    total_us = 0
+    started = False
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        started = started or name.strip() == "watcher_cli"
+        if started and not name.startswith("  "):
+            total_us += int(cumulative)
+    loaded = [name for name in lines[-1].split(",") if name]
+    return total_us / 1000, loaded
+
+
+@pytest.mark.parametrize("args", [["list"], ["remove", "005930"], ["export"]])
+def test_short_commands_do_not_import_monitor_dependencies(tmp_path: Path, args: list[str]):
+    assert _run(args, tmp_path)[1] == []
+
+
+@pytest.mark.parametrize("args", [["list"], ["remove", "005930"], ["export"]])
+def test_short_commands_stay_within_import_budget(tmp_path: Path, args: list[str]):
+    results = [_run(args, tmp_path) for _ in range(ATTEMPTS)]
+
+    assert min(elapsed for elapsed, _ in results) < IMPORT_BUDGET_MS
@@ -1,7 +1,8 @@
 from pathlib import Path
 
 from watcher_cli.models import WatchItem
-from watcher_cli.storage import JsonWatchlistStorage
+from watcher_cli import storage as storage_module
+from watcher_cli.storage import JsonWatchlistStorage, SqliteWatchlistStorage
 
 
 def test_storage_add_list_remove(tmp_path: Path):
@@ -30,3 +31,67 @@ def test_storage_add_list_remove(tmp_path: Path):
     removed_apple = storage.remove("애플")
     assert removed_apple == apple
     assert storage.list_items() == []
+
+
+def test_storage_reuses_parsed_items_until_file_changes(tmp_path: Path, monkeypatch):
+    path = tmp_path / "watchlist.json"
+    monitor_storage = JsonWatchlistStorage(path)
+    cli_storage = JsonWatchlistStorage(path)
+    samsung = WatchItem(symbol="005930", name="삼성전자", market="KR")
+    apple = WatchItem(symbol="AAPL", name="Apple", market="US", exchange="NAS")
+    cli_storage.add(samsung)
+
+    assert monitor_storage.list_items() == [samsung]
+
+    parses = []
+    original_loads = storage_module.json.loads
+    monkeypatch.setattr(storage_module.json, "loads", lambda text: parses.append(text) or original_loads(text))
+    assert monitor_storage.list_items() == [samsung]
+    assert parses == []
+
+    cli_storage.add(apple)
+    assert monitor_storage.list_items() == [samsung, apple]
+    assert len(parses) == 2
+
+
+def test_sqlite_storage_add_list_remove(tmp_path: Path):
+    storage = SqliteWatchlistStorage(tmp_path / "watchlist.db")
+    samsung = WatchItem(symbol="005930", name="삼성전자", market="KR")
+    apple = WatchItem(symbol="AAPL", name="Apple", market="US", exchange="NAS", aliases=("애플",))
+
+    assert storage.add(samsung) is True
+    assert storage.add(apple) is True
+    assert storage.add(samsung) is False
+    assert storage.list_items() == [samsung, apple]
+
+    assert storage.remove("apple") == apple
+    assert storage.remove("애플") is None
+    assert storage.remove_many(["005930", "없는종목"]) == [samsung]
+    assert storage.list_items() == []
+
+
+def test_sqlite_storage_bulk_add_is_atomic_and_visible_to_other_connections(tmp_path: Path):
+    path = tmp_path / "watchlist.db"
+    monitor_storage = SqliteWatchlistStorage(path)
+    cli_storage = SqliteWatchlistStorage(path)
+    items = [WatchItem(symbol=f"{index:06d}", name=f"종목{index}", market="KR") for index in range(3000)]
+
+    assert monitor_storage.list_items() == []
+    assert cli_storage.add_many([*items, items[0]]) == 3000
+    assert monitor_storage.list_items() == items
+
+    cli_storage.remove("종목1")
+    assert len(monitor_storage.list_items()) == 2999
+
+
+def test_sqlite_storage_migrates_legacy_json(tmp_path: Path):
+    legacy = JsonWatchlistStorage(tmp_path / "watchlist.json")
+    apple = WatchItem(symbol="AAPL", name="Apple", market="US", exchange="NAS", aliases=("애플",))
+    legacy.add(apple)
+
+    storage = SqliteWatchlistStorage(tmp_path / "watchlist.db")
+    assert storage.list_items() == [apple]
+    storage.remove("AAPL")
+
+    reopened = SqliteWatchlistStorage(tmp_path / "watchlist.db")
+    assert reopened.list_items() == []
@@ -0,0 +1,71 @@
+import io
+import json
+import threading
+
+from watcher_cli.models import QuoteSnapshot
+from watcher_cli.stream import QuoteStreamWriter
+
+
+def _quote(symbol: str, price: str) -> QuoteSnapshot:
+    return QuoteSnapshot(symbol, symbol, "KR", price, price, None, "0.10")
+
+
+class SlowStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.entered = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.entered.set()
+        self.release.wait(timeout=5)
+        return super().write(text)
+
+
+def test_stream_writer_emits_only_changed_snapshots_as_jsonl():
+    stream = io.StringIO()
+    writer = QuoteStreamWriter(stream, "jsonl")
+    writer.start()
+
+    assert writer.publish([_quote("005930", "71000"), _quote("000660", "120000")]) == 2
+    assert writer.publish([_quote("005930", "71000"), _quote("000660", "121000")]) == 1
+    writer.stop()
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(record["symbol"], record["best_price"]) for record in records] == [
+        ("005930", "71000"),
+        ("000660", "120000"),
+        ("000660", "121000"),
+    ]
+    assert all(record["timestamp"] for record in records)
+
+
+def test_stream_writer_drops_oldest_records_when_consumer_is_slow():
+    stream = SlowStream()
+    writer = QuoteStreamWriter(stream, "csv", max_pending=2)
+    writer.start()
+    stream.entered.wait(timeout=5)
+
+    for price in ("1", "2", "3", "4"):
+        writer.publish([_quote("005930", price)])
+    stream.release.set()
+    writer.stop()
+
+    lines = stream.getvalue().splitlines()
+    assert lines[0].startswith("timestamp,symbol,name")
+    assert [line.split(",")[4] for line in lines[1:]] == ["3", "4"]
+    assert writer.dropped == 2
+
+
+def test_stream_writer_keeps_csv_header_when_queue_overflows():
+    stream = io.StringIO()
+    writer = QuoteStreamWriter(stream, "csv", max_pending=1)
+
+    writer.publish([_quote("005930", "1"), _quote("000660", "2")])
+    writer.start()
+    writer.stop()
+
+    lines = stream.getvalue().splitlines()
+    assert lines[0].startswith("timestamp,symbol,name")
+    assert [line.split(",")[1] for line in lines[1:]] == ["000660"]
+    assert writer.dropped == 1
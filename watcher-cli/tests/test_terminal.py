@@ -1,5 +1,8 @@
+from datetime import datetime, timedelta
 import io
 
+from watcher_cli.models import QuoteSnapshot, WatchItem
+from watcher_cli.monitor import MonitorView
 from watcher_cli.terminal import ScreenRenderer
 
 
@@ -20,5 +23,69 @@ def test_screen_renderer_uses_alternate_screen_and_rerenders_in_place():
     output = stream.getvalue()
 
     assert "\033[?1049h" in output
-    assert output.count("\033[H\033[J") == 2
-    assert "\033[?1049l" in output
+    assert output.count("\033[H\033[J") == 1
+    assert output.endswith("\033[1;7H2\033[?1049l")
+
+
+def test_screen_renderer_writes_nothing_for_unchanged_frame():
+    stream = FakeTTY()
+    renderer = ScreenRenderer(stream)
+    frame = "title\n" + "\n".join(f"{index:06d}  72000" for index in range(500))
+
+    renderer.render(frame)
+    written = len(stream.getvalue())
+    renderer.render(frame)
+
+    assert len(stream.getvalue()) == written
+
+
+def test_screen_renderer_emits_only_changed_cells_with_highlight():
+    stream = FakeTTY()
+    renderer = ScreenRenderer(stream)
+    rows = [f"{index:06d}  삼성전자  72000" for index in range(500)]
+
+    renderer.render("\n".join(rows))
+    written = len(stream.getvalue())
+    rows[10] = rows[10].replace("72000", "72100")
+    renderer.render("\n".join(rows), {10: 1})
+
+    delta = stream.getvalue()[written:]
+    assert delta == "\033[11;21H\033[31m1\033[0m"
+
+
+def test_screen_renderer_background_writer_flushes_latest_frame_on_stop():
+    stream = FakeTTY()
+    renderer = ScreenRenderer(stream, background=True)
+
+    renderer.start()
+    renderer.render("frame-1")
+    renderer.stop()
+
+    assert "frame-1" in stream.getvalue()
+    assert stream.getvalue().endswith("\033[?1049l")
+
+
+
+def test_monitor_frame_without_price_change_writes_nothing(monkeypatch):
+    stream = FakeTTY()
+    renderer = ScreenRenderer(stream)
+    view = MonitorView()
+    view.set_items([WatchItem(symbol="005930", name="삼성전자", market="KR")])
+    quote = QuoteSnapshot("005930", "삼성전자", "KR", "72000", "72000", None, "0.10")
+
+    view.update([quote])
+    renderer.render(*view.render())
+    written = len(stream.getvalue())
+
+    class LaterDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(seconds=5)
+
+    monkeypatch.setattr("watcher_cli.terminal.datetime", LaterDatetime)
+    monkeypatch.setattr("watcher_cli.monitor.datetime", LaterDatetime)
+    view.update([quote])
+    renderer.render(*view.render())
+
+    assert view.render()[0].startswith("Trade Watcher (갱신: ")
+    assert len(stream.getvalue()) == written
@@ -1,5 +1,11 @@
 """Watcher CLI package."""
 
-from watcher_cli.app import build_parser, main
-
 __all__ = ["build_parser", "main"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        from watcher_cli import app
+
+        return getattr(app, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
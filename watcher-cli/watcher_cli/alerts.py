@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+import json
+import math
+from pathlib import Path
+import sys
+from typing import TextIO
+
+from watcher_cli.models import QuoteSnapshot, to_float
+
+FIELDS = ("price", "change")
+RISING_OPERATORS = (">=", ">")
+FALLING_OPERATORS = ("<=", "<")
+OPERATORS = RISING_OPERATORS + FALLING_OPERATORS
+NOTIFY_MODES = ("bell", "desktop", "none")
+FIELD_LABELS = {"price": "가격", "change": "변동률"}
+
+
+def default_rules_path() -> Path:
+    return Path.home() / ".config" / "trade-watcher" / "alerts.txt"
+
+
+def default_log_path() -> Path:
+    return Path.home() / ".config" / "trade-watcher" / "alerts.jsonl"
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    symbol: str
+    field: str
+    operator: str
+    threshold: float
+    text: str
+
+
+@dataclass(frozen=True)
+class AlertEvent:
+    rule: AlertRule
+    value: float
+    previous: float | None
+    triggered_at: datetime
+
+    @property
+    def message(self) -> str:
+        unit = "%" if self.rule.field == "change" else ""
+        return (
+            f"{self.rule.symbol} {FIELD_LABELS[self.rule.field]} {self.value:g}{unit} "
+            f"({self.rule.operator} {self.rule.threshold:g}{unit})"
+        )
+
+
+def parse_rule(text: str) -> AlertRule:
+    tokens = text.split()
+    if len(tokens) == 3:
+        symbol, operator, raw_value = tokens
+        field = "price"
+    elif len(tokens) == 4:
+        symbol, field, operator, raw_value = tokens
+        field = field.lower()
+    else:
+        raise ValueError(f"알림 규칙 형식이 올바르지 않습니다: {text}")
+
+    if field not in FIELDS:
+        raise ValueError(f"지원하지 않는 알림 항목입니다: {field}")
+    if operator not in OPERATORS:
+        raise ValueError(f"지원하지 않는 비교 연산자입니다: {operator}")
+    if raw_value.endswith("%"):
+        if field != "change":
+            raise ValueError(f"'%'는 change 규칙에만 쓸 수 있습니다: {text}")
+        raw_value = raw_value[:-1]
+    try:
+        threshold = float(raw_value.replace(",", ""))
+    except ValueError as exc:
+        raise ValueError(f"알림 기준값이 올바르지 않습니다: {text}") from exc
+    return AlertRule(symbol=symbol, field=field, operator=operator, threshold=threshold, text=text)
+
+
+def load_rules(path: Path | None = None) -> list[AlertRule]:
+    path = path or default_rules_path()
+    if not path.exists():
+        return []
+    rules = []
+    for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        text = line.split("#", 1)[0].strip()
+        if not text:
+            continue
+        try:
+            rules.append(parse_rule(text))
+        except ValueError as exc:
+            raise ValueError(f"{path}:{line_number}: {exc}") from exc
+    return rules
+
+
+class ThresholdBook:
+    __slots__ = ("thresholds", "rules")
+
+    def __init__(self) -> None:
+        self.thresholds: dict[str, list[float]] = {operator: [] for operator in OPERATORS}
+        self.rules: dict[str, list[AlertRule]] = {operator: [] for operator in OPERATORS}
+
+    def add(self, rule: AlertRule) -> None:
+        thresholds = self.thresholds[rule.operator]
+        position = bisect_right(thresholds, rule.threshold)
+        thresholds.insert(position, rule.threshold)
+        self.rules[rule.operator].insert(position, rule)
+
+    def crossed(self, previous: float | None, current: float) -> list[AlertRule]:
+        crossed: list[AlertRule] = []
+        if previous is None or current > previous:
+            low = -math.inf if previous is None else previous
+            thresholds = self.thresholds[">="]
+            crossed.extend(self.rules[">="][bisect_right(thresholds, low) : bisect_right(thresholds, current)])
+            thresholds = self.thresholds[">"]
+            crossed.extend(self.rules[">"][bisect_left(thresholds, low) : bisect_left(thresholds, current)])
+        if previous is None or current < previous:
+            high = math.inf if previous is None else previous
+            thresholds = self.thresholds["<="]
+            crossed.extend(self.rules["<="][bisect_left(thresholds, current) : bisect_left(thresholds, high)])
+            thresholds = self.thresholds["<"]
+            crossed.extend(self.rules["<"][bisect_right(thresholds, current) : bisect_right(thresholds, high)])
+        return crossed
+
+
+class AlertEngine:
+    def __init__(
+        self,
+        rules: list[AlertRule],
+        notifier: AlertNotifier | None = None,
+        log_path: Path | None = None,
+    ):
+        self.notifier = notifier
+        self.log_path = log_path
+        self._books: dict[tuple[str, str], ThresholdBook] = {}
+        self._last: dict[tuple[str, str], float] = {}
+        for rule in rules:
+            key = (rule.symbol.upper(), rule.field)
+            book = self._books.get(key)
+            if book is None:
+                book = self._books[key] = ThresholdBook()
+            book.add(rule)
+
+    def evaluate(self, quotes: list[QuoteSnapshot]) -> list[AlertEvent]:
+        events: list[AlertEvent] = []
+        now = datetime.now()
+        for quote in quotes:
+            symbol = quote.symbol.upper()
+            for field, raw in (("price", quote.best_price), ("change", quote.change_rate)):
+                key = (symbol, field)
+                book = self._books.get(key)
+                if book is None:
+                    continue
+                value = to_float(raw)
+                if value is None:
+                    continue
+                previous = self._last.get(key)
+                self._last[key] = value
+                if previous == value:
+                    continue
+                for rule in book.crossed(previous, value):
+                    events.append(AlertEvent(rule=rule, value=value, previous=previous, triggered_at=now))
+
+        if events:
+            self._write_log(events)
+            if self.notifier is not None:
+                self.notifier.notify(events)
+        return events
+
+    def _write_log(self, events: list[AlertEvent]) -> None:
+        if self.log_path is None:
+            return
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.log_path.open("a", encoding="utf-8") as handle:
+            for event in events:
+                record = {
+                    "triggered_at": event.triggered_at.strftime("%Y-%m-%d %H:%M:%S"),
+                    "symbol": event.rule.symbol,
+                    "rule": event.rule.text,
+                    "value": event.value,
+                    "previous": event.previous,
+                }
+                handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class AlertNotifier:
+    def __init__(self, mode: str = "bell", stream: TextIO | None = None):
+        if mode not in NOTIFY_MODES:
+            raise ValueError(f"지원하지 않는 알림 방식입니다: {mode}")
+        self.mode = mode
+        self.stream = stream or sys.stdout
+        self.last_message: str | None = None
+
+    def notify(self, events: list[AlertEvent]) -> None:
+        self.last_message = events[-1].message
+        if self.mode == "none":
+            return
+        if self.mode == "desktop" and self._send_desktop(events):
+            return
+        self.stream.write("\a")
+        self.stream.flush()
+
+    def _send_desktop(self, events: list[AlertEvent]) -> bool:
+        import platform
+        import shutil
+        import subprocess
+
+        body = "\n".join(event.message for event in events)
+        if platform.system() == "Darwin" and shutil.which("osascript"):
+            script = f"display notification {json.dumps(body)} with title \"Trade Watcher\""
+            command = ["osascript", "-e", script]
+        elif shutil.which("notify-send"):
+            command = ["notify-send", "Trade Watcher", body]
+        else:
+            return False
+        try:
+            subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            return False
+        return True
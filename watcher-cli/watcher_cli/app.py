@@ -1,20 +1,46 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
+from pathlib import Path
+import sys
+import time
+from typing import TYPE_CHECKING
 
+from watcher_cli.alerts import NOTIFY_MODES, AlertEngine, AlertNotifier, default_log_path, load_rules
 from watcher_cli.catalog import StockCatalog
+from watcher_cli.importer import export_items, read_rows, resolve_rows
+from watcher_cli.metrics import MonitorMetrics, StatsRecorder, summarize_stats
 from watcher_cli.models import CatalogEntry, WatchItem
-from watcher_cli.quotes import QuoteService
-from watcher_cli.storage import JsonWatchlistStorage
-from watcher_cli.terminal import ScreenRenderer, render_monitor, render_watchlist
+from watcher_cli.monitor import (
+    DEFAULT_BACKGROUND_BATCH,
+    NAVIGATION_FETCH_DELAY_SEC,
+    FetchScheduler,
+    MonitorView,
+    terminal_viewport_height,
+)
+from watcher_cli.storage import SqliteWatchlistStorage, WatchlistStorage
+from watcher_cli.stream import STREAM_FORMATS, QuoteStreamWriter
+from watcher_cli.terminal import ScreenRenderer, render_watchlist
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from watcher_cli.memwatch import MemoryWatchdog
+
+# asyncio, httpx(quotes/kis), dotenv(config)는 monitor 경로에서만 불러와
+# list/add/remove 같은 짧은 명령의 시작 시간을 줄인다. asyncio만 해도
+# `python -X importtime` 기준 누적 35~45ms로 짧은 명령 전체 import보다 크다.
+# 동기 진입점은 `_run_async` 한 곳에서만 불러오고, 코루틴 안의 import는
+# 이미 로드된 모듈의 이름만 묶는다.
+
+IMPORT_CANDIDATE_LIMIT = 5
 
 
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
-    storage = JsonWatchlistStorage()
+    storage = SqliteWatchlistStorage()
 
     if args.command == "list":
         print(render_watchlist(storage.list_items()))
@@ -28,9 +54,54 @@ def main() -> None:
         _run_remove(storage, args.query)
         return
 
+    if args.command == "import":
+        _run_import(storage, args.path)
+        return
+
+    if args.command == "export":
+        _run_export(storage, args.output)
+        return
+
     if args.command == "monitor":
+        streaming = args.format is not None or args.output is not None or args.once
+        message_stream = sys.stderr if streaming else sys.stdout
+        try:
+            alerts = _build_alert_engine(args.alerts, args.notify, message_stream)
+            watchdog = _build_memory_watchdog(args) if args.trace_memory else None
+            if streaming:
+                runner = _run_stream(
+                    storage,
+                    args.interval,
+                    args.format or "jsonl",
+                    args.output,
+                    once=args.once,
+                    alerts=alerts,
+                    watchdog=watchdog,
+                )
+            else:
+                runner = _run_monitor(
+                    storage,
+                    args.interval,
+                    stats=args.stats,
+                    background_batch=args.background_batch,
+                    alerts=alerts,
+                    watchdog=watchdog,
+                )
+            _run_async(runner)
+        except KeyboardInterrupt:
+            print("\n중단되었습니다.", file=message_stream)
+        except ValueError as exc:
+            print(str(exc), file=message_stream)
+            raise SystemExit(1) from exc
+        return
+
+    if args.command == "stats":
+        print(summarize_stats(args.path))
+        return
+
+    if args.command == "bench":
         try:
-            asyncio.run(_run_monitor(storage, args.interval))
+            _run_async(_run_bench(storage, args))
         except KeyboardInterrupt:
             print("\n중단되었습니다.")
         except ValueError as exc:
@@ -53,13 +124,85 @@ def build_parser() -> argparse.ArgumentParser:
     remove_parser = subparsers.add_parser("remove", help="관심 종목 제거")
     remove_parser.add_argument("query", nargs="?", help="종목 코드 또는 이름")
 
+    import_parser = subparsers.add_parser(
+        "import",
+        help="파일에서 관심 종목 일괄 추가 (CSV 또는 줄 단위 목록)",
+    )
+    import_parser.add_argument("path", type=Path, help="가져올 파일 경로")
+
+    export_parser = subparsers.add_parser("export", help="관심 종목을 CSV로 내보내기")
+    export_parser.add_argument("--output", type=Path, help="저장할 파일 경로 (기본: 표준 출력)")
+
     monitor_parser = subparsers.add_parser("monitor", help="5초 주기 시세 모니터")
     monitor_parser.add_argument("--interval", type=float, default=5.0, help="갱신 주기(초)")
+    monitor_parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="하단에 계측 정보를 표시하고 통계 파일에 기록",
+    )
+
+    monitor_parser.add_argument(
+        "--background-batch",
+        type=int,
+        default=DEFAULT_BACKGROUND_BATCH,
+        help="주기마다 조회할 화면 밖 종목 수",
+    )
+    monitor_parser.add_argument(
+        "--format",
+        choices=STREAM_FORMATS,
+        help="화면 대신 변경된 시세를 레코드 단위로 출력",
+    )
+    monitor_parser.add_argument("--output", help="스트림 출력 경로 ('-'는 표준 출력, 기본값)")
+    monitor_parser.add_argument("--once", action="store_true", help="한 번만 조회해서 출력하고 종료")
+    monitor_parser.add_argument(
+        "--alerts",
+        type=Path,
+        help="알림 규칙 파일 (기본: ~/.config/trade-watcher/alerts.txt)",
+    )
+    monitor_parser.add_argument(
+        "--notify",
+        choices=NOTIFY_MODES,
+        default="bell",
+        help="알림 방식",
+    )
+    monitor_parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="RSS와 tracemalloc 스냅샷을 주기적으로 기록 (~/.config/trade-watcher/memory.log)",
+    )
+    monitor_parser.add_argument(
+        "--trace-memory-interval",
+        type=float,
+        default=300.0,
+        help="메모리 샘플링 간격(초)",
+    )
+    monitor_parser.add_argument(
+        "--trace-memory-frames",
+        type=int,
+        default=1,
+        help="tracemalloc가 저장할 호출 스택 깊이 (클수록 오버헤드 증가)",
+    )
+    monitor_parser.add_argument(
+        "--trace-memory-threshold",
+        type=float,
+        default=50.0,
+        help="경고할 메모리 증가량(MB)",
+    )
+
+    stats_parser = subparsers.add_parser("stats", help="모니터 계측 통계 요약 (p50/p95/p99)")
+    stats_parser.add_argument("--path", type=Path, help="통계 파일 경로")
+
+    bench_parser = subparsers.add_parser("bench", help="KIS 구간별 응답 시간 진단")
+    bench_parser.add_argument("--fake", action="store_true", help="내장 가짜 KIS 서버를 상대로 측정")
+    bench_parser.add_argument("--runs", type=int, default=5, help="엔드포인트별 반복 횟수")
+    bench_parser.add_argument("--latency", type=float, default=20.0, help="가짜 서버 응답 지연(ms)")
+    bench_parser.add_argument("--error-rate", type=float, default=0.0, help="가짜 서버 오류 비율 (0~1)")
+    bench_parser.add_argument("--throttle-rate", type=float, default=0.0, help="가짜 서버 호출 제한 비율 (0~1)")
 
     return parser
 
 
-def _run_add(storage: JsonWatchlistStorage, query: str | None) -> None:
+def _run_add(storage: WatchlistStorage, query: str | None) -> None:
     catalog = StockCatalog.from_default_files()
     if query is None:
         query = input("검색어 입력: ").strip()
@@ -86,7 +229,7 @@ def _run_add(storage: JsonWatchlistStorage, query: str | None) -> None:
     print(f"추가됨: {item.symbol} {item.name}")
 
 
-def _run_remove(storage: JsonWatchlistStorage, query: str | None) -> None:
+def _run_remove(storage: WatchlistStorage, query: str | None) -> None:
     items = storage.list_items()
     if not items:
         print("저장된 관심 종목이 없습니다.")
@@ -109,25 +252,301 @@ def _run_remove(storage: JsonWatchlistStorage, query: str | None) -> None:
     print(f"삭제됨: {removed.symbol} {removed.name}")
 
 
-async def _run_monitor(storage: JsonWatchlistStorage, interval: float) -> None:
+def _run_import(storage: WatchlistStorage, path: Path) -> None:
+    try:
+        rows = read_rows(path)
+    except (OSError, UnicodeDecodeError) as exc:
+        print(f"파일을 읽을 수 없습니다: {path}")
+        raise SystemExit(1) from exc
+
+    result = resolve_rows(StockCatalog.from_default_files(), rows)
+    added = storage.add_many(result.items)
+
+    for issue in result.ambiguous:
+        candidates = ", ".join(
+            f"{entry.symbol} {entry.name}" for entry in issue.candidates[:IMPORT_CANDIDATE_LIMIT]
+        )
+        print(f"{issue.row.line}행 '{issue.row.query}': 후보가 여러 개입니다 ({candidates})")
+    for issue in result.missing:
+        print(f"{issue.row.line}행 '{issue.row.query}': 종목을 찾을 수 없습니다.")
+
+    print(
+        f"추가됨 {added}건, 이미 저장됨 {len(result.items) - added + result.duplicates}건, "
+        f"모호함 {len(result.ambiguous)}건, 찾을 수 없음 {len(result.missing)}건"
+    )
+
+
+def _run_export(storage: WatchlistStorage, output: Path | None) -> None:
+    items = storage.list_items()
+    if output is None:
+        export_items(items, sys.stdout)
+        return
+    with output.open("w", encoding="utf-8", newline="") as handle:
+        export_items(items, handle)
+    print(f"내보냄: {len(items)}건 -> {output}")
+
+
+async def _run_monitor(
+    storage: WatchlistStorage,
+    interval: float,
+    stats: bool = False,
+    background_batch: int = DEFAULT_BACKGROUND_BATCH,
+    alerts: AlertEngine | None = None,
+    watchdog: MemoryWatchdog | None = None,
+) -> None:
+    import asyncio
+
+    from watcher_cli.keys import KeyReader
+    from watcher_cli.quotes import QuoteService
+
     service: QuoteService | None = None
-    renderer = ScreenRenderer()
+    metrics = MonitorMetrics()
+    recorder = StatsRecorder() if stats else None
+    renderer = ScreenRenderer(background=True)
+    interactive = KeyReader.is_supported() and renderer.is_tty
+    view = MonitorView()
+    scheduler = FetchScheduler(background_batch)
+    wake = asyncio.Event() if interactive else None
+    stop_requested = False
+    loop = asyncio.get_running_loop()
+    navigation_timer: asyncio.TimerHandle | None = None
+    navigation_task: asyncio.Task | None = None
+    reserved_lines = 2 * sum(1 for footer in (stats, alerts, watchdog) if footer)
+
+    def redraw() -> None:
+        if renderer.is_tty:
+            view.viewport.height = terminal_viewport_height(reserved_lines)
+        started = time.perf_counter()
+        text, highlights = view.render()
+        if alerts is not None:
+            text = f"{text}\n\n최근 알림: {alerts.notifier.last_message or '-'}"
+        if watchdog is not None:
+            text = f"{text}\n\n{watchdog.footer()}"
+        if stats:
+            text = f"{text}\n\n{metrics.footer()}"
+        renderer.render(text, highlights)
+        metrics.record_render((time.perf_counter() - started) * 1000)
+
+    def quote_service() -> QuoteService:
+        nonlocal service
+        if service is None:
+            service = QuoteService(metrics=metrics)
+        return service
+
+    async def fetch(items: list[WatchItem], new_cycle: bool = True) -> None:
+        quotes = await quote_service().fetch_many(items)
+        view.update(quotes, new_cycle=new_cycle)
+        if alerts is not None:
+            alerts.evaluate(quotes)
+
+    async def fetch_newly_visible() -> None:
+        items = view.unfetched_visible_items()
+        if items:
+            await fetch(items, new_cycle=False)
+            redraw()
+
+    def start_navigation_fetch() -> None:
+        nonlocal navigation_timer, navigation_task
+        navigation_timer = None
+        if navigation_task is not None and not navigation_task.done():
+            schedule_navigation_fetch()
+            return
+        navigation_task = asyncio.create_task(fetch_newly_visible())
+
+    def schedule_navigation_fetch() -> None:
+        # 키를 누르고 있거나 필터를 입력하는 동안은 조회하지 않고 멈춘 뒤 한 번만 조회한다.
+        nonlocal navigation_timer
+        if navigation_timer is not None:
+            navigation_timer.cancel()
+        navigation_timer = loop.call_later(NAVIGATION_FETCH_DELAY_SEC, start_navigation_fetch)
+
+    def on_key(key: str) -> None:
+        nonlocal stop_requested
+        if key == "q" and not view.editing_filter:
+            stop_requested = True
+            wake.set()
+        elif view.handle_key(key):
+            # 이미 받은 시세로 다시 그리고, 새로 보이는 미조회 종목만 나중에 조회한다.
+            redraw()
+            schedule_navigation_fetch()
+
+    keys = KeyReader(on_key) if interactive else None
+    if watchdog is not None:
+        watchdog.start()
     renderer.start()
+    if keys is not None:
+        keys.start()
+    next_cycle_at: float | None = None
+    try:
+        while not stop_requested:
+            cycle_started = time.perf_counter()
+            if next_cycle_at is not None:
+                metrics.record_drift((cycle_started - next_cycle_at) * 1000)
+            metrics.begin_cycle()
+
+            view.set_items(storage.list_items())
+            if renderer.is_tty:
+                view.viewport.height = terminal_viewport_height(reserved_lines)
+            visible, background = scheduler.plan(view.items, view.visible_items())
+            if visible:
+                await fetch(visible)
+            redraw()
+            if background:
+                # 화면 밖 종목은 화면을 먼저 그린 뒤 별도 호출로 조회한다.
+                await fetch(background, new_cycle=False)
+                redraw()
+            metrics.end_cycle((time.perf_counter() - cycle_started) * 1000)
+            if recorder is not None:
+                recorder.tick(metrics)
+            if watchdog is not None:
+                watchdog.maybe_sample()
+
+            next_cycle_at = time.perf_counter() + interval
+            await _wait_next_cycle(interval, wake)
+    finally:
+        if keys is not None:
+            keys.stop()
+        if navigation_timer is not None:
+            navigation_timer.cancel()
+        if navigation_task is not None and not navigation_task.done():
+            navigation_task.cancel()
+            try:
+                await navigation_task
+            except asyncio.CancelledError:
+                pass
+        renderer.stop()
+        if recorder is not None:
+            recorder.flush(metrics)
+        if watchdog is not None:
+            watchdog.stop()
+        if service is not None:
+            await service.close()
+
+
+async def _run_stream(
+    storage: WatchlistStorage,
+    interval: float,
+    output_format: str,
+    output: str | None = None,
+    once: bool = False,
+    alerts: AlertEngine | None = None,
+    watchdog: MemoryWatchdog | None = None,
+) -> None:
+    import asyncio
+
+    from watcher_cli.quotes import QuoteService
+
+    if output in (None, "-"):
+        handle = sys.stdout
+        header = True
+    else:
+        path = Path(output)
+        header = not path.exists() or path.stat().st_size == 0
+        handle = path.open("a", encoding="utf-8", newline="")
+    writer = QuoteStreamWriter(handle, output_format, header=header)
+    service: QuoteService | None = None
+    writer.start()
+    if watchdog is not None:
+        watchdog.start()
     try:
         while True:
             items = storage.list_items()
-            if not items:
-                quotes = []
-            else:
+            if items:
                 if service is None:
                     service = QuoteService()
                 quotes = await service.fetch_many(items)
-            renderer.render(render_monitor(quotes))
+                writer.publish(quotes)
+                if alerts is not None:
+                    alerts.evaluate(quotes)
+            if once or writer.broken:
+                return
+            if watchdog is not None:
+                watchdog.maybe_sample()
             await asyncio.sleep(interval)
     finally:
-        renderer.stop()
+        writer.stop()
+        if watchdog is not None:
+            watchdog.stop()
+            if watchdog.warning:
+                print(watchdog.warning, file=sys.stderr)
+        if handle is not sys.stdout:
+            handle.close()
         if service is not None:
             await service.close()
+        if writer.dropped:
+            print(f"출력이 밀려 {writer.dropped}건을 버렸습니다.", file=sys.stderr)
+
+
+async def _run_bench(storage: WatchlistStorage, args: argparse.Namespace) -> None:
+    from watcher_cli.config import KISConfig, load_config
+    from watcher_cli.fakekis import FakeKISServer
+    from watcher_cli.netbench import format_report, run_diagnostic, temporary_token_cache
+
+    runs = max(1, args.runs)
+    items = storage.list_items()
+    if not args.fake:
+        report = await run_diagnostic(load_config(), items, runs=runs)
+        print(format_report(report))
+        return
+
+    server = FakeKISServer(
+        latency_sec=args.latency / 1000,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+    )
+    async with server:
+        config = KISConfig(
+            app_key="fake",
+            app_secret="fake",
+            retry_backoff_sec=0.05,
+            base_url_override=server.base_url,
+        )
+        with temporary_token_cache() as token_cache_path:
+            report = await run_diagnostic(config, items, runs=runs, token_cache_path=token_cache_path)
+    print(format_report(report))
+    stats = server.stats
+    print(
+        f"가짜 서버: 요청 {stats.requests}건, 토큰 {stats.tokens}건, "
+        f"호출 제한 {stats.throttled}건, 오류 {stats.errors}건"
+    )
+
+
+def _build_alert_engine(path: Path | None, notify: str, stream) -> AlertEngine | None:
+    rules = load_rules(path)
+    if not rules:
+        if path is not None:
+            raise ValueError(f"알림 규칙이 없습니다: {path}")
+        return None
+    return AlertEngine(rules, notifier=AlertNotifier(notify, stream=stream), log_path=default_log_path())
+
+
+def _build_memory_watchdog(args: argparse.Namespace) -> MemoryWatchdog:
+    from watcher_cli.memwatch import MemoryWatchdog
+
+    return MemoryWatchdog(
+        interval_sec=args.trace_memory_interval,
+        frames=args.trace_memory_frames,
+        threshold_mb=args.trace_memory_threshold,
+    )
+
+
+def _run_async(runner) -> None:
+    import asyncio
+
+    asyncio.run(runner)
+
+
+async def _wait_next_cycle(interval: float, wake: asyncio.Event | None) -> None:
+    import asyncio
+
+    if wake is None:
+        await asyncio.sleep(interval)
+        return
+    try:
+        await asyncio.wait_for(wake.wait(), timeout=interval)
+    except TimeoutError:
+        pass
+    wake.clear()
 
 
 def _choose_catalog_entry(matches: list[CatalogEntry]) -> CatalogEntry | None:
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+import json
+from pathlib import Path
+import platform
+import statistics
+import tempfile
+import time
+
+import httpx
+
+from watcher_cli.catalog import StockCatalog
+from watcher_cli.config import KISConfig
+from watcher_cli.kis import KISClient, TokenInfo
+from watcher_cli.models import QuoteSnapshot, WatchItem
+from watcher_cli.quotes import QuoteService
+from watcher_cli.storage import JsonWatchlistStorage, SqliteWatchlistStorage
+from watcher_cli.terminal import _render_table, render_monitor
+
+BASELINE_VERSION = 1
+DEFAULT_THRESHOLD = 0.2
+RENDER_SIZES = (10, 100, 1000)
+STORAGE_SIZES = (100, 1000, 5000)
+FETCH_SIZES = (10, 100)
+FETCH_LATENCY_SEC = 0.005
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    name: str
+    runs: int
+    median_ms: float
+    mean_ms: float
+    min_ms: float
+    max_ms: float
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline_ms: float
+    current_ms: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ms / self.baseline_ms
+
+
+def measure(name: str, func: Callable[[], object], runs: int) -> BenchResult:
+    samples: list[float] = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return BenchResult(
+        name=name,
+        runs=runs,
+        median_ms=statistics.median(samples),
+        mean_ms=statistics.fmean(samples),
+        min_ms=min(samples),
+        max_ms=max(samples),
+    )
+
+
+def measure_async(name: str, factory: Callable[[], Awaitable[object]], runs: int) -> BenchResult:
+    return measure(name, lambda: asyncio.run(factory()), runs)
+
+
+def run_benchmarks(runs: int = 5) -> list[BenchResult]:
+    results: list[BenchResult] = []
+    results.append(measure("catalog.from_default_files", StockCatalog.from_default_files, max(1, runs // 2)))
+
+    catalog = StockCatalog.from_default_files()
+    for label, query in (("exact", "005930"), ("partial", "삼성"), ("miss", "zzzz-no-such-stock")):
+        results.append(measure(f"catalog.search.{label}", lambda query=query: catalog.search(query), runs))
+
+    for size in RENDER_SIZES:
+        quotes = _sample_quotes(size)
+        rows = [[quote.symbol, quote.name, quote.best_price or "-"] for quote in quotes]
+        results.append(measure(f"terminal.render_monitor.{size}", lambda quotes=quotes: render_monitor(quotes), runs))
+        results.append(
+            measure(
+                f"terminal.render_table.{size}",
+                lambda rows=rows: _render_table(["코드", "이름", "최적가"], rows),
+                runs,
+            )
+        )
+
+    extra = WatchItem(symbol="BENCH", name="Bench Item", market="US", exchange="NAS")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in STORAGE_SIZES:
+            storage = JsonWatchlistStorage(Path(tmp_dir) / f"watchlist-{size}.json")
+            _seed_storage(storage, size)
+            results.append(measure(f"storage.list_items.{size}", storage.list_items, runs))
+            results.append(
+                measure(
+                    f"storage.add_remove.{size}",
+                    lambda storage=storage: (storage.add(extra), storage.remove(extra.symbol)),
+                    runs,
+                )
+            )
+
+            sqlite_storage = SqliteWatchlistStorage(Path(tmp_dir) / f"watchlist-{size}.db")
+            results.append(
+                measure(
+                    f"storage.sqlite.add_many.{size}",
+                    lambda sqlite_storage=sqlite_storage, size=size: (
+                        sqlite_storage.add_many(_sample_items(size)),
+                        sqlite_storage.remove_many(item.symbol for item in _sample_items(size)),
+                    ),
+                    max(1, runs // 2),
+                )
+            )
+            sqlite_storage.add_many(_sample_items(size))
+            results.append(measure(f"storage.sqlite.list_items.{size}", sqlite_storage.list_items, runs))
+            results.append(
+                measure(
+                    f"storage.sqlite.add_remove.{size}",
+                    lambda sqlite_storage=sqlite_storage: (
+                        sqlite_storage.add(extra),
+                        sqlite_storage.remove(extra.symbol),
+                    ),
+                    runs,
+                )
+            )
+            sqlite_storage.close()
+
+    for size in FETCH_SIZES:
+        items = _sample_items(size)
+        results.append(
+            measure_async(
+                f"quotes.fetch_many.{size}",
+                lambda items=items: _fetch_with_mock_transport(items, FETCH_LATENCY_SEC),
+                runs,
+            )
+        )
+    return results
+
+
+def save_baseline(results: list[BenchResult], path: Path) -> None:
+    payload = {
+        "version": BASELINE_VERSION,
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: Path) -> dict[str, BenchResult]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise ValueError(f"기준 파일을 읽을 수 없습니다: {path}") from exc
+    return {name: BenchResult(**value) for name, value in payload.get("results", {}).items()}
+
+
+def compare(
+    baseline: dict[str, BenchResult],
+    results: list[BenchResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    regressions: list[Regression] = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None or previous.median_ms <= 0:
+            continue
+        if result.median_ms > previous.median_ms * (1 + threshold):
+            regressions.append(
+                Regression(name=result.name, baseline_ms=previous.median_ms, current_ms=result.median_ms)
+            )
+    return regressions
+
+
+def format_results(results: list[BenchResult], baseline: dict[str, BenchResult] | None = None) -> str:
+    lines = []
+    for result in results:
+        line = f"{result.name:<36} median {result.median_ms:9.3f}ms  min {result.min_ms:9.3f}ms"
+        previous = (baseline or {}).get(result.name)
+        if previous is not None and previous.median_ms > 0:
+            delta = (result.median_ms / previous.median_ms - 1) * 100
+            line += f"  ({delta:+.1f}%)"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m watcher_cli.bench", description="watcher-cli 성능 측정")
+    parser.add_argument("--runs", type=int, default=5, help="항목별 반복 횟수")
+    parser.add_argument("--output", type=Path, help="결과를 JSON 기준 파일로 저장")
+    parser.add_argument("--compare", type=Path, help="비교할 JSON 기준 파일")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="성능 저하로 판단할 비율 (0.2 = 20%%)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.compare) if args.compare else None
+    results = run_benchmarks(runs=max(1, args.runs))
+    print(format_results(results, baseline))
+
+    if args.output:
+        save_baseline(results, args.output)
+        print(f"저장됨: {args.output}")
+
+    if baseline is not None:
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print(f"\n성능 저하 {len(regressions)}건 (기준 대비 +{args.threshold * 100:.0f}% 초과):")
+            for regression in regressions:
+                print(
+                    f"  {regression.name}: {regression.baseline_ms:.3f}ms -> "
+                    f"{regression.current_ms:.3f}ms (x{regression.ratio:.2f})"
+                )
+            raise SystemExit(1)
+        print("\n성능 저하 없음")
+
+
+def _sample_items(count: int) -> list[WatchItem]:
+    items: list[WatchItem] = []
+    for index in range(count):
+        if index % 4 == 3:
+            items.append(WatchItem(symbol=f"US{index:04d}", name=f"US Stock {index}", market="US", exchange="NAS"))
+        else:
+            items.append(WatchItem(symbol=f"{index:06d}", name=f"국내종목{index}", market="KR"))
+    return items
+
+
+def _sample_quotes(count: int) -> list[QuoteSnapshot]:
+    return [
+        QuoteSnapshot(
+            symbol=item.symbol,
+            name=item.name,
+            market=item.market,
+            best_price=str(10000 + index),
+            krx_price=str(10000 + index) if item.market == "KR" else None,
+            nxt_price=str(10010 + index) if item.market == "KR" else None,
+            change_rate=f"{(index % 21 - 10) / 10:.2f}",
+        )
+        for index, item in enumerate(_sample_items(count))
+    ]
+
+
+def _seed_storage(storage: JsonWatchlistStorage, count: int) -> None:
+    payload = {
+        "version": 1,
+        "items": [
+            {
+                "symbol": item.symbol,
+                "name": item.name,
+                "market": item.market,
+                "exchange": item.exchange,
+                "aliases": list(item.aliases),
+            }
+            for item in _sample_items(count)
+        ],
+    }
+    storage._write_payload(payload)
+
+
+async def _fetch_with_mock_transport(items: list[WatchItem], latency_sec: float) -> list[QuoteSnapshot]:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency_sec)
+        if "overseas-price" in request.url.path:
+            return httpx.Response(200, json={"rt_cd": "0", "output": {"last": "214.33", "base": "211.95"}})
+        return httpx.Response(
+            200,
+            json={"rt_cd": "0", "output": {"stck_prpr": "72000", "prdy_ctrt": "0.70", "acml_vol": "1500000"}},
+        )
+
+    config = KISConfig(app_key="bench-key", app_secret="bench-secret")
+    http_client = httpx.AsyncClient(base_url=config.base_url, transport=httpx.MockTransport(handler))
+    client = KISClient(config=config, client=http_client)
+    client.token_manager._token_info = TokenInfo(
+        access_token="bench-token",
+        expires_at=datetime.now() + timedelta(days=1),
+    )
+    service = QuoteService(client=client)
+    try:
+        return await service.fetch_many(items)
+    finally:
+        await service.close()
+
+
+if __name__ == "__main__":
+    main()
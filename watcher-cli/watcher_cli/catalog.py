@@ -28,6 +28,7 @@ class StockCatalog:
 
     def __init__(self, entries: list[CatalogEntry]):
         self.entries = entries
+        self._index: dict[str, tuple[CatalogEntry, ...]] | None = None
 
     @classmethod
     def from_default_files(cls) -> StockCatalog:
@@ -85,6 +86,19 @@ class StockCatalog:
         ]
         return partial[:limit]
 
+    def build_index(self) -> dict[str, tuple[CatalogEntry, ...]]:
+        if self._index is None:
+            index: dict[str, list[CatalogEntry]] = {}
+            for entry in self.entries:
+                keys = {entry.symbol.lower(), entry.name.lower(), *(alias.lower() for alias in entry.aliases)}
+                for key in keys:
+                    index.setdefault(key, []).append(entry)
+            self._index = {key: tuple(entries) for key, entries in index.items()}
+        return self._index
+
+    def lookup(self, query: str) -> tuple[CatalogEntry, ...]:
+        return self.build_index().get(query.strip().lower(), ())
+
     @classmethod
     def _parse_line(
         cls,
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 
-from dotenv import load_dotenv
+MAX_CREDENTIALS = 32
+
+
+@dataclass(frozen=True)
+class KISCredential:
+    app_key: str
+    app_secret: str
 
 
 @dataclass(frozen=True)
@@ -15,15 +21,34 @@ class KISConfig:
     timeout_sec: float = 30.0
     max_retries: int = 2
     retry_backoff_sec: float = 0.5
+    rate_limit_per_sec: float = 0.0
+    extra_credentials: tuple[KISCredential, ...] = ()
+    base_url_override: str | None = None
+
+    @property
+    def credentials(self) -> tuple[KISCredential, ...]:
+        return (KISCredential(self.app_key, self.app_secret), *self.extra_credentials)
+
+    def for_credential(self, credential: KISCredential) -> KISConfig:
+        return replace(
+            self,
+            app_key=credential.app_key,
+            app_secret=credential.app_secret,
+            extra_credentials=(),
+        )
 
     @property
     def base_url(self) -> str:
+        if self.base_url_override:
+            return self.base_url_override.rstrip("/")
         if self.is_real:
             return "https://openapi.koreainvestment.com:9443"
         return "https://openapivts.koreainvestment.com:29443"
 
 
 def load_config() -> KISConfig:
+    from dotenv import load_dotenv
+
     for env_path in _env_candidates():
         if env_path.exists():
             load_dotenv(env_path, override=False)
@@ -40,9 +65,34 @@ def load_config() -> KISConfig:
         app_key=app_key,
         app_secret=app_secret,
         is_real=is_real,
+        rate_limit_per_sec=_read_rate_limit(),
+        extra_credentials=_read_extra_credentials(),
+        base_url_override=os.getenv("KIS_BASE_URL") or None,
     )
 
 
+def _read_extra_credentials() -> tuple[KISCredential, ...]:
+    credentials: list[KISCredential] = []
+    for index in range(2, MAX_CREDENTIALS + 1):
+        app_key = os.getenv(f"KIS_APP_KEY_{index}")
+        app_secret = os.getenv(f"KIS_APP_SECRET_{index}")
+        if not app_key and not app_secret:
+            break
+        if not app_key or not app_secret:
+            raise ValueError(f"KIS_APP_KEY_{index}와 KIS_APP_SECRET_{index}를 함께 설정해야 합니다.")
+        credentials.append(KISCredential(app_key, app_secret))
+    return tuple(credentials)
+
+
+def _read_rate_limit() -> float:
+    raw = os.getenv("KIS_RATE_LIMIT_PER_SEC", "0")
+    try:
+        value = float(raw)
+    except ValueError as exc:
+        raise ValueError(f"KIS_RATE_LIMIT_PER_SEC 값이 올바르지 않습니다: {raw}") from exc
+    return max(value, 0.0)
+
+
 def _env_candidates() -> list[Path]:
     project_root = Path(__file__).resolve().parents[1]
     return [
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import json
+import random
+from urllib.parse import parse_qs, urlsplit
+
+from watcher_cli.kis import THROTTLE_MSG_CODE
+
+TOKEN_ENDPOINT = "/oauth2/tokenP"
+DOMESTIC_ENDPOINT = "/uapi/domestic-stock/v1/quotations/inquire-price"
+OVERSEAS_ENDPOINT = "/uapi/overseas-price/v1/quotations/price-detail"
+REASONS = {200: "OK", 404: "Not Found", 429: "Too Many Requests", 500: "Internal Server Error"}
+
+
+@dataclass
+class FakeServerStats:
+    requests: int = 0
+    tokens: int = 0
+    throttled: int = 0
+    errors: int = 0
+
+
+class FakeKISServer:
+    def __init__(
+        self,
+        latency_sec: float = 0.02,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency_sec = latency_sec
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.host = host
+        self.port = port
+        self.stats = FakeServerStats()
+        self._random = random.Random(seed)
+        self._server: asyncio.Server | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self) -> FakeKISServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", "0") or 0)
+                if length:
+                    await reader.readexactly(length)
+
+                status, payload = await self._respond(method, target)
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                        "Content-Type: application/json; charset=utf-8\r\n"
+                        f"Content-Length: {len(body)}\r\n\r\n"
+                    ).encode("latin-1")
+                    + body
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method: str, target: str) -> tuple[int, dict]:
+        self.stats.requests += 1
+        if self.latency_sec > 0:
+            await asyncio.sleep(self.latency_sec)
+
+        url = urlsplit(target)
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        if method == "POST" and url.path == TOKEN_ENDPOINT:
+            self.stats.tokens += 1
+            return 200, {
+                "access_token": "fake-access-token",
+                "token_type": "Bearer",
+                "expires_in": 86400,
+            }
+
+        if url.path not in (DOMESTIC_ENDPOINT, OVERSEAS_ENDPOINT):
+            return 404, {"rt_cd": "1", "msg1": "not found"}
+        roll = self._random.random()
+        if roll < self.throttle_rate:
+            self.stats.throttled += 1
+            return 500, {"rt_cd": "1", "msg_cd": THROTTLE_MSG_CODE, "msg1": "초당 거래건수를 초과하였습니다."}
+        if roll < self.throttle_rate + self.error_rate:
+            self.stats.errors += 1
+            return 500, {"rt_cd": "1", "msg_cd": "EGW00000", "msg1": "fake error"}
+
+        if url.path == DOMESTIC_ENDPOINT:
+            price = self._price(params.get("fid_input_iscd", ""), 70000, 10)
+            return 200, {
+                "rt_cd": "0",
+                "output": {
+                    "stck_prpr": str(int(price)),
+                    "prdy_ctrt": f"{self._random.uniform(-3, 3):.2f}",
+                    "acml_vol": str(self._random.randint(1_000, 5_000_000)),
+                },
+            }
+        price = self._price(params.get("SYMB", ""), 200, 0.01)
+        return 200, {
+            "rt_cd": "0",
+            "output": {
+                "last": f"{price:.2f}",
+                "base": f"{price * 0.99:.2f}",
+                "tvol": str(self._random.randint(1_000, 5_000_000)),
+            },
+        }
+
+    def _price(self, symbol: str, base: float, tick: float) -> float:
+        anchor = base * (0.5 + (sum(symbol.encode()) % 100) / 100)
+        return max(tick, round(anchor * (1 + self._random.uniform(-0.01, 0.01)) / tick) * tick)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from array import array
+from datetime import datetime
+
+from watcher_cli.models import QuoteSnapshot, to_float
+
+DEFAULT_CAPACITY = 720
+DEFAULT_RESOLUTION_SEC = 60
+SPARK_WIDTH = 20
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+SESSION_OFFSETS_SEC = {"US": -12 * 3600}
+
+
+class PriceHistory:
+    __slots__ = (
+        "capacity",
+        "resolution_sec",
+        "timestamps",
+        "prices",
+        "volumes",
+        "start",
+        "size",
+        "high",
+        "low",
+        "session",
+        "session_offset_sec",
+    )
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        resolution_sec: int = DEFAULT_RESOLUTION_SEC,
+        session_offset_sec: int = 0,
+    ):
+        self.capacity = capacity
+        self.resolution_sec = resolution_sec
+        self.session_offset_sec = session_offset_sec
+        self.timestamps = array("q", bytes(8 * capacity))
+        self.prices = array("d", bytes(8 * capacity))
+        self.volumes = array("q", bytes(8 * capacity))
+        self.start = 0
+        self.size = 0
+        self.high: float | None = None
+        self.low: float | None = None
+        self.session: int | None = None
+
+    def append(self, timestamp: int, price: float, volume: int = 0) -> None:
+        session = datetime.fromtimestamp(timestamp + self.session_offset_sec).toordinal()
+        if session != self.session:
+            self.reset()
+            self.session = session
+
+        last = (self.start + self.size - 1) % self.capacity
+        if self.size and self.timestamps[last] // self.resolution_sec == timestamp // self.resolution_sec:
+            slot = last
+        elif self.size < self.capacity:
+            slot = (self.start + self.size) % self.capacity
+            self.size += 1
+        else:
+            slot = self.start
+            self.start = (self.start + 1) % self.capacity
+        self.timestamps[slot] = timestamp
+        self.prices[slot] = price
+        self.volumes[slot] = volume
+
+        if self.high is None or price > self.high:
+            self.high = price
+        if self.low is None or price < self.low:
+            self.low = price
+
+    def reset(self) -> None:
+        self.start = 0
+        self.size = 0
+        self.high = None
+        self.low = None
+
+    def values(self) -> list[float]:
+        return [self.prices[(self.start + index) % self.capacity] for index in range(self.size)]
+
+    def sparkline(self, width: int = SPARK_WIDTH) -> str:
+        if self.size == 0:
+            return ""
+        if self.size <= width:
+            points = self.values()
+        else:
+            points = [
+                self.prices[(self.start + (index + 1) * self.size // width - 1) % self.capacity]
+                for index in range(width)
+            ]
+        low = min(points)
+        span = max(points) - low
+        if span == 0:
+            return SPARK_CHARS[0] * len(points)
+        top = len(SPARK_CHARS) - 1
+        return "".join(SPARK_CHARS[round((point - low) / span * top)] for point in points)
+
+
+class HistoryStore:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, resolution_sec: int = DEFAULT_RESOLUTION_SEC):
+        self.capacity = capacity
+        self.resolution_sec = resolution_sec
+        self.histories: dict[str, PriceHistory] = {}
+
+    def record(self, quotes: list[QuoteSnapshot], timestamp: int | None = None) -> None:
+        timestamp = int(datetime.now().timestamp()) if timestamp is None else timestamp
+        for quote in quotes:
+            price = to_float(quote.best_price)
+            if price is None:
+                continue
+            history = self.histories.get(quote.symbol)
+            if history is None:
+                history = self.histories[quote.symbol] = PriceHistory(
+                    self.capacity,
+                    self.resolution_sec,
+                    SESSION_OFFSETS_SEC.get(quote.market, 0),
+                )
+            history.append(timestamp, price, quote.volume or 0)
+
+    def retain(self, symbols: set[str]) -> None:
+        for symbol in [symbol for symbol in self.histories if symbol not in symbols]:
+            del self.histories[symbol]
+
+    def get(self, symbol: str) -> PriceHistory | None:
+        return self.histories.get(symbol)
+
+
+def format_price(value: float | None) -> str:
+    if value is None:
+        return "-"
+    if value.is_integer():
+        return str(int(value))
+    return f"{value:f}".rstrip("0").rstrip(".")
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+import io
+from pathlib import Path
+from typing import TextIO
+
+from watcher_cli.catalog import StockCatalog
+from watcher_cli.models import CatalogEntry, WatchItem
+
+QUERY_COLUMNS = ("symbol", "code", "ticker", "종목코드", "코드", "name", "종목명", "이름")
+MARKET_COLUMNS = ("market", "시장")
+EXPORT_COLUMNS = ("symbol", "name", "market", "exchange", "aliases")
+ALIAS_SEPARATOR = "|"
+KR_CODE_LENGTH = 6
+
+
+@dataclass(frozen=True)
+class ImportRow:
+    line: int
+    query: str
+    market: str | None = None
+
+
+@dataclass(frozen=True)
+class ImportIssue:
+    row: ImportRow
+    candidates: tuple[CatalogEntry, ...] = ()
+
+
+@dataclass
+class ImportResult:
+    items: list[WatchItem] = field(default_factory=list)
+    duplicates: int = 0
+    ambiguous: list[ImportIssue] = field(default_factory=list)
+    missing: list[ImportIssue] = field(default_factory=list)
+
+
+def read_rows(path: Path) -> list[ImportRow]:
+    text = path.read_text(encoding="utf-8-sig")
+    if path.suffix.lower() == ".csv" or "," in text.split("\n", 1)[0]:
+        return _read_csv_rows(text)
+    rows = []
+    for line, raw in enumerate(text.splitlines(), start=1):
+        query = raw.strip()
+        if query and not query.startswith("#"):
+            rows.append(ImportRow(line=line, query=query))
+    return rows
+
+
+def resolve_rows(catalog: StockCatalog, rows: list[ImportRow]) -> ImportResult:
+    result = ImportResult()
+    seen: set[str] = set()
+    for row in rows:
+        key = row.query.lower()
+        candidates = catalog.lookup(key)
+        if not candidates and key.isdigit() and len(key) < KR_CODE_LENGTH:
+            candidates = catalog.lookup(key.zfill(KR_CODE_LENGTH))
+        if row.market:
+            candidates = tuple(entry for entry in candidates if entry.market == row.market.upper())
+        if len(candidates) > 1:
+            by_symbol = tuple(entry for entry in candidates if entry.symbol.lower() == key)
+            if len(by_symbol) == 1:
+                candidates = by_symbol
+
+        if not candidates:
+            result.missing.append(ImportIssue(row=row))
+            continue
+        if len(candidates) > 1:
+            result.ambiguous.append(ImportIssue(row=row, candidates=candidates))
+            continue
+
+        entry = candidates[0]
+        if entry.symbol in seen:
+            result.duplicates += 1
+            continue
+        seen.add(entry.symbol)
+        result.items.append(
+            WatchItem(
+                symbol=entry.symbol,
+                name=entry.name,
+                market=entry.market,
+                exchange=entry.exchange,
+                aliases=entry.aliases,
+            )
+        )
+    return result
+
+
+def export_items(items: list[WatchItem], stream: TextIO) -> None:
+    writer = csv.writer(stream, lineterminator="\n")
+    writer.writerow(EXPORT_COLUMNS)
+    for item in items:
+        writer.writerow(
+            [item.symbol, item.name, item.market, item.exchange or "", ALIAS_SEPARATOR.join(item.aliases)]
+        )
+
+
+def _read_csv_rows(text: str) -> list[ImportRow]:
+    records = list(csv.reader(io.StringIO(text)))
+    if not records:
+        return []
+
+    header = [column.strip().lower() for column in records[0]]
+    query_column = next((header.index(name) for name in QUERY_COLUMNS if name in header), None)
+    market_column = next((header.index(name) for name in MARKET_COLUMNS if name in header), None)
+    start = 1
+    if query_column is None:
+        query_column = 0
+        start = 0
+
+    rows = []
+    for line, record in enumerate(records[start:], start=start + 1):
+        if len(record) <= query_column:
+            continue
+        query = record[query_column].strip()
+        if not query or query.startswith("#"):
+            continue
+        market = None
+        if market_column is not None and len(record) > market_column:
+            market = record[market_column].strip() or None
+        rows.append(ImportRow(line=line, query=query, market=market))
+    return rows
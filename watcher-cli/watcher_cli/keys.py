@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import os
+import sys
+from typing import TextIO
+
+try:
+    import termios
+    import tty
+except ImportError:  # pragma: no cover - Windows
+    termios = None
+    tty = None
+
+ESCAPE_SEQUENCES = {
+    "\033[A": "up",
+    "\033[B": "down",
+    "\033[C": "right",
+    "\033[D": "left",
+    "\033[5~": "pageup",
+    "\033[6~": "pagedown",
+    "\033[H": "home",
+    "\033[F": "end",
+    "\033[1~": "home",
+    "\033[4~": "end",
+    "\033OA": "up",
+    "\033OB": "down",
+    "\033OH": "home",
+    "\033OF": "end",
+}
+CONTROL_KEYS = {
+    "\r": "enter",
+    "\n": "enter",
+    "\x7f": "backspace",
+    "\x08": "backspace",
+    "\t": "tab",
+}
+
+
+def parse_keys(data: str) -> list[str]:
+    keys: list[str] = []
+    index = 0
+    while index < len(data):
+        if data[index] == "\033":
+            for sequence, name in ESCAPE_SEQUENCES.items():
+                if data.startswith(sequence, index):
+                    keys.append(name)
+                    index += len(sequence)
+                    break
+            else:
+                keys.append("escape")
+                index += 1
+            continue
+        char = data[index]
+        keys.append(CONTROL_KEYS.get(char, char))
+        index += 1
+    return keys
+
+
+class KeyReader:
+    def __init__(self, on_key: Callable[[str], None], stream: TextIO | None = None):
+        self.on_key = on_key
+        self.stream = stream or sys.stdin
+        self._fd: int | None = None
+        self._saved_attrs: list | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @staticmethod
+    def is_supported(stream: TextIO | None = None) -> bool:
+        stream = stream or sys.stdin
+        return termios is not None and bool(getattr(stream, "isatty", lambda: False)())
+
+    def start(self) -> None:
+        if self._fd is not None:
+            return
+        fd = self.stream.fileno()
+        self._saved_attrs = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(fd, self._on_readable)
+        self._fd = fd
+
+    def stop(self) -> None:
+        if self._fd is None:
+            return
+        if self._loop is not None:
+            self._loop.remove_reader(self._fd)
+        if self._saved_attrs is not None:
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved_attrs)
+        self._fd = None
+        self._saved_attrs = None
+        self._loop = None
+
+    def _on_readable(self) -> None:
+        try:
+            data = os.read(self._fd, 64)
+        except OSError:
+            return
+        for key in parse_keys(data.decode("utf-8", errors="ignore")):
+            self.on_key(key)
@@ -1,29 +1,78 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_right
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+import hashlib
 import json
 from pathlib import Path
+import time
 from typing import Any
 
 import httpx
 
 from watcher_cli.config import KISConfig, load_config
+from watcher_cli.metrics import MonitorMetrics
 
 RETRY_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+THROTTLE_MSG_CODE = "EGW00201"
+SHARD_VIRTUAL_NODES = 64
+THROTTLE_COOLDOWN_SEC = 1.0
+TOKEN_FAILURE_COOLDOWN_SEC = 60.0
 
 
 class APIError(Exception):
-    def __init__(self, message: str, response: dict[str, Any] | None = None):
+    def __init__(
+        self,
+        message: str,
+        response: dict[str, Any] | None = None,
+        status_code: int | None = None,
+    ):
         super().__init__(message)
         self.response = response
+        self.status_code = status_code
+
+
+class TokenError(APIError):
+    pass
 
 
 def is_retryable_request_error(exc: httpx.RequestError) -> bool:
     return not isinstance(exc, (httpx.ReadTimeout, httpx.WriteTimeout))
 
 
+def default_token_cache_path(app_key: str | None = None) -> Path:
+    directory = Path.home() / ".config" / "trade-watcher"
+    if app_key is None:
+        return directory / "kis_token.json"
+    return directory / f"kis_token-{hashlib.sha256(app_key.encode()).hexdigest()[:12]}.json"
+
+
+def is_throttle_error(exc: Exception) -> bool:
+    if not isinstance(exc, APIError):
+        return False
+    if exc.status_code == 429:
+        return True
+    return exc.response is not None and exc.response.get("msg_cd") == THROTTLE_MSG_CODE
+
+
+class RateLimiter:
+    def __init__(self, rate_per_sec: float = 0.0):
+        self.rate_per_sec = rate_per_sec
+        self._next_at = 0.0
+
+    async def acquire(self) -> None:
+        if self.rate_per_sec <= 0:
+            return
+        now = time.monotonic()
+        scheduled = max(now, self._next_at)
+        self._next_at = scheduled + 1 / self.rate_per_sec
+        if scheduled > now:
+            await asyncio.sleep(scheduled - now)
+
+
 @dataclass
 class TokenInfo:
     access_token: str
@@ -37,23 +86,35 @@ class TokenInfo:
 class TokenManager:
     TOKEN_ENDPOINT = "/oauth2/tokenP"
 
-    def __init__(self, config: KISConfig, cache_path: Path | None = None):
+    def __init__(
+        self,
+        config: KISConfig,
+        cache_path: Path | None = None,
+        metrics: MonitorMetrics | None = None,
+    ):
         self.config = config
+        self.metrics = metrics or MonitorMetrics()
         self._token_info: TokenInfo | None = None
         self._lock = asyncio.Lock()
-        self.cache_path = cache_path or (
-            Path.home() / ".config" / "trade-watcher" / "kis_token.json"
-        )
+        self.cache_path = cache_path or default_token_cache_path()
 
     async def get_token(self) -> str:
         async with self._lock:
             if self._token_info is None:
                 self._token_info = self._load_token()
             if self._token_info is None or self._token_info.is_expired:
+                started = time.perf_counter()
                 self._token_info = await self._fetch_token()
+                self.metrics.record_token_refresh((time.perf_counter() - started) * 1000)
                 self._save_token(self._token_info)
             return self._token_info.access_token
 
+    def cached_token(self) -> TokenInfo | None:
+        token_info = self._token_info or self._load_token()
+        if token_info is None or token_info.is_expired:
+            return None
+        return token_info
+
     async def _fetch_token(self) -> TokenInfo:
         url = f"{self.config.base_url}{self.TOKEN_ENDPOINT}"
         data = {
@@ -71,17 +132,20 @@ class TokenManager:
                     payload = response.json()
                 break
             except httpx.RequestError as exc:
+                if isinstance(exc, httpx.TimeoutException):
+                    self.metrics.record_timeout()
                 if attempt >= self.config.max_retries or not is_retryable_request_error(exc):
-                    raise APIError(f"토큰 발급 요청 실패: {exc}") from exc
+                    raise TokenError(f"토큰 발급 요청 실패: {exc}") from exc
             except httpx.HTTPStatusError as exc:
                 if attempt >= self.config.max_retries or exc.response.status_code not in RETRY_STATUS_CODES:
-                    raise APIError(f"토큰 발급 실패: {exc.response.status_code}") from exc
+                    raise TokenError(f"토큰 발급 실패: {exc.response.status_code}") from exc
+            self.metrics.record_retry()
             await asyncio.sleep(self.config.retry_backoff_sec * (2**attempt))
             attempt += 1
 
         token = payload.get("access_token")
         if not token:
-            raise APIError("토큰 발급 실패", response=payload)
+            raise TokenError("토큰 발급 실패", response=payload)
 
         expired_str = payload.get("access_token_token_expired")
         if expired_str:
@@ -127,16 +191,29 @@ class TokenManager:
 
 
 class KISClient:
-    def __init__(self, config: KISConfig | None = None, client: httpx.AsyncClient | None = None):
+    def __init__(
+        self,
+        config: KISConfig | None = None,
+        client: httpx.AsyncClient | None = None,
+        metrics: MonitorMetrics | None = None,
+        token_cache_path: Path | None = None,
+        owns_client: bool = True,
+        retry_throttled: bool = True,
+    ):
         self.config = config or load_config()
-        self.token_manager = TokenManager(self.config)
+        self.metrics = metrics or MonitorMetrics()
+        self.token_manager = TokenManager(self.config, cache_path=token_cache_path, metrics=self.metrics)
+        self.rate_limiter = RateLimiter(self.config.rate_limit_per_sec)
+        self.retry_throttled = retry_throttled
+        self._owns_client = owns_client
         self._client = client or httpx.AsyncClient(
             base_url=self.config.base_url,
             timeout=self.config.timeout_sec,
         )
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self) -> KISClient:
         return self
@@ -178,15 +255,42 @@ class KISClient:
         if extra_headers:
             headers.update(extra_headers)
 
-        response = await self._client.get(endpoint, headers=headers, params=params)
-        try:
-            payload = response.json()
-        except ValueError:
-            payload = {"raw_response": response.text}
-
-        if not response.is_success:
-            raise APIError(f"API 요청 실패: {response.status_code}", response=payload)
-        return payload
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            started = time.perf_counter()
+            try:
+                response = await self._client.get(endpoint, headers=headers, params=params)
+            except httpx.RequestError as exc:
+                if isinstance(exc, httpx.TimeoutException):
+                    self.metrics.record_timeout()
+                if attempt >= self.config.max_retries or not is_retryable_request_error(exc):
+                    raise
+            else:
+                self.metrics.record_request(tr_id, (time.perf_counter() - started) * 1000)
+                try:
+                    payload = response.json()
+                except ValueError:
+                    payload = {"raw_response": response.text}
+
+                throttled = response.status_code == 429 or payload.get("msg_cd") == THROTTLE_MSG_CODE
+                if throttled:
+                    self.metrics.record_throttle()
+                if response.is_success:
+                    return payload
+                if (
+                    attempt >= self.config.max_retries
+                    or response.status_code not in RETRY_STATUS_CODES
+                    or (throttled and not self.retry_throttled)
+                ):
+                    raise APIError(
+                        f"API 요청 실패: {response.status_code}",
+                        response=payload,
+                        status_code=response.status_code,
+                    )
+            self.metrics.record_retry()
+            await asyncio.sleep(self.config.retry_backoff_sec * (2**attempt))
+            attempt += 1
 
     async def _build_headers(self, tr_id: str) -> dict[str, str]:
         token = await self.token_manager.get_token()
@@ -197,3 +301,97 @@ class KISClient:
             "tr_id": tr_id,
             "content-type": "application/json; charset=utf-8",
         }
+
+
+class ShardedKISClient:
+    def __init__(
+        self,
+        clients: list[KISClient],
+        virtual_nodes: int = SHARD_VIRTUAL_NODES,
+        clock: Callable[[], float] | None = None,
+    ):
+        if not clients:
+            raise ValueError("KIS 클라이언트가 하나 이상 필요합니다.")
+        self.clients = clients
+        self.clock = clock or time.monotonic
+        self._unavailable_until = [0.0] * len(clients)
+        ring = sorted(
+            (_ring_hash(f"{client.config.app_key}#{node}"), index)
+            for index, client in enumerate(clients)
+            for node in range(virtual_nodes)
+        )
+        self._ring_hashes = [value for value, _ in ring]
+        self._ring_owners = [index for _, index in ring]
+
+    @classmethod
+    def from_config(cls, config: KISConfig, metrics: MonitorMetrics | None = None) -> ShardedKISClient:
+        metrics = metrics or MonitorMetrics()
+        http_client = httpx.AsyncClient(base_url=config.base_url, timeout=config.timeout_sec)
+        clients = [
+            KISClient(
+                config=config.for_credential(credential),
+                client=http_client,
+                metrics=metrics,
+                token_cache_path=default_token_cache_path(None if index == 0 else credential.app_key),
+                owns_client=index == 0,
+                retry_throttled=False,
+            )
+            for index, credential in enumerate(config.credentials)
+        ]
+        return cls(clients)
+
+    async def close(self) -> None:
+        for client in self.clients:
+            await client.close()
+
+    async def get_current_price(self, stock_code: str, market: str = "J") -> dict[str, Any]:
+        return await self._call(stock_code, lambda client: client.get_current_price(stock_code, market=market))
+
+    async def get_overseas_price(self, exchange: str, symbol: str) -> dict[str, Any]:
+        return await self._call(symbol, lambda client: client.get_overseas_price(exchange, symbol))
+
+    def shard_for(self, key: str) -> int:
+        now = self.clock()
+        start = bisect_right(self._ring_hashes, _ring_hash(key)) % len(self._ring_hashes)
+        first_owner = self._ring_owners[start]
+        for offset in range(len(self._ring_owners)):
+            owner = self._ring_owners[(start + offset) % len(self._ring_owners)]
+            if self._unavailable_until[owner] <= now:
+                return owner
+        return first_owner
+
+    async def _call(
+        self,
+        key: str,
+        request: Callable[[KISClient], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        attempts = 0
+        while True:
+            index = self.shard_for(key)
+            try:
+                return await request(self.clients[index])
+            except APIError as exc:
+                if is_throttle_error(exc):
+                    cooldown = THROTTLE_COOLDOWN_SEC
+                elif isinstance(exc, TokenError):
+                    cooldown = TOKEN_FAILURE_COOLDOWN_SEC
+                else:
+                    raise
+                self._unavailable_until[index] = self.clock() + cooldown
+                attempts += 1
+                if attempts >= len(self.clients):
+                    raise
+
+
+def create_kis_client(
+    config: KISConfig | None = None,
+    metrics: MonitorMetrics | None = None,
+) -> KISClient | ShardedKISClient:
+    config = config or load_config()
+    if not config.extra_credentials:
+        return KISClient(config=config, metrics=metrics)
+    return ShardedKISClient.from_config(config, metrics=metrics)
+
+
+def _ring_hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
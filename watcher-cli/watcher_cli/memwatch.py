@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+import os
+from pathlib import Path
+import time
+import tracemalloc
+
+DEFAULT_INTERVAL_SEC = 300.0
+DEFAULT_FRAMES = 1
+DEFAULT_THRESHOLD_MB = 50.0
+DEFAULT_TOP = 10
+IGNORED_FILES = ("<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>", "<unknown>")
+MB = 1024 * 1024
+
+
+def default_log_path() -> Path:
+    return Path.home() / ".config" / "trade-watcher" / "memory.log"
+
+
+def read_rss_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+class MemoryWatchdog:
+    def __init__(
+        self,
+        interval_sec: float = DEFAULT_INTERVAL_SEC,
+        frames: int = DEFAULT_FRAMES,
+        threshold_mb: float = DEFAULT_THRESHOLD_MB,
+        top: int = DEFAULT_TOP,
+        log_path: Path | None = None,
+        clock: Callable[[], float] | None = None,
+    ):
+        self.interval_sec = interval_sec
+        self.frames = max(1, frames)
+        self.threshold_mb = threshold_mb
+        self.top = top
+        self.log_path = log_path or default_log_path()
+        self.clock = clock or time.monotonic
+        self.baseline_rss: int | None = None
+        self.last_rss: int | None = None
+        self.warning: str | None = None
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._previous: tracemalloc.Snapshot | None = None
+        self._last_sample_at = 0.0
+        self._started_tracing = False
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._baseline = self._previous = self._snapshot()
+        self.baseline_rss = self.last_rss = read_rss_bytes()
+        self._last_sample_at = self.clock()
+        self._write([f"시작 RSS {_format_mb(self.baseline_rss)}, frames={self.frames}, interval={self.interval_sec:g}s"])
+
+    def maybe_sample(self) -> bool:
+        if self._previous is None or self.clock() - self._last_sample_at < self.interval_sec:
+            return False
+        self.sample()
+        return True
+
+    def sample(self) -> list[tracemalloc.StatisticDiff]:
+        snapshot = self._snapshot()
+        key_type = "traceback" if self.frames > 1 else "lineno"
+        growth = [stat for stat in snapshot.compare_to(self._previous, key_type) if stat.size_diff > 0]
+        since_start = snapshot.compare_to(self._baseline, key_type)
+        self._previous = snapshot
+        self._last_sample_at = self.clock()
+        self.last_rss = read_rss_bytes()
+
+        traced, peak = tracemalloc.get_traced_memory()
+        rss_growth = None
+        if self.last_rss is not None and self.baseline_rss is not None:
+            rss_growth = self.last_rss - self.baseline_rss
+        traced_growth = sum(stat.size_diff for stat in since_start)
+        lines = [
+            f"RSS {_format_mb(self.last_rss)} ({_format_delta(rss_growth)}), "
+            f"traced {_format_mb(traced)} (peak {_format_mb(peak)}, 시작 대비 {_format_delta(traced_growth)})"
+        ]
+        for stat in growth[: self.top]:
+            frame = stat.traceback[0]
+            lines.append(
+                f"  {_format_delta(stat.size_diff)} ({stat.count_diff:+d} blocks) {frame.filename}:{frame.lineno}"
+            )
+
+        growth_mb = max(rss_growth or 0, traced_growth) / MB
+        if growth_mb >= self.threshold_mb:
+            self.warning = f"메모리 증가 {growth_mb:.1f}MB (기준 {self.threshold_mb:g}MB)"
+            lines.append(f"  경고: {self.warning}")
+        self._write(lines)
+        return growth
+
+    def stop(self) -> None:
+        if self._previous is None:
+            return
+        self.sample()
+        self._previous = None
+        self._baseline = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def footer(self) -> str:
+        rss_growth = None
+        if self.last_rss is not None and self.baseline_rss is not None:
+            rss_growth = self.last_rss - self.baseline_rss
+        text = f"메모리 RSS {_format_mb(self.last_rss)} ({_format_delta(rss_growth)})"
+        if self.warning:
+            text = f"{text} | {self.warning}"
+        return text
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        filters.extend(tracemalloc.Filter(False, filename) for filename in IGNORED_FILES)
+        return tracemalloc.take_snapshot().filter_traces(filters)
+
+    def _write(self, lines: list[str]) -> None:
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.log_path.open("a", encoding="utf-8") as handle:
+            handle.write(f"[{stamp}] {lines[0]}\n")
+            for line in lines[1:]:
+                handle.write(f"{line}\n")
+
+
+def _format_mb(value: int | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value / MB:.1f}MB"
+
+
+def _format_delta(value: int | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value / MB:+.2f}MB"
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import datetime
+import json
+from pathlib import Path
+
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+KNOWN_TR_IDS = ("FHKST01010100", "HHDFS76200200")
+STATS_FLUSH_CYCLES = 12
+STATS_MAX_BYTES = 1_000_000
+PERCENTILES = (50, 95, 99)
+
+
+def default_stats_path() -> Path:
+    return Path.home() / ".config" / "trade-watcher" / "monitor-stats.jsonl"
+
+
+class Histogram:
+    __slots__ = ("counts", "total", "sum_ms")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, value_ms)] += 1
+        self.total += 1
+        self.sum_ms += value_ms
+
+    def merge(self, counts: list[int], sum_ms: float = 0.0) -> None:
+        for index, count in enumerate(counts[: len(self.counts)]):
+            self.counts[index] += count
+            self.total += count
+        self.sum_ms += sum_ms
+
+    def percentile(self, percent: float) -> float | None:
+        if self.total == 0:
+            return None
+        rank = self.total * percent / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return float(LATENCY_BUCKETS_MS[index])
+                return float(LATENCY_BUCKETS_MS[-1])
+        return float(LATENCY_BUCKETS_MS[-1])
+
+    def reset(self) -> None:
+        for index in range(len(self.counts)):
+            self.counts[index] = 0
+        self.total = 0
+        self.sum_ms = 0.0
+
+    def to_dict(self) -> dict:
+        return {"counts": list(self.counts), "sum_ms": round(self.sum_ms, 3)}
+
+
+class MonitorMetrics:
+    def __init__(self) -> None:
+        self.requests: dict[str, Histogram] = {tr_id: Histogram() for tr_id in KNOWN_TR_IDS}
+        self.all_requests = Histogram()
+        self.token_refresh = Histogram()
+        self.render = Histogram()
+        self.cycle = Histogram()
+        self.drift = Histogram()
+        self.retries = 0
+        self.throttled = 0
+        self.timeouts = 0
+        self.cycles = 0
+        self.cycle_requests = 0
+        self.cycle_retries = 0
+        self.cycle_throttled = 0
+        self.cycle_timeouts = 0
+        self.last_render_ms = 0.0
+        self.last_cycle_ms = 0.0
+        self.last_drift_ms = 0.0
+        self.last_token_ms: float | None = None
+
+    def record_request(self, tr_id: str, elapsed_ms: float) -> None:
+        histogram = self.requests.get(tr_id)
+        if histogram is None:
+            histogram = self.requests[tr_id] = Histogram()
+        histogram.observe(elapsed_ms)
+        self.all_requests.observe(elapsed_ms)
+        self.cycle_requests += 1
+
+    def record_retry(self) -> None:
+        self.retries += 1
+        self.cycle_retries += 1
+
+    def record_throttle(self) -> None:
+        self.throttled += 1
+        self.cycle_throttled += 1
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+        self.cycle_timeouts += 1
+
+    def record_token_refresh(self, elapsed_ms: float) -> None:
+        self.token_refresh.observe(elapsed_ms)
+        self.last_token_ms = elapsed_ms
+
+    def record_render(self, elapsed_ms: float) -> None:
+        self.render.observe(elapsed_ms)
+        self.last_render_ms = elapsed_ms
+
+    def record_drift(self, drift_ms: float) -> None:
+        self.drift.observe(max(drift_ms, 0.0))
+        self.last_drift_ms = drift_ms
+
+    def begin_cycle(self) -> None:
+        self.cycle_requests = 0
+        self.cycle_retries = 0
+        self.cycle_throttled = 0
+        self.cycle_timeouts = 0
+
+    def end_cycle(self, elapsed_ms: float) -> None:
+        self.cycle.observe(elapsed_ms)
+        self.last_cycle_ms = elapsed_ms
+        self.cycles += 1
+
+    def footer(self) -> str:
+        requests = self.all_requests
+        token = "-" if self.last_token_ms is None else f"{self.last_token_ms:.0f}ms"
+        return (
+            f"요청 {self.cycle_requests}건"
+            f" p50 {_format_ms(requests.percentile(50))} p95 {_format_ms(requests.percentile(95))}"
+            f" | 재시도 {self.cycle_retries} 제한 {self.cycle_throttled} 타임아웃 {self.cycle_timeouts}"
+            f" | 주기 {self.last_cycle_ms:.0f}ms 렌더 {self.last_render_ms:.1f}ms"
+            f" 지연 {self.last_drift_ms:+.0f}ms 토큰 {token}"
+        )
+
+    def snapshot(self) -> dict:
+        return {
+            "recorded_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "buckets_ms": list(LATENCY_BUCKETS_MS),
+            "cycles": self.cycles,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "timeouts": self.timeouts,
+            "requests": {
+                tr_id: histogram.to_dict()
+                for tr_id, histogram in self.requests.items()
+                if histogram.total
+            },
+            "token_refresh": self.token_refresh.to_dict(),
+            "render": self.render.to_dict(),
+            "cycle": self.cycle.to_dict(),
+            "drift": self.drift.to_dict(),
+        }
+
+    def reset(self) -> None:
+        for histogram in self.requests.values():
+            histogram.reset()
+        for histogram in (self.all_requests, self.token_refresh, self.render, self.cycle, self.drift):
+            histogram.reset()
+        self.retries = 0
+        self.throttled = 0
+        self.timeouts = 0
+        self.cycles = 0
+
+
+class StatsRecorder:
+    def __init__(
+        self,
+        path: Path | None = None,
+        flush_cycles: int = STATS_FLUSH_CYCLES,
+        max_bytes: int = STATS_MAX_BYTES,
+    ):
+        self.path = path or default_stats_path()
+        self.flush_cycles = flush_cycles
+        self.max_bytes = max_bytes
+        self._pending_cycles = 0
+
+    def tick(self, metrics: MonitorMetrics) -> None:
+        self._pending_cycles += 1
+        if self._pending_cycles >= self.flush_cycles:
+            self.flush(metrics)
+
+    def flush(self, metrics: MonitorMetrics) -> None:
+        if metrics.cycles == 0:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists() and self.path.stat().st_size >= self.max_bytes:
+            self.path.replace(_rotated_path(self.path))
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(metrics.snapshot(), ensure_ascii=False) + "\n")
+        metrics.reset()
+        self._pending_cycles = 0
+
+
+def summarize_stats(path: Path | None = None) -> str:
+    path = path or default_stats_path()
+    records = [*_read_records(_rotated_path(path)), *_read_records(path)]
+    if not records:
+        return f"기록된 통계가 없습니다: {path}"
+
+    requests: dict[str, Histogram] = {}
+    series = {name: Histogram() for name in ("cycle", "render", "drift", "token_refresh")}
+    totals = {"cycles": 0, "retries": 0, "throttled": 0, "timeouts": 0}
+    for record in records:
+        for key in totals:
+            totals[key] += int(record.get(key, 0))
+        for tr_id, value in record.get("requests", {}).items():
+            requests.setdefault(tr_id, Histogram()).merge(value.get("counts", []), value.get("sum_ms", 0.0))
+        for name, histogram in series.items():
+            value = record.get(name) or {}
+            histogram.merge(value.get("counts", []), value.get("sum_ms", 0.0))
+
+    lines = [
+        f"기간: {records[0].get('recorded_at', '-')} ~ {records[-1].get('recorded_at', '-')}",
+        (
+            f"주기 {totals['cycles']}회, 재시도 {totals['retries']}, "
+            f"제한 {totals['throttled']}, 타임아웃 {totals['timeouts']}"
+        ),
+        "",
+        f"{'항목':<22}{'건수':>8}{'p50':>10}{'p95':>10}{'p99':>10}",
+    ]
+    rows = [(f"request {tr_id}", histogram) for tr_id, histogram in sorted(requests.items())]
+    rows.extend(series.items())
+    for name, histogram in rows:
+        if not histogram.total:
+            continue
+        lines.append(
+            f"{name:<22}{histogram.total:>8}"
+            + "".join(f"{_format_ms(histogram.percentile(percent)):>10}" for percent in PERCENTILES)
+        )
+    return "\n".join(lines)
+
+
+def _read_records(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    records = []
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("buckets_ms") == list(LATENCY_BUCKETS_MS):
+                records.append(record)
+    return records
+
+
+def _rotated_path(path: Path) -> Path:
+    return path.with_name(path.name + ".1")
+
+
+def _format_ms(value: float | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value:.0f}ms"
@@ -31,3 +31,13 @@ class QuoteSnapshot:
     nxt_price: str | None
     change_rate: str | None
     error: str | None = None
+    volume: int | None = None
+
+
+def to_float(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from datetime import datetime
+from itertools import groupby
+import shutil
+
+from watcher_cli.history import HistoryStore
+from watcher_cli.models import QuoteSnapshot, WatchItem, to_float
+from watcher_cli.terminal import MONITOR_TABLE_OFFSET, render_monitor
+
+DEFAULT_BACKGROUND_BATCH = 10
+# 스크롤/필터 입력이 멈춘 뒤 새로 보이는 종목을 조회하기까지 기다리는 시간
+NAVIGATION_FETCH_DELAY_SEC = 0.3
+MIN_VIEWPORT_HEIGHT = 5
+SORT_MODES = (None, "rate", "price", "name")
+SORT_LABELS = {"rate": "변동률", "price": "가격", "name": "이름"}
+FILTER_EMPTY_MESSAGE = "필터와 일치하는 종목이 없습니다."
+
+
+class Viewport:
+    def __init__(self, height: int | None = None):
+        self.height = height
+        self.offset = 0
+
+    def visible_range(self, total: int) -> range:
+        if self.height is None:
+            return range(total)
+        self.offset = max(0, min(self.offset, total - self.height))
+        return range(self.offset, min(total, self.offset + self.height))
+
+    def scroll(self, delta: int, total: int) -> bool:
+        if self.height is None:
+            return False
+        before = self.offset
+        self.offset = max(0, min(self.offset + delta, total - self.height))
+        return self.offset != before
+
+    def handle_key(self, key: str, total: int) -> bool:
+        if self.height is None:
+            return False
+        if key in ("down", "j"):
+            return self.scroll(1, total)
+        if key in ("up", "k"):
+            return self.scroll(-1, total)
+        if key in ("pagedown", " "):
+            return self.scroll(self.height, total)
+        if key in ("pageup", "b"):
+            return self.scroll(-self.height, total)
+        if key in ("home", "g"):
+            return self.scroll(-total, total)
+        if key in ("end", "G"):
+            return self.scroll(total, total)
+        return False
+
+
+class FetchScheduler:
+    def __init__(self, background_batch: int = DEFAULT_BACKGROUND_BATCH):
+        self.background_batch = background_batch
+        self._cursor = 0
+
+    def plan(
+        self,
+        items: list[WatchItem],
+        visible: list[WatchItem],
+    ) -> tuple[list[WatchItem], list[WatchItem]]:
+        """화면 안 종목과, 그 뒤에 따로 조회할 화면 밖 종목 일부를 나눠 돌려준다."""
+        background: list[WatchItem] = []
+        visible_symbols = {item.symbol for item in visible}
+        hidden = len(items) - len(visible_symbols)
+        if hidden <= 0 or self.background_batch <= 0:
+            return list(visible), background
+
+        collected = 0
+        scanned = 0
+        while collected < min(self.background_batch, hidden) and scanned < len(items):
+            index = self._cursor % len(items)
+            self._cursor = index + 1
+            scanned += 1
+            if items[index].symbol in visible_symbols:
+                continue
+            background.append(items[index])
+            collected += 1
+        return list(visible), background
+
+
+class SortedIndex:
+    def __init__(self) -> None:
+        self.keys: list[tuple] = []
+        self._key_by_symbol: dict[str, tuple] = {}
+
+    def rebuild(self, keys: dict[str, tuple]) -> None:
+        self._key_by_symbol = dict(keys)
+        self.keys = sorted(keys.values())
+
+    def update(self, symbol: str, key: tuple) -> bool:
+        previous = self._key_by_symbol.get(symbol)
+        if previous == key:
+            return False
+        if previous is not None:
+            del self.keys[bisect_left(self.keys, previous)]
+        insort(self.keys, key)
+        self._key_by_symbol[symbol] = key
+        return True
+
+
+class MonitorView:
+    def __init__(self, viewport: Viewport | None = None):
+        self.viewport = viewport or Viewport()
+        self.items: list[WatchItem] = []
+        self.quotes: dict[str, QuoteSnapshot] = {}
+        self.history = HistoryStore()
+        self.directions: dict[str, int] = {}
+        # 제목의 갱신 시각: 시세가 실제로 바뀐 시각 (변경 없는 주기는 같은 화면을 만들어 아무것도 쓰지 않음)
+        self.updated_at = datetime.now()
+        self.sort_mode: str | None = None
+        self.descending = True
+        self.group_by_market = False
+        self.filter_text = ""
+        self.editing_filter = False
+        self._positions: dict[str, int] = {}
+        self._by_symbol: dict[str, WatchItem] = {}
+        self._index = SortedIndex()
+        self._displayed: list[WatchItem] | None = None
+
+    def set_items(self, items: list[WatchItem]) -> None:
+        if items == self.items:
+            return
+        self.items = items
+        self._positions = {item.symbol: position for position, item in enumerate(items)}
+        self._by_symbol = {item.symbol: item for item in items}
+        if len(self.quotes) > len(self._positions):
+            self.quotes = {
+                symbol: quote for symbol, quote in self.quotes.items() if symbol in self._positions
+            }
+            self.history.retain(set(self._positions))
+        self._rebuild_index()
+
+    def displayed_items(self) -> list[WatchItem]:
+        if self._displayed is None:
+            keys = self._index.keys
+            if self.sort_mode == "name" and self.descending:
+                # 시장 그룹 순서는 유지하고 그룹 안에서만 역순으로 둔다.
+                keys = [
+                    key
+                    for _, group in groupby(keys, key=lambda key: key[0])
+                    for key in reversed(list(group))
+                ]
+            ordered = [self._by_symbol[key[-1]] for key in keys]
+            if self.filter_text:
+                needle = self.filter_text.lower()
+                ordered = [item for item in ordered if _matches(item, needle)]
+            self._displayed = ordered
+        return self._displayed
+
+    def visible_items(self) -> list[WatchItem]:
+        displayed = self.displayed_items()
+        return [displayed[index] for index in self.viewport.visible_range(len(displayed))]
+
+    def unfetched_visible_items(self) -> list[WatchItem]:
+        return [item for item in self.visible_items() if item.symbol not in self.quotes]
+
+    def handle_key(self, key: str) -> bool:
+        if self.editing_filter:
+            return self._edit_filter(key)
+        if key == "/":
+            self.editing_filter = True
+            return True
+        if key == "s":
+            self.sort_mode = SORT_MODES[(SORT_MODES.index(self.sort_mode) + 1) % len(SORT_MODES)]
+            self.descending = self.sort_mode != "name"
+            self._rebuild_index()
+            return True
+        if key == "r" and self.sort_mode is not None:
+            self.descending = not self.descending
+            self._rebuild_index()
+            return True
+        if key == "m":
+            self.group_by_market = not self.group_by_market
+            self._rebuild_index()
+            return True
+        if key == "escape" and self.filter_text:
+            self._set_filter("")
+            return True
+        return self.viewport.handle_key(key, len(self.displayed_items()))
+
+    def update(self, quotes: list[QuoteSnapshot], new_cycle: bool = True) -> None:
+        if new_cycle:
+            self.directions = {}
+        self.history.record(quotes)
+        quote_sorted = self.sort_mode in ("rate", "price")
+        for quote in quotes:
+            previous = self.quotes.get(quote.symbol)
+            if quote != previous:
+                self.updated_at = datetime.now()
+            direction = _direction(previous.best_price if previous else None, quote.best_price)
+            if direction:
+                self.directions[quote.symbol] = direction
+            self.quotes[quote.symbol] = quote
+            position = self._positions.get(quote.symbol)
+            if quote_sorted and position is not None:
+                if self._index.update(quote.symbol, self._sort_key(self.items[position], position)):
+                    self._displayed = None
+
+    def render(self) -> tuple[str, dict[int, int]]:
+        if not self.items:
+            return render_monitor([], updated_at=self.updated_at), {}
+        displayed = self.displayed_items()
+        visible = self.viewport.visible_range(len(displayed))
+        quotes = [self._quote_for(displayed[index]) for index in visible]
+        highlights = {
+            MONITOR_TABLE_OFFSET + row: self.directions[quote.symbol]
+            for row, quote in enumerate(quotes)
+            if quote.symbol in self.directions
+        }
+        position = None
+        if len(visible) < len(self.items):
+            position = (visible.start, len(displayed))
+        text = render_monitor(
+            quotes,
+            position=position,
+            status=self._status(),
+            show_market=self.group_by_market,
+            history=self.history,
+            updated_at=self.updated_at,
+            empty_message=FILTER_EMPTY_MESSAGE if self.filter_text else None,
+        )
+        return text, highlights
+
+    def _edit_filter(self, key: str) -> bool:
+        if key == "enter":
+            self.editing_filter = False
+        elif key == "escape":
+            self.editing_filter = False
+            self._set_filter("")
+        elif key == "backspace":
+            self._set_filter(self.filter_text[:-1])
+        elif len(key) == 1 and key.isprintable():
+            self._set_filter(self.filter_text + key)
+        else:
+            return False
+        return True
+
+    def _set_filter(self, text: str) -> None:
+        self.filter_text = text
+        self.viewport.offset = 0
+        self._displayed = None
+
+    def _rebuild_index(self) -> None:
+        self._index.rebuild(
+            {item.symbol: self._sort_key(item, position) for position, item in enumerate(self.items)}
+        )
+        self._displayed = None
+
+    def _sort_key(self, item: WatchItem, position: int) -> tuple:
+        group = item.market if self.group_by_market else ""
+        if self.sort_mode == "name":
+            return (group, 0, item.name.lower(), position, item.symbol)
+        if self.sort_mode in ("rate", "price"):
+            quote = self.quotes.get(item.symbol)
+            raw = None
+            if quote is not None:
+                raw = quote.change_rate if self.sort_mode == "rate" else quote.best_price
+            value = to_float(raw)
+            if value is None:
+                return (group, 1, 0.0, position, item.symbol)
+            return (group, 0, -value if self.descending else value, position, item.symbol)
+        return (group, 0, 0.0, position, item.symbol)
+
+    def _status(self) -> str | None:
+        parts = []
+        if self.sort_mode is not None:
+            parts.append(f"정렬: {SORT_LABELS[self.sort_mode]}{'↓' if self.descending else '↑'}")
+        if self.group_by_market:
+            parts.append("그룹: 시장")
+        if self.filter_text or self.editing_filter:
+            cursor = "_" if self.editing_filter else ""
+            parts.append(f"필터: {self.filter_text}{cursor}")
+        return " | ".join(parts) or None
+
+    def _quote_for(self, item: WatchItem) -> QuoteSnapshot:
+        quote = self.quotes.get(item.symbol)
+        if quote is not None:
+            return quote
+        return QuoteSnapshot(
+            symbol=item.symbol,
+            name=item.name,
+            market=item.market,
+            best_price=None,
+            krx_price=None,
+            nxt_price=None,
+            change_rate=None,
+        )
+
+
+def terminal_viewport_height(reserved_lines: int = 0) -> int:
+    lines = shutil.get_terminal_size().lines
+    return max(MIN_VIEWPORT_HEIGHT, lines - MONITOR_TABLE_OFFSET - reserved_lines - 1)
+
+
+def _matches(item: WatchItem, needle: str) -> bool:
+    return (
+        needle in item.symbol.lower()
+        or needle in item.name.lower()
+        or any(needle in alias.lower() for alias in item.aliases)
+    )
+
+
+def _direction(before: str | None, after: str | None) -> int:
+    previous = to_float(before)
+    current = to_float(after)
+    if previous is None or current is None or previous == current:
+        return 0
+    return 1 if current > previous else -1
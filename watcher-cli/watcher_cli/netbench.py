@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import statistics
+import tempfile
+import time
+
+import httpx
+
+from watcher_cli.config import KISConfig
+from watcher_cli.kis import KISClient, TokenManager
+from watcher_cli.models import WatchItem
+from watcher_cli.quotes import QuoteService
+from watcher_cli.terminal import _render_table
+
+DOMESTIC_PROBE = (
+    "국내 현재가",
+    "/uapi/domestic-stock/v1/quotations/inquire-price",
+    "FHKST01010100",
+    {"fid_cond_mrkt_div_code": "J", "fid_input_iscd": "005930"},
+)
+OVERSEAS_PROBE = (
+    "해외 현재가",
+    "/uapi/overseas-price/v1/quotations/price-detail",
+    "HHDFS76200200",
+    {"AUTH": "", "EXCD": "NAS", "SYMB": "AAPL"},
+)
+
+
+@dataclass
+class PhaseTimings:
+    name: str
+    connect_ms: list[float] = field(default_factory=list)
+    tls_ms: list[float] = field(default_factory=list)
+    ttfb_ms: list[float] = field(default_factory=list)
+    decode_ms: list[float] = field(default_factory=list)
+    total_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+
+
+@dataclass
+class DiagnosticReport:
+    base_url: str
+    token_ms: float
+    token_cached: bool
+    endpoints: list[PhaseTimings]
+    cycle_ms: list[float]
+    cycle_items: int
+    cycle_errors: int
+
+
+class _TraceRecorder:
+    def __init__(self) -> None:
+        self.events: dict[str, float] = {}
+
+    async def __call__(self, event_name: str, _info: dict) -> None:
+        self.events[event_name] = time.perf_counter()
+
+    def span(self, started: str, completed: str) -> float | None:
+        if started not in self.events or completed not in self.events:
+            return None
+        return (self.events[completed] - self.events[started]) * 1000
+
+
+async def run_diagnostic(
+    config: KISConfig,
+    items: list[WatchItem],
+    runs: int = 5,
+    token_cache_path: Path | None = None,
+) -> DiagnosticReport:
+    token_manager = TokenManager(config, cache_path=token_cache_path)
+    token_cached = token_manager.cached_token() is not None
+    started = time.perf_counter()
+    token = await token_manager.get_token()
+    token_ms = (time.perf_counter() - started) * 1000
+
+    endpoints = []
+    for probe in (DOMESTIC_PROBE, OVERSEAS_PROBE):
+        endpoints.append(await _probe_endpoint(config, token, probe, runs))
+
+    cycle_ms: list[float] = []
+    cycle_errors = 0
+    if items:
+        client = KISClient(config=config, token_cache_path=token_manager.cache_path)
+        service = QuoteService(client=client)
+        try:
+            for _ in range(runs):
+                started = time.perf_counter()
+                quotes = await service.fetch_many(items)
+                cycle_ms.append((time.perf_counter() - started) * 1000)
+                cycle_errors += sum(1 for quote in quotes if quote.error)
+        finally:
+            await service.close()
+
+    return DiagnosticReport(
+        base_url=config.base_url,
+        token_ms=token_ms,
+        token_cached=token_cached,
+        endpoints=endpoints,
+        cycle_ms=cycle_ms,
+        cycle_items=len(items),
+        cycle_errors=cycle_errors,
+    )
+
+
+async def _probe_endpoint(
+    config: KISConfig,
+    token: str,
+    probe: tuple[str, str, str, dict[str, str]],
+    runs: int,
+) -> PhaseTimings:
+    name, endpoint, tr_id, params = probe
+    timings = PhaseTimings(name=name)
+    headers = {
+        "authorization": f"Bearer {token}",
+        "appkey": config.app_key,
+        "appsecret": config.app_secret,
+        "tr_id": tr_id,
+        "custtype": "P",
+        "content-type": "application/json; charset=utf-8",
+    }
+    async with httpx.AsyncClient(base_url=config.base_url, timeout=config.timeout_sec) as client:
+        for _ in range(runs):
+            trace = _TraceRecorder()
+            started = time.perf_counter()
+            try:
+                response = await client.get(endpoint, headers=headers, params=params, extensions={"trace": trace})
+            except httpx.RequestError:
+                timings.errors += 1
+                continue
+            decode_started = time.perf_counter()
+            try:
+                json.loads(response.content)
+            except ValueError:
+                timings.errors += 1
+            finished = time.perf_counter()
+
+            timings.statuses[response.status_code] = timings.statuses.get(response.status_code, 0) + 1
+            if not response.is_success:
+                timings.errors += 1
+            connect = trace.span("connection.connect_tcp.started", "connection.connect_tcp.complete")
+            tls = trace.span("connection.start_tls.started", "connection.start_tls.complete")
+            ttfb = trace.span("http11.send_request_headers.started", "http11.receive_response_headers.complete")
+            if connect is not None:
+                timings.connect_ms.append(connect)
+            if tls is not None:
+                timings.tls_ms.append(tls)
+            if ttfb is not None:
+                timings.ttfb_ms.append(ttfb)
+            timings.decode_ms.append((finished - decode_started) * 1000)
+            timings.total_ms.append((finished - started) * 1000)
+    return timings
+
+
+def format_report(report: DiagnosticReport) -> str:
+    token_source = "캐시" if report.token_cached else "신규 발급"
+    headers = ["항목", "연결", "TLS", "TTFB p50", "디코드 p50", "전체 p50", "전체 p95", "오류", "HTTP"]
+    rows = []
+    for timings in report.endpoints:
+        rows.append(
+            [
+                timings.name,
+                _format_first(timings.connect_ms),
+                _format_first(timings.tls_ms),
+                _format_percentile(timings.ttfb_ms, 50),
+                _format_percentile(timings.decode_ms, 50),
+                _format_percentile(timings.total_ms, 50),
+                _format_percentile(timings.total_ms, 95),
+                str(timings.errors),
+                ", ".join(f"{status}x{count}" for status, count in sorted(timings.statuses.items())) or "-",
+            ]
+        )
+
+    lines = [
+        f"대상: {report.base_url}",
+        f"토큰: {report.token_ms:.1f}ms ({token_source})",
+        "",
+        _render_table(headers, rows),
+        "",
+    ]
+    if report.cycle_ms:
+        lines.append(
+            f"관심 종목 {report.cycle_items}개 주기: p50 {_format_percentile(report.cycle_ms, 50)}, "
+            f"최대 {max(report.cycle_ms):.1f}ms, 오류 {report.cycle_errors}건"
+        )
+    else:
+        lines.append("관심 종목이 없어 주기 측정을 건너뜁니다.")
+    return "\n".join(lines)
+
+
+@contextmanager
+def temporary_token_cache() -> Iterator[Path]:
+    with tempfile.TemporaryDirectory(prefix="watcher-bench-") as directory:
+        yield Path(directory) / "kis_token.json"
+
+
+def _format_first(values: list[float]) -> str:
+    if not values:
+        return "-"
+    return f"{values[0]:.2f}ms"
+
+
+def _format_percentile(values: list[float], percent: int) -> str:
+    if not values:
+        return "-"
+    if len(values) == 1:
+        return f"{values[0]:.2f}ms"
+    return f"{statistics.quantiles(values, n=100, method='inclusive')[percent - 1]:.2f}ms"
+
@@ -4,17 +4,19 @@ import asyncio
 from collections.abc import Callable
 from datetime import datetime
 
-from watcher_cli.kis import APIError, KISClient
+from watcher_cli.kis import APIError, KISClient, ShardedKISClient, create_kis_client
+from watcher_cli.metrics import MonitorMetrics
 from watcher_cli.models import QuoteSnapshot, WatchItem
 
 
 class QuoteService:
     def __init__(
         self,
-        client: KISClient | None = None,
+        client: KISClient | ShardedKISClient | None = None,
         current_time_provider: Callable[[], datetime] | None = None,
+        metrics: MonitorMetrics | None = None,
     ):
-        self.client = client or KISClient()
+        self.client = client or create_kis_client(metrics=metrics)
         self.current_time_provider = current_time_provider or datetime.now
 
     async def close(self) -> None:
@@ -65,6 +67,7 @@ class QuoteService:
             krx_price=krx["price"],
             nxt_price=nxt["price"],
             change_rate=best["change_rate"],
+            volume=(krx["volume"] or 0) + (nxt["volume"] or 0),
         )
 
     async def _fetch_us(self, item: WatchItem) -> QuoteSnapshot:
@@ -86,6 +89,7 @@ class QuoteService:
             krx_price=None,
             nxt_price=None,
             change_rate=change_rate,
+            volume=self._safe_int(output.get("tvol")),
         )
 
     def _extract_domestic(self, response: dict) -> dict[str, str | int | None]:
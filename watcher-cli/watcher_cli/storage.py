@@ -1,65 +1,109 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 import json
+import os
 from pathlib import Path
+import sqlite3
+from typing import Protocol
 
 from watcher_cli.models import WatchItem
 
+SCHEMA_VERSION = 1
+SCHEMA_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS watchlist_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        symbol TEXT NOT NULL,
+        name TEXT NOT NULL,
+        market TEXT NOT NULL,
+        exchange TEXT,
+        aliases TEXT NOT NULL DEFAULT '[]'
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_watchlist_items_symbol ON watchlist_items(symbol)",
+    "CREATE INDEX IF NOT EXISTS ix_watchlist_items_symbol_nocase ON watchlist_items(symbol COLLATE NOCASE)",
+    "CREATE INDEX IF NOT EXISTS ix_watchlist_items_name_nocase ON watchlist_items(name COLLATE NOCASE)",
+    """
+    CREATE TABLE IF NOT EXISTS watchlist_aliases (
+        item_id INTEGER NOT NULL,
+        alias TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_watchlist_aliases_alias_nocase ON watchlist_aliases(alias COLLATE NOCASE)",
+    "CREATE INDEX IF NOT EXISTS ix_watchlist_aliases_item_id ON watchlist_aliases(item_id)",
+)
+
+
+def default_json_path() -> Path:
+    return Path.home() / ".config" / "trade-watcher" / "watchlist.json"
+
+
+def default_sqlite_path() -> Path:
+    return Path.home() / ".config" / "trade-watcher" / "watchlist.db"
+
+
+class WatchlistStorage(Protocol):
+    def list_items(self) -> list[WatchItem]: ...
+
+    def add(self, item: WatchItem) -> bool: ...
+
+    def add_many(self, items: Iterable[WatchItem]) -> int: ...
+
+    def remove(self, query: str) -> WatchItem | None: ...
+
+    def remove_many(self, queries: Iterable[str]) -> list[WatchItem]: ...
+
 
 class JsonWatchlistStorage:
     def __init__(self, path: Path | None = None):
-        self.path = path or Path.home() / ".config" / "trade-watcher" / "watchlist.json"
+        self.path = path or default_json_path()
+        self._cached_signature: tuple[int, int, int] | None = None
+        self._cached_items: list[WatchItem] | None = None
 
     def list_items(self) -> list[WatchItem]:
-        payload = self._read_payload()
-        return [
-            WatchItem(
-                symbol=item["symbol"],
-                name=item["name"],
-                market=item["market"],
-                exchange=item.get("exchange"),
-                aliases=tuple(item.get("aliases", [])),
-            )
-            for item in payload["items"]
-        ]
+        signature = self._signature()
+        if self._cached_items is None or signature != self._cached_signature:
+            self._cache(signature, self._read_payload())
+        return list(self._cached_items)
 
     def add(self, item: WatchItem) -> bool:
+        return self.add_many([item]) == 1
+
+    def add_many(self, items: Iterable[WatchItem]) -> int:
         payload = self._read_payload()
-        items = payload["items"]
-        if any(existing["symbol"] == item.symbol for existing in items):
-            return False
-
-        items.append(
-            {
-                "symbol": item.symbol,
-                "name": item.name,
-                "market": item.market,
-                "exchange": item.exchange,
-                "aliases": list(item.aliases),
-            }
-        )
-        self._write_payload(payload)
-        return True
+        existing = {item["symbol"] for item in payload["items"]}
+        added = 0
+        for item in items:
+            if item.symbol in existing:
+                continue
+            existing.add(item.symbol)
+            payload["items"].append(_to_record(item))
+            added += 1
+        if added:
+            self._write_payload(payload)
+        return added
 
     def remove(self, query: str) -> WatchItem | None:
+        removed = self.remove_many([query])
+        return removed[0] if removed else None
+
+    def remove_many(self, queries: Iterable[str]) -> list[WatchItem]:
         payload = self._read_payload()
-        normalized = query.strip().lower()
-
-        for index, item in enumerate(payload["items"]):
-            symbol = item["symbol"].lower()
-            name = item["name"].lower()
-            aliases = {alias.lower() for alias in item.get("aliases", [])}
-            if normalized in {symbol, name, *aliases}:
-                removed = payload["items"].pop(index)
-                self._write_payload(payload)
-                return WatchItem(
-                    symbol=removed["symbol"],
-                    name=removed["name"],
-                    market=removed["market"],
-                    exchange=removed.get("exchange"),
-                    aliases=tuple(removed.get("aliases", [])),
-                )
-        return None
+        removed: list[WatchItem] = []
+        for query in queries:
+            normalized = query.strip().lower()
+            for index, item in enumerate(payload["items"]):
+                symbol = item["symbol"].lower()
+                name = item["name"].lower()
+                aliases = {alias.lower() for alias in item.get("aliases", [])}
+                if normalized in {symbol, name, *aliases}:
+                    removed.append(_to_item(payload["items"].pop(index)))
+                    break
+        if removed:
+            self._write_payload(payload)
+        return removed
 
     def _read_payload(self) -> dict:
         if not self.path.exists():
@@ -79,7 +123,176 @@ class JsonWatchlistStorage:
 
     def _write_payload(self, payload: dict) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(
+        temp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(
             json.dumps(payload, ensure_ascii=False, indent=2) + "\n",
             encoding="utf-8",
         )
+        os.replace(temp_path, self.path)
+        self._cache(self._signature(), payload)
+
+    def _signature(self) -> tuple[int, int, int] | None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _cache(self, signature: tuple[int, int, int] | None, payload: dict) -> None:
+        self._cached_signature = signature
+        self._cached_items = [_to_item(item) for item in payload["items"]]
+
+
+class SqliteWatchlistStorage:
+    def __init__(self, path: Path | None = None, legacy_path: Path | None = None):
+        self.path = path or default_sqlite_path()
+        self.legacy_path = legacy_path or self.path.with_name("watchlist.json")
+        self._connection: sqlite3.Connection | None = None
+        self._cached_version: int | None = None
+        self._cached_items: list[WatchItem] | None = None
+
+    def list_items(self) -> list[WatchItem]:
+        connection = self._connect()
+        version = connection.execute("PRAGMA data_version").fetchone()[0]
+        if self._cached_items is None or version != self._cached_version:
+            rows = connection.execute(
+                "SELECT symbol, name, market, exchange, aliases FROM watchlist_items ORDER BY id"
+            ).fetchall()
+            self._cached_items = [_row_to_item(row) for row in rows]
+            self._cached_version = version
+        return list(self._cached_items)
+
+    def add(self, item: WatchItem) -> bool:
+        return self.add_many([item]) == 1
+
+    def add_many(self, items: Iterable[WatchItem]) -> int:
+        with self._transaction() as connection:
+            return _insert_items(connection, items)
+
+    def remove(self, query: str) -> WatchItem | None:
+        removed = self.remove_many([query])
+        return removed[0] if removed else None
+
+    def remove_many(self, queries: Iterable[str]) -> list[WatchItem]:
+        removed: list[WatchItem] = []
+        with self._transaction() as connection:
+            for query in queries:
+                normalized = query.strip()
+                row = connection.execute(
+                    """
+                    SELECT id, symbol, name, market, exchange, aliases
+                    FROM watchlist_items
+                    WHERE symbol = ?1 COLLATE NOCASE
+                       OR name = ?1 COLLATE NOCASE
+                       OR id IN (SELECT item_id FROM watchlist_aliases WHERE alias = ?1 COLLATE NOCASE)
+                    ORDER BY id
+                    LIMIT 1
+                    """,
+                    (normalized,),
+                ).fetchone()
+                if row is None:
+                    continue
+                connection.execute("DELETE FROM watchlist_aliases WHERE item_id = ?", (row[0],))
+                connection.execute("DELETE FROM watchlist_items WHERE id = ?", (row[0],))
+                removed.append(_row_to_item(row[1:]))
+        return removed
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection = connection
+            self._migrate(connection)
+        return self._connection
+
+    def _migrate(self, connection: sqlite3.Connection) -> None:
+        if connection.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if connection.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                for statement in SCHEMA_STATEMENTS:
+                    connection.execute(statement)
+                if self.legacy_path.exists():
+                    _insert_items(connection, JsonWatchlistStorage(self.legacy_path).list_items())
+                connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        self._cached_items = None
+
+
+def _insert_items(connection: sqlite3.Connection, items: Iterable[WatchItem]) -> int:
+    added = 0
+    for item in items:
+        cursor = connection.execute(
+            """
+            INSERT OR IGNORE INTO watchlist_items (symbol, name, market, exchange, aliases)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                item.symbol,
+                item.name,
+                item.market,
+                item.exchange,
+                json.dumps(list(item.aliases), ensure_ascii=False),
+            ),
+        )
+        if cursor.rowcount != 1:
+            continue
+        connection.executemany(
+            "INSERT INTO watchlist_aliases (item_id, alias) VALUES (?, ?)",
+            [(cursor.lastrowid, alias) for alias in item.aliases],
+        )
+        added += 1
+    return added
+
+
+def _row_to_item(row: tuple) -> WatchItem:
+    symbol, name, market, exchange, aliases = row
+    return WatchItem(
+        symbol=symbol,
+        name=name,
+        market=market,
+        exchange=exchange,
+        aliases=tuple(json.loads(aliases)),
+    )
+
+
+def _to_record(item: WatchItem) -> dict:
+    return {
+        "symbol": item.symbol,
+        "name": item.name,
+        "market": item.market,
+        "exchange": item.exchange,
+        "aliases": list(item.aliases),
+    }
+
+
+def _to_item(item: dict) -> WatchItem:
+    return WatchItem(
+        symbol=item["symbol"],
+        name=item["name"],
+        market=item["market"],
+        exchange=item.get("exchange"),
+        aliases=tuple(item.get("aliases", [])),
+    )
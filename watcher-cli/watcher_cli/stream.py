@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from collections import deque
+import csv
+from dataclasses import asdict
+from datetime import datetime
+import io
+import json
+import sys
+import threading
+from typing import TextIO
+
+from watcher_cli.models import QuoteSnapshot
+
+STREAM_FORMATS = ("jsonl", "csv")
+CSV_COLUMNS = (
+    "timestamp",
+    "symbol",
+    "name",
+    "market",
+    "best_price",
+    "krx_price",
+    "nxt_price",
+    "change_rate",
+    "volume",
+    "error",
+)
+DEFAULT_MAX_PENDING = 10_000
+
+
+def format_record(quote: QuoteSnapshot, timestamp: str, output_format: str) -> str:
+    record = {"timestamp": timestamp, **asdict(quote)}
+    if output_format == "jsonl":
+        return json.dumps(record, ensure_ascii=False) + "\n"
+    return _csv_line([record[column] for column in CSV_COLUMNS])
+
+
+class QuoteStreamWriter:
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        output_format: str = "jsonl",
+        max_pending: int = DEFAULT_MAX_PENDING,
+        header: bool = True,
+    ):
+        if output_format not in STREAM_FORMATS:
+            raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format}")
+        self.stream = stream or sys.stdout
+        self.output_format = output_format
+        self.header = header
+        self.dropped = 0
+        self.broken = False
+        self._last: dict[str, QuoteSnapshot] = {}
+        self._pending: deque[str] = deque(maxlen=max_pending)
+        self._closing = False
+        self._wakeup = threading.Condition()
+        self._writer: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._writer is not None:
+            return
+        self._writer = threading.Thread(target=self._run_writer, name="quote-stream-writer", daemon=True)
+        self._writer.start()
+
+    def publish(self, quotes: list[QuoteSnapshot]) -> int:
+        timestamp = datetime.now().astimezone().isoformat(timespec="milliseconds")
+        lines = []
+        for quote in quotes:
+            if self._last.get(quote.symbol) == quote:
+                continue
+            self._last[quote.symbol] = quote
+            lines.append(format_record(quote, timestamp, self.output_format))
+        if not lines:
+            return 0
+
+        with self._wakeup:
+            self.dropped += max(0, len(self._pending) + len(lines) - self._pending.maxlen)
+            self._pending.extend(lines)
+            self._wakeup.notify()
+        return len(lines)
+
+    def stop(self) -> None:
+        if self._writer is None:
+            return
+        with self._wakeup:
+            self._closing = True
+            self._wakeup.notify()
+        self._writer.join()
+        self._writer = None
+        self._closing = False
+
+    def _run_writer(self) -> None:
+        if self.output_format == "csv" and self.header:
+            self._write(_csv_line(CSV_COLUMNS))
+        while True:
+            with self._wakeup:
+                while not self._pending and not self._closing:
+                    self._wakeup.wait()
+                batch = "".join(self._pending)
+                self._pending.clear()
+                closing = self._closing
+            if batch:
+                self._write(batch)
+            if closing:
+                return
+
+    def _write(self, text: str) -> None:
+        if self.broken:
+            return
+        try:
+            self.stream.write(text)
+            self.stream.flush()
+        except BrokenPipeError:
+            self.broken = True
+
+
+def _csv_line(values) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(["" if value is None else value for value in values])
+    return buffer.getvalue()
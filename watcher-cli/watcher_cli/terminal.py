@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 from datetime import datetime
+import threading
 from typing import TextIO
 import sys
+import unicodedata
 
+from watcher_cli.history import HistoryStore, format_price
 from watcher_cli.models import QuoteSnapshot, WatchItem
 
+MONITOR_TABLE_OFFSET = 3
+HIGHLIGHT_STYLES = {1: "\033[31m", -1: "\033[34m"}
+RESET_STYLE = "\033[0m"
+
 
 def render_watchlist(items: list[WatchItem]) -> str:
     if not items:
@@ -14,73 +21,212 @@ def render_watchlist(items: list[WatchItem]) -> str:
     return _render_table(["코드", "이름", "시장", "거래소"], rows)
 
 
-def render_monitor(quotes: list[QuoteSnapshot]) -> str:
-    title = f"Trade Watcher (갱신: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')})"
+def render_monitor(
+    quotes: list[QuoteSnapshot],
+    position: tuple[int, int] | None = None,
+    status: str | None = None,
+    show_market: bool = False,
+    history: HistoryStore | None = None,
+    updated_at: datetime | None = None,
+    empty_message: str | None = None,
+) -> str:
+    updated_at = updated_at or datetime.now()
+    title = f"Trade Watcher (갱신: {updated_at.strftime('%Y-%m-%d %H:%M:%S')})"
+    if position is not None:
+        start, total = position
+        title = f"{title} [{start + 1}-{start + len(quotes)}/{total}]"
+    if status:
+        title = f"{title} {status}"
     if not quotes:
-        return f"{title}\n저장된 관심 종목이 없습니다."
+        return f"{title}\n{empty_message or '저장된 관심 종목이 없습니다.'}"
 
+    headers = ["코드", "이름", "최적가", "KRX", "NXT", "변동률"]
+    if show_market:
+        headers.insert(2, "시장")
+    if history is not None:
+        headers.extend(["추이", "고가", "저가"])
     rows: list[list[str]] = []
     for quote in quotes:
-        rows.append(
-            [
-                quote.symbol,
-                quote.name,
-                quote.best_price or quote.error or "-",
-                quote.krx_price or "-",
-                quote.nxt_price or "-",
-                _format_rate(quote.change_rate),
-            ]
-        )
-
-    return f"{title}\n{_render_table(['코드', '이름', '최적가', 'KRX', 'NXT', '변동률'], rows)}"
+        row = [
+            quote.symbol,
+            quote.name,
+            quote.best_price or quote.error or "-",
+            quote.krx_price or "-",
+            quote.nxt_price or "-",
+            _format_rate(quote.change_rate),
+        ]
+        if show_market:
+            row.insert(2, quote.market)
+        if history is not None:
+            series = history.get(quote.symbol)
+            if series is None:
+                row.extend(["", "-", "-"])
+            else:
+                row.extend([series.sparkline(), format_price(series.high), format_price(series.low)])
+        rows.append(row)
+
+    return f"{title}\n{_render_table(headers, rows)}"
 
 
 class ScreenRenderer:
-    def __init__(self, stream: TextIO | None = None):
+    def __init__(self, stream: TextIO | None = None, background: bool = False):
         self.stream = stream or sys.stdout
         self._is_tty = bool(getattr(self.stream, "isatty", lambda: False)())
         self._started = False
+        self._background = background
+        self._previous_lines: list[str] | None = None
+        self._previous_styles: dict[int, int] = {}
+        self._pending: tuple[str, dict[int, int]] | None = None
+        self._closing = False
+        self._wakeup = threading.Condition()
+        self._writer: threading.Thread | None = None
+
+    @property
+    def is_tty(self) -> bool:
+        return self._is_tty
 
     def start(self) -> None:
         if self._is_tty:
             self.stream.write("\033[?1049h")
             self.stream.flush()
+        if self._background and self._writer is None:
+            self._writer = threading.Thread(target=self._run_writer, name="screen-writer", daemon=True)
+            self._writer.start()
         self._started = True
 
-    def render(self, text: str) -> None:
+    def render(self, text: str, highlights: dict[int, int] | None = None) -> None:
         if not self._started:
             self.start()
 
-        if self._is_tty:
-            self.stream.write("\033[H\033[J")
-        self.stream.write(text)
-        self.stream.write("\n")
-        self.stream.flush()
+        if self._writer is None:
+            self._write_frame(text, highlights or {})
+            return
+
+        with self._wakeup:
+            self._pending = (text, highlights or {})
+            self._wakeup.notify()
 
     def stop(self) -> None:
         if not self._started:
             return
+        if self._writer is not None:
+            with self._wakeup:
+                self._closing = True
+                self._wakeup.notify()
+            self._writer.join()
+            self._writer = None
+            self._closing = False
         if self._is_tty:
             self.stream.write("\033[?1049l")
             self.stream.flush()
+        self._previous_lines = None
+        self._previous_styles = {}
         self._started = False
 
+    def _run_writer(self) -> None:
+        while True:
+            with self._wakeup:
+                while self._pending is None and not self._closing:
+                    self._wakeup.wait()
+                frame = self._pending
+                self._pending = None
+            if frame is None:
+                return
+            self._write_frame(*frame)
+
+    def _write_frame(self, text: str, highlights: dict[int, int]) -> None:
+        if not self._is_tty:
+            self.stream.write(text)
+            self.stream.write("\n")
+            self.stream.flush()
+            return
+
+        output = self._diff_frame(text.split("\n"), highlights)
+        if output:
+            self.stream.write(output)
+            self.stream.flush()
+
+    def _diff_frame(self, lines: list[str], highlights: dict[int, int]) -> str:
+        previous = self._previous_lines
+        previous_styles = self._previous_styles
+        self._previous_lines = lines
+        self._previous_styles = highlights
+
+        if previous is None:
+            return "\033[H\033[J" + "\n".join(_styled(line, highlights.get(row)) for row, line in enumerate(lines))
+
+        chunks: list[str] = []
+        for row, line in enumerate(lines):
+            old = previous[row] if row < len(previous) else ""
+            style = highlights.get(row)
+            previous_style = previous_styles.get(row)
+            if previous_style is not None and style != previous_style:
+                chunks.append(f"\033[{row + 1};1H{_styled(line, style)}\033[K")
+                continue
+            if line == old:
+                continue
+
+            prefix = _common_prefix(old, line)
+            suffix = _common_suffix(old, line, prefix)
+            old_middle = old[prefix : len(old) - suffix]
+            new_middle = line[prefix : len(line) - suffix]
+            column = _display_width(line[:prefix]) + 1
+            if _display_width(old_middle) == _display_width(new_middle):
+                chunks.append(f"\033[{row + 1};{column}H{_styled(new_middle, style)}")
+            else:
+                chunks.append(f"\033[{row + 1};{column}H{_styled(line[prefix:], style)}\033[K")
+
+        if len(lines) < len(previous):
+            chunks.append(f"\033[{len(lines) + 1};1H\033[J")
+        return "".join(chunks)
+
 
 def _render_table(headers: list[str], rows: list[list[str]]) -> str:
-    widths = [len(header) for header in headers]
+    widths = [_display_width(header) for header in headers]
     for row in rows:
         for index, cell in enumerate(row):
-            widths[index] = max(widths[index], len(cell))
+            widths[index] = max(widths[index], _display_width(cell))
+
+    def render_row(cells: list[str]) -> str:
+        return "  ".join(cell + " " * (widths[index] - _display_width(cell)) for index, cell in enumerate(cells))
 
     lines = [
-        "  ".join(header.ljust(widths[index]) for index, header in enumerate(headers)),
+        render_row(headers),
         "  ".join("-" * widths[index] for index in range(len(headers))),
     ]
-    for row in rows:
-        lines.append("  ".join(cell.ljust(widths[index]) for index, cell in enumerate(row)))
+    lines.extend(render_row(row) for row in rows)
     return "\n".join(lines)
 
 
+def _styled(text: str, direction: int | None) -> str:
+    style = HIGHLIGHT_STYLES.get(direction) if direction is not None else None
+    if not style or not text:
+        return text
+    return f"{style}{text}{RESET_STYLE}"
+
+
+def _common_prefix(old: str, new: str) -> int:
+    limit = min(len(old), len(new))
+    index = 0
+    while index < limit and old[index] == new[index]:
+        index += 1
+    return index
+
+
+def _common_suffix(old: str, new: str, prefix: int) -> int:
+    limit = min(len(old), len(new)) - prefix
+    index = 0
+    while index < limit and old[-1 - index] == new[-1 - index]:
+        index += 1
+    return index
+
+
+def _display_width(text: str) -> int:
+    if text.isascii():
+        return len(text)
+    return sum(2 if unicodedata.east_asian_width(char) in ("W", "F") else 1 for char in text)
+
+
 def _format_rate(value: str | None) -> str:
     if value is None or value == "":
         return "-"
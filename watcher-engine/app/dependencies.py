@@ -0,0 +1,125 @@
+"""FastAPI 의존성 (앱 단위 DB 핸들과 서비스 인스턴스).
+
+DB 스키마 생성과 서비스 생성은 lifespan에서 한 번만 수행하고,
+라우터는 ``Depends``로 ``app.state``에 보관된 인스턴스를 주입받습니다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from fastapi import FastAPI, Request
+
+from app.services.market_session import PriceTTLPolicy
+from app.services.oversea_stock_price_service import OverseaStockPriceService
+from app.services.portfolio_service import PortfolioService
+from app.services.price_refresher import PriceRefresher
+from app.services.stock_current_price_service import StockCurrentPriceService
+from app.services.stock_price_service import StockPriceService
+from app.services.stock_service import StockService
+from app.services.watchlist_service import WatchListService
+from core.config import PriceRefreshConfig, load_price_refresh_config
+from db import AsyncDatabase, Database
+
+
+@dataclass
+class AppServices:
+    """앱 단위로 공유하는 DB 핸들과 서비스 묶음."""
+
+    db: Database
+    adb: AsyncDatabase
+    stock_service: StockService
+    stock_price_service: StockPriceService
+    current_price_service: StockCurrentPriceService
+    overseas_price_service: OverseaStockPriceService
+    watchlist_service: WatchListService
+    portfolio_service: PortfolioService
+    price_refresher: PriceRefresher
+
+    @classmethod
+    def create(
+        cls,
+        db: Database,
+        refresh_config: PriceRefreshConfig | None = None,
+    ) -> AppServices:
+        """스키마를 준비하고 서비스 인스턴스를 생성 (백그라운드 갱신은 시작하지 않음)."""
+        refresh_config = refresh_config or load_price_refresh_config()
+        db.create_tables()
+        adb = AsyncDatabase(db)
+        ttl_policy = PriceTTLPolicy()
+        current_price_service = StockCurrentPriceService(db=db, adb=adb, ttl_policy=ttl_policy)
+        overseas_price_service = OverseaStockPriceService()
+        watchlist_service = WatchListService(
+            db=db,
+            price_service=current_price_service,
+            overseas_service=overseas_price_service,
+            adb=adb,
+            ttl_policy=ttl_policy,
+        )
+        return cls(
+            db=db,
+            adb=adb,
+            stock_service=StockService(db=db),
+            stock_price_service=StockPriceService(db=db, adb=adb),
+            current_price_service=current_price_service,
+            overseas_price_service=overseas_price_service,
+            watchlist_service=watchlist_service,
+            portfolio_service=PortfolioService(db=db),
+            price_refresher=PriceRefresher(
+                watchlist_service,
+                interval_sec=refresh_config.interval_sec,
+                max_calls_per_sec=refresh_config.max_calls_per_sec,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """백그라운드 갱신과 버퍼에 남은 쓰기를 마치고 DB 스레드 종료."""
+        await self.price_refresher.stop()
+        await self.current_price_service.aclose()
+        await self.adb.aclose()
+
+
+def init_services(app: FastAPI, db: Database | None = None) -> AppServices:
+    """앱 상태에 서비스 묶음 등록."""
+    services = AppServices.create(db or Database())
+    app.state.services = services
+    return services
+
+
+def _services(request: Request) -> AppServices:
+    services = getattr(request.app.state, "services", None)
+    if services is None:
+        services = init_services(request.app)
+    return services
+
+
+def get_database(request: Request) -> Database:
+    return _services(request).db
+
+
+def get_async_database(request: Request) -> AsyncDatabase:
+    return _services(request).adb
+
+
+def get_stock_service(request: Request) -> StockService:
+    return _services(request).stock_service
+
+
+def get_stock_price_service(request: Request) -> StockPriceService:
+    return _services(request).stock_price_service
+
+
+def get_current_price_service(request: Request) -> StockCurrentPriceService:
+    return _services(request).current_price_service
+
+
+def get_overseas_price_service(request: Request) -> OverseaStockPriceService:
+    return _services(request).overseas_price_service
+
+
+def get_watchlist_service(request: Request) -> WatchListService:
+    return _services(request).watchlist_service
+
+
+def get_portfolio_service(request: Request) -> PortfolioService:
+    return _services(request).portfolio_service
@@ -9,23 +9,27 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.dependencies import init_services
 from app.routers import portfolio
 from app.routers import stocks
 from app.routers import watchlists
 from db import Database
+from db.database import close_pools
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 시작/종료 시 실행"""
-    # 시작 시: DB 테이블 생성
-    db = Database()
-    db.connect()
-    db.create_tables()
-    db.close()
+    # 시작 시: DB 테이블 생성 + 앱 단위 서비스 등록 (요청마다 DDL을 실행하지 않음)
+    services = init_services(app, Database())
     print("✅ Database initialized")
+    # watch list·보유 종목 현재가 백그라운드 갱신 (WATCHER_PRICE_REFRESH_SEC=0이면 사용 안 함)
+    if services.price_refresher.start():
+        print("🔄 Price refresher started")
     yield
-    # 종료 시
+    # 종료 시: 백그라운드 갱신 중지, 버퍼된 현재가 기록, DB 스레드와 공유 연결 정리
+    await services.aclose()
+    close_pools()
     print("👋 Shutting down...")
 
 
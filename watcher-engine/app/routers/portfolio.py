@@ -1,9 +1,11 @@
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
+from app.dependencies import get_async_database, get_portfolio_service
 from app.services.portfolio_service import PortfolioService
+from db import AsyncDatabase
 
 router = APIRouter()
 
@@ -25,11 +27,15 @@ class SellRequest(BaseModel):
 
 
 @router.post("/buy", tags=["Portfolio"])
-async def buy_stock(request: BuyRequest):
+async def buy_stock(
+    request: BuyRequest,
+    service: PortfolioService = Depends(get_portfolio_service),
+    adb: AsyncDatabase = Depends(get_async_database),
+):
     """주식 매수 - 새로운 Lot 생성"""
-    service = PortfolioService()
     try:
-        result = service.buy_stock(
+        result = await adb.write(
+            service.buy_stock,
             stock_code=request.stock_code,
             quantity=request.quantity,
             price=request.price,
@@ -42,11 +48,15 @@ async def buy_stock(request: BuyRequest):
 
 
 @router.post("/sell", tags=["Portfolio"])
-async def sell_stock(request: SellRequest):
+async def sell_stock(
+    request: SellRequest,
+    service: PortfolioService = Depends(get_portfolio_service),
+    adb: AsyncDatabase = Depends(get_async_database),
+):
     """주식 매도 - FIFO 계산 및 실현 손익 기록"""
-    service = PortfolioService()
     try:
-        result = service.sell_stock(
+        result = await adb.write(
+            service.sell_stock,
             stock_code=request.stock_code,
             quantity=request.quantity,
             price=request.price,
@@ -59,18 +69,22 @@ async def sell_stock(request: SellRequest):
 
 
 @router.get("/holdings", tags=["Portfolio"])
-async def get_holdings():
+async def get_holdings(
+    service: PortfolioService = Depends(get_portfolio_service),
+    adb: AsyncDatabase = Depends(get_async_database),
+):
     """현재 보유 중인 종목 목록 조회"""
-    service = PortfolioService()
-    holdings = service.get_holdings()
+    holdings = await adb.read(service.get_holdings)
     return {"success": True, "data": holdings}
 
 
 @router.get("/pnl", tags=["Portfolio"])
-async def get_pnl_summary():
+async def get_pnl_summary(
+    service: PortfolioService = Depends(get_portfolio_service),
+    adb: AsyncDatabase = Depends(get_async_database),
+):
     """포트폴리오 손익 요약 조회"""
-    service = PortfolioService()
-    summary = service.get_pnl_summary()
+    summary = await adb.read(service.get_pnl_summary)
     return {"success": True, "data": summary}
 
 
@@ -78,14 +92,15 @@ async def get_pnl_summary():
 async def get_trades(
     stock_code: Optional[str] = None,
     trade_type: Optional[str] = None,
+    service: PortfolioService = Depends(get_portfolio_service),
+    adb: AsyncDatabase = Depends(get_async_database),
 ):
     """거래 내역 조회
 
     - stock_code: 종목 코드 필터 (선택)
     - trade_type: BUY 또는 SELL 필터 (선택)
     """
-    service = PortfolioService()
-    trades = service.get_trades(stock_code=stock_code, trade_type=trade_type)
+    trades = await adb.read(service.get_trades, stock_code=stock_code, trade_type=trade_type)
     trades_dict = [
         {
             "id": t.id,
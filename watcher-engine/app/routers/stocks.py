@@ -1,11 +1,19 @@
 """종목 API 라우터"""
 
-from fastapi import APIRouter, HTTPException, Query
-
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.dependencies import (
+    get_async_database,
+    get_current_price_service,
+    get_overseas_price_service,
+    get_stock_price_service,
+    get_stock_service,
+)
 from app.services.stock_current_price_service import StockCurrentPriceService
 from app.services.stock_price_service import StockPriceService
 from app.services.stock_service import StockService
 from app.services.oversea_stock_price_service import OverseaStockPriceService
+from db import AsyncDatabase
 from external.client import APIError
 
 
@@ -18,6 +26,8 @@ async def list_stocks(
     exchange: str | None = Query(None, description="거래소 필터 (KRX/NXT)"),
     limit: int = Query(100, ge=1, le=1000, description="조회 개수"),
     offset: int = Query(0, ge=0, description="시작 위치"),
+    service: StockService = Depends(get_stock_service),
+    adb: AsyncDatabase = Depends(get_async_database),
 ):
     """
     종목 목록 조회
@@ -27,44 +37,58 @@ async def list_stocks(
     - **limit**: 조회 개수 (최대 1000)
     - **offset**: 페이징 오프셋
     """
-    service = StockService()
-    stocks = service.get_stocks(
+    stocks = await adb.read(
+        service.get_stocks,
         market=market, exchange=exchange, limit=limit, offset=offset
     )
     return {"stocks": stocks, "count": len(stocks)}
 
 
 @router.get("/stats")
-async def get_stats():
+async def get_stats(
+    service: StockService = Depends(get_stock_service),
+    adb: AsyncDatabase = Depends(get_async_database),
+):
     """종목 통계 조회"""
-    service = StockService()
-    return service.get_stats()
+    return await adb.read(service.get_stats)
+
+
+@router.get("/cache/stats")
+async def get_price_cache_stats(
+    service: StockCurrentPriceService = Depends(get_current_price_service),
+):
+    """현재가 L1 캐시 통계 (적중/미스/동시 조회 병합 수)"""
+    return service.cache.stats()
 
 
 @router.get("/search")
 async def search_stocks(
     q: str = Query(..., min_length=1, description="검색어 (종목명 또는 코드)"),
     limit: int = Query(20, ge=1, le=100, description="조회 개수"),
+    service: StockService = Depends(get_stock_service),
+    adb: AsyncDatabase = Depends(get_async_database),
 ):
     """
     종목 검색
 
     - **q**: 검색어 (종목명 또는 코드에서 검색)
     """
-    service = StockService()
-    stocks = service.search_stocks(query=q, limit=limit)
+    stocks = await adb.read(service.search_stocks, query=q, limit=limit)
     return {"stocks": stocks, "count": len(stocks)}
 
 
 @router.get("/{code}")
-async def get_stock(code: str):
+async def get_stock(
+    code: str,
+    service: StockService = Depends(get_stock_service),
+    adb: AsyncDatabase = Depends(get_async_database),
+):
     """
     종목 상세 조회
 
     - **code**: 종목 코드 (예: 005930)
     """
-    service = StockService()
-    stock = service.get_stock_by_code(code)
+    stock = await adb.read(service.get_stock_by_code, code)
 
     if not stock:
         raise HTTPException(status_code=404, detail=f"종목을 찾을 수 없습니다: {code}")
@@ -81,6 +105,7 @@ async def get_periodic_prices(
     market: str = Query("J", description="시장 구분 (J/NX/UN)"),
     adj_price: bool = Query(True, description="수정주가 여부 (True: 수정주가)"),
     use_cache: bool = Query(True, description="DB 캐시 사용 여부"),
+    service: StockPriceService = Depends(get_stock_price_service),
 ):
     """
     종목 기간별 시세 조회
@@ -90,7 +115,6 @@ async def get_periodic_prices(
     - **end_date**: 조회 종료일 (YYYYMMDD)
     - **period**: D(일)/W(주)/M(월)/Y(년)
     """
-    service = StockPriceService()
     try:
         return await service.get_periodic_prices(
             stock_code=code,
@@ -114,6 +138,10 @@ async def get_current_price(
     market: str = Query("J", description="시장 구분 (J/NX/UN)"),
     use_cache: bool = Query(False, description="DB 캐시 사용 여부"),
     max_age_sec: int | None = Query(None, ge=0, description="캐시 허용 최대 경과초"),
+    stale_while_revalidate_sec: int | None = Query(
+        None, ge=0, description="max_age_sec 초과 후 오래된 값을 반환하며 백그라운드 갱신할 추가 허용초"
+    ),
+    service: StockCurrentPriceService = Depends(get_current_price_service),
 ):
     """
     종목 현재가 조회
@@ -121,13 +149,13 @@ async def get_current_price(
     - **code**: 종목 코드 (예: 005930)
     - **market**: J(KRX)/NX(NXT)/UN(통합)
     """
-    service = StockCurrentPriceService()
     try:
         return await service.get_current_price(
             stock_code=code,
             market=market,
             use_cache=use_cache,
             max_age_sec=max_age_sec,
+            stale_while_revalidate_sec=stale_while_revalidate_sec,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -141,6 +169,10 @@ async def get_combined_price(
     code: str,
     use_cache: bool = Query(False, description="DB 캐시 사용 여부"),
     max_age_sec: int | None = Query(None, ge=0, description="캐시 허용 최대 경과초"),
+    stale_while_revalidate_sec: int | None = Query(
+        None, ge=0, description="max_age_sec 초과 후 오래된 값을 반환하며 백그라운드 갱신할 추가 허용초"
+    ),
+    service: StockCurrentPriceService = Depends(get_current_price_service),
 ):
     """
     KRX와 NXT 통합 시세 조회
@@ -148,12 +180,12 @@ async def get_combined_price(
     - **code**: 종목 코드 (예: 005930)
     - 현재 활성 거래소 정보와 최적 가격 포함
     """
-    service = StockCurrentPriceService()
     try:
         return await service.get_combined_price(
             stock_code=code,
             use_cache=use_cache,
             max_age_sec=max_age_sec,
+            stale_while_revalidate_sec=stale_while_revalidate_sec,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -163,14 +195,16 @@ async def get_combined_price(
 
 
 @router.post("/load")
-async def load_stocks():
+async def load_stocks(
+    service: StockService = Depends(get_stock_service),
+    adb: AsyncDatabase = Depends(get_async_database),
+):
     """
     종목 데이터 로드
 
     docs/stocks 폴더의 파일에서 종목 정보를 읽어 DB에 저장합니다.
     """
-    service = StockService()
-    result = service.load_stocks_from_files()
+    result = await adb.write(service.load_stocks_from_files)
     return {
         "message": "종목 데이터 로드 완료",
         **result,
@@ -181,6 +215,7 @@ async def load_stocks():
 async def get_overseas_current_price(
     exchange: str,
     symbol: str,
+    service: OverseaStockPriceService = Depends(get_overseas_price_service),
 ):
     """
     해외주식 현재가상세 조회
@@ -188,7 +223,6 @@ async def get_overseas_current_price(
     - **exchange**: 거래소 코드 (NAS: 나스닥, NYS: 뉴욕)
     - **symbol**: 종목코드 (예: TSLA, AAPL, NVDA)
     """
-    service = OverseaStockPriceService()
     try:
         return await service.get_current_price(
             symbol=symbol,
@@ -208,6 +242,7 @@ async def get_overseas_periodic_prices(
     end_date: str = Query(..., description="조회 종료일 (YYYYMMDD 또는 YYYY-MM-DD)"),
     period: str = Query("D", description="기간 구분 (D/W/M/Y)"),
     market_code: str = Query("N", description="시장 구분 (N: 지수, X: 환율, I: 국채, S: 금선물)"),
+    service: OverseaStockPriceService = Depends(get_overseas_price_service),
 ):
     """
     해외 종목/지수/환율 기간별 시세 조회
@@ -218,7 +253,6 @@ async def get_overseas_periodic_prices(
     - **period**: D(일)/W(주)/M(월)/Y(년)
     - **market_code**: N(지수)/X(환율)/I(국채)/S(금선물)
     """
-    service = OverseaStockPriceService()
     try:
         return await service.get_periodic_prices(
             symbol=symbol,
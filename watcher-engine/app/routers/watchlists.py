@@ -1,18 +1,22 @@
 """Watch list API 라우터."""
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 
+from app.dependencies import get_async_database, get_watchlist_service
 from app.services.watchlist_service import WatchListService
+from db import AsyncDatabase
 
 
 router = APIRouter()
 
 
 @router.get("")
-async def list_watchlists():
+async def list_watchlists(
+    service: WatchListService = Depends(get_watchlist_service),
+    adb: AsyncDatabase = Depends(get_async_database),
+):
     """Watch list 목록 조회."""
-    service = WatchListService()
-    watchlists = service.list_watchlists()
+    watchlists = await adb.read(service.list_watchlists)
     return {"watchlists": watchlists, "count": len(watchlists)}
 
 
@@ -20,11 +24,12 @@ async def list_watchlists():
 async def create_watchlist(
     name: str = Query(..., min_length=1, description="watch list 이름"),
     description: str | None = Query(None, description="설명"),
+    service: WatchListService = Depends(get_watchlist_service),
+    adb: AsyncDatabase = Depends(get_async_database),
 ):
     """Watch list 생성 (기본 폴더 포함)."""
-    service = WatchListService()
     try:
-        return service.create_watchlist(name=name, description=description)
+        return await adb.write(service.create_watchlist, name=name, description=description)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -34,36 +39,43 @@ async def get_watchlist(
     watchlist_id: int,
     include_folders: bool = Query(True, description="폴더 포함 여부"),
     include_items: bool = Query(False, description="종목 포함 여부"),
+    service: WatchListService = Depends(get_watchlist_service),
+    adb: AsyncDatabase = Depends(get_async_database),
 ):
     """Watch list 상세 조회."""
-    service = WatchListService()
-    watchlist = service.get_watchlist(watchlist_id)
+    watchlist = await adb.read(service.get_watchlist, watchlist_id)
     if not watchlist:
         raise HTTPException(status_code=404, detail="watch list를 찾을 수 없습니다.")
 
     if include_folders:
-        folders = service.list_folders(watchlist_id)
+        folders = await adb.read(service.list_folders, watchlist_id)
         watchlist["folders"] = folders
         if include_items:
-            items = service.list_items(watchlist_id)
+            items = await adb.read(service.list_items, watchlist_id)
             watchlist["items"] = items
 
     return watchlist
 
 
 @router.delete("/{watchlist_id}")
-async def delete_watchlist(watchlist_id: int):
+async def delete_watchlist(
+    watchlist_id: int,
+    service: WatchListService = Depends(get_watchlist_service),
+    adb: AsyncDatabase = Depends(get_async_database),
+):
     """Watch list 삭제."""
-    service = WatchListService()
-    service.delete_watchlist(watchlist_id)
+    await adb.write(service.delete_watchlist, watchlist_id)
     return {"message": "watch list 삭제 완료"}
 
 
 @router.get("/{watchlist_id}/folders")
-async def list_folders(watchlist_id: int):
+async def list_folders(
+    watchlist_id: int,
+    service: WatchListService = Depends(get_watchlist_service),
+    adb: AsyncDatabase = Depends(get_async_database),
+):
     """폴더 목록 조회."""
-    service = WatchListService()
-    folders = service.list_folders(watchlist_id)
+    folders = await adb.read(service.list_folders, watchlist_id)
     return {"folders": folders, "count": len(folders)}
 
 
@@ -72,11 +84,12 @@ async def create_folder(
     watchlist_id: int,
     name: str = Query(..., min_length=1, description="폴더 이름"),
     description: str | None = Query(None, description="설명"),
+    service: WatchListService = Depends(get_watchlist_service),
+    adb: AsyncDatabase = Depends(get_async_database),
 ):
     """폴더 생성."""
-    service = WatchListService()
     try:
-        return service.create_folder(watchlist_id, name, description)
+        return await adb.write(service.create_folder, watchlist_id, name, description)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -87,11 +100,12 @@ async def update_folder(
     folder_id: int,
     name: str | None = Query(None, description="폴더 이름"),
     description: str | None = Query(None, description="설명"),
+    service: WatchListService = Depends(get_watchlist_service),
+    adb: AsyncDatabase = Depends(get_async_database),
 ):
     """폴더 수정."""
-    service = WatchListService()
     try:
-        result = service.update_folder(watchlist_id, folder_id, name, description)
+        result = await adb.write(service.update_folder, watchlist_id, folder_id, name, description)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -102,11 +116,15 @@ async def update_folder(
 
 
 @router.delete("/{watchlist_id}/folders/{folder_id}")
-async def delete_folder(watchlist_id: int, folder_id: int):
+async def delete_folder(
+    watchlist_id: int,
+    folder_id: int,
+    service: WatchListService = Depends(get_watchlist_service),
+    adb: AsyncDatabase = Depends(get_async_database),
+):
     """폴더 삭제."""
-    service = WatchListService()
     try:
-        service.delete_folder(watchlist_id, folder_id)
+        await adb.write(service.delete_folder, watchlist_id, folder_id)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     return {"message": "폴더 삭제 완료"}
@@ -116,10 +134,11 @@ async def delete_folder(watchlist_id: int, folder_id: int):
 async def list_items(
     watchlist_id: int,
     folder_id: int | None = Query(None, description="폴더 ID"),
+    service: WatchListService = Depends(get_watchlist_service),
+    adb: AsyncDatabase = Depends(get_async_database),
 ):
     """watch list 종목 목록 조회."""
-    service = WatchListService()
-    items = service.list_items(watchlist_id, folder_id)
+    items = await adb.read(service.list_items, watchlist_id, folder_id)
     return {"items": items, "count": len(items)}
 
 
@@ -129,11 +148,12 @@ async def add_item(
     stock_code: str = Query(..., min_length=1, description="종목 코드"),
     folder_id: int | None = Query(None, description="폴더 ID (없으면 최상위)"),
     memo: str | None = Query(None, description="메모"),
+    service: WatchListService = Depends(get_watchlist_service),
+    adb: AsyncDatabase = Depends(get_async_database),
 ):
     """watch list 종목 추가."""
-    service = WatchListService()
     try:
-        return service.add_item(watchlist_id, stock_code, folder_id, memo)
+        return await adb.write(service.add_item, watchlist_id, stock_code, folder_id, memo)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -144,15 +164,18 @@ async def list_items_summary(
     folder_id: int | None = Query(None, description="폴더 ID"),
     use_cache: bool = Query(True, description="DB 캐시 사용 여부"),
     max_age_sec: int | None = Query(None, ge=0, description="캐시 허용 최대 경과초"),
+    stale_while_revalidate_sec: int | None = Query(
+        None, ge=0, description="max_age_sec 초과 후 오래된 값을 반환하며 백그라운드 갱신할 추가 허용초"
+    ),
     refresh_missing: bool = Query(False, description="캐시 누락 시 실시간 조회"),
     market: str = Query("J", description="시장 구분 (J/NX)"),
     include_nxt: bool = Query(False, description="NXT 시세 추가 포함"),
+    service: WatchListService = Depends(get_watchlist_service),
 ):
     """watch list 종목 + 현재가 요약 조회.
 
     - **include_nxt**: True면 NXT 시세도 함께 조회하여 nxt_* 필드에 포함
     """
-    service = WatchListService()
     try:
         items = await service.list_items_with_price(
             watchlist_id=watchlist_id,
@@ -162,6 +185,7 @@ async def list_items_summary(
             refresh_missing=refresh_missing,
             market=market,
             include_nxt=include_nxt,
+            stale_while_revalidate_sec=stale_while_revalidate_sec,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -170,8 +194,12 @@ async def list_items_summary(
 
 
 @router.delete("/{watchlist_id}/items/{item_id}")
-async def delete_item(watchlist_id: int, item_id: int):
+async def delete_item(
+    watchlist_id: int,
+    item_id: int,
+    service: WatchListService = Depends(get_watchlist_service),
+    adb: AsyncDatabase = Depends(get_async_database),
+):
     """watch list 종목 삭제."""
-    service = WatchListService()
-    service.delete_item(watchlist_id, item_id)
+    await adb.write(service.delete_item, watchlist_id, item_id)
     return {"message": "종목 삭제 완료"}
@@ -0,0 +1,176 @@
+"""시장 세션과 세션 기반 현재가 캐시 TTL 정책."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, timezone
+from typing import Callable
+from zoneinfo import ZoneInfo
+
+KST = ZoneInfo("Asia/Seoul")
+US_EASTERN = ZoneInfo("America/New_York")
+
+# 거래 시간대 (분 단위, 현지 시각, [시작, 종료))
+KRX_WINDOWS = ((9 * 60, 15 * 60 + 30),)  # 정규장 09:00-15:30 (15:20 이후 종가 단일가)
+NXT_WINDOWS = (
+    (8 * 60, 8 * 60 + 50),  # 프리마켓 08:00-08:50
+    (9 * 60, 15 * 60 + 20),  # 메인마켓 09:00-15:20
+    (15 * 60 + 40, 20 * 60),  # 애프터마켓 15:40-20:00
+)
+KR_UNIFIED_WINDOWS = (
+    (8 * 60, 8 * 60 + 50),
+    (9 * 60, 15 * 60 + 30),
+    (15 * 60 + 40, 20 * 60),
+)
+US_DEFAULT_WINDOW = (9 * 60 + 30, 16 * 60)  # 09:30-16:00 (미 동부)
+MINUTES_PER_DAY = 24 * 60
+
+# 종가가 확정되기까지 거래소 시각과 KIS 응답 사이의 여유
+CLOSE_SETTLE_SEC = 60
+
+
+def _minute_of_day(value: datetime) -> int:
+    return value.hour * 60 + value.minute
+
+
+def _in_windows(minute: int, windows: tuple[tuple[int, int], ...]) -> bool:
+    return any(start <= minute < end for start, end in windows)
+
+
+def get_active_exchanges(current_time: datetime) -> list[str]:
+    """시각(KST)에 거래 중인 국내 거래소 목록."""
+    minute = _minute_of_day(current_time)
+    return [
+        exchange
+        for exchange, windows in (("KRX", KRX_WINDOWS), ("NXT", NXT_WINDOWS))
+        if _in_windows(minute, windows)
+    ]
+
+
+def _parse_hhmm(value: str | None) -> int | None:
+    if not value:
+        return None
+    value = value.strip()
+    if not value.isdigit() or len(value) > 4:
+        return None
+    hour, minute = divmod(int(value), 100)
+    if hour == 24 and minute == 0:
+        return MINUTES_PER_DAY
+    if hour > 23 or minute > 59:
+        return None
+    return hour * 60 + minute
+
+
+@dataclass(frozen=True)
+class MarketSession:
+    """하루 거래 시간대 (주말 휴장, 공휴일은 고려하지 않음)."""
+
+    tz: ZoneInfo
+    windows: tuple[tuple[int, int], ...]
+
+    def is_open(self, now: datetime) -> bool:
+        local = now.astimezone(self.tz)
+        if local.weekday() >= 5:
+            return False
+        return _in_windows(_minute_of_day(local), self.windows)
+
+    def last_close(self, now: datetime) -> datetime | None:
+        """``now`` 이전에 가장 최근 끝난 거래 시간대의 종료 시각."""
+        local = now.astimezone(self.tz)
+        minute = _minute_of_day(local)
+        for days_ago in range(8):
+            day = local.date() - timedelta(days=days_ago)
+            if day.weekday() >= 5:
+                continue
+            for _, end in reversed(self.windows):
+                if days_ago == 0 and end > minute:
+                    continue
+                # 2400(=1440분) 종료는 다음 날 0시
+                return datetime.combine(day, time(0), tzinfo=self.tz) + timedelta(minutes=end)
+        return None
+
+
+KR_SESSIONS = {
+    "J": MarketSession(KST, KRX_WINDOWS),
+    "NX": MarketSession(KST, NXT_WINDOWS),
+    "UN": MarketSession(KST, KR_UNIFIED_WINDOWS),
+}
+
+
+def us_session(session_start: str | None = None, session_end: str | None = None) -> MarketSession:
+    """종목 마스터의 ``mstm``/``metm``(HHMM, 미 동부 시각)으로 미국 정규장 구성."""
+    start = _parse_hhmm(session_start)
+    end = _parse_hhmm(session_end)
+    if start is None or end is None or start >= end:
+        start, end = US_DEFAULT_WINDOW
+    return MarketSession(US_EASTERN, ((start, end),))
+
+
+class PriceTTLPolicy:
+    """시장 세션에 따른 현재가 캐시 허용 경과초.
+
+    - 장중에는 요청한 ``max_age_sec``를 그대로 사용합니다.
+    - 장 종료 후 다음 장 시작 전까지는 마지막 종료 이후에 받은 시세를 모두 유효로 봅니다.
+      (종가가 바뀌지 않으므로 KIS를 다시 호출하지 않음)
+    - ``max_age_sec``가 None이면 기존과 같이 경과 시간을 보지 않습니다.
+    """
+
+    def __init__(
+        self,
+        settle_sec: float = CLOSE_SETTLE_SEC,
+        clock: Callable[[], datetime] | None = None,
+    ):
+        self.settle_sec = settle_sec
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+
+    def session_for(
+        self,
+        market: str,
+        session_start: str | None = None,
+        session_end: str | None = None,
+    ) -> MarketSession:
+        """시장 코드(J/NX/UN 또는 해외 거래소 코드)의 거래 세션."""
+        session = KR_SESSIONS.get(market.upper())
+        if session is not None:
+            return session
+        return us_session(session_start, session_end)
+
+    def is_open(
+        self,
+        market: str,
+        now: datetime | None = None,
+        session_start: str | None = None,
+        session_end: str | None = None,
+    ) -> bool:
+        now = self._now(now)
+        return self.session_for(market, session_start, session_end).is_open(now)
+
+    def max_age_sec(
+        self,
+        market: str,
+        requested: float | None,
+        now: datetime | None = None,
+        session_start: str | None = None,
+        session_end: str | None = None,
+    ) -> float | None:
+        """세션을 반영한 캐시 허용 경과초."""
+        if requested is None:
+            return None
+
+        now = self._now(now)
+        session = self.session_for(market, session_start, session_end)
+        if session.is_open(now):
+            return requested
+
+        closed_at = session.last_close(now)
+        if closed_at is None:
+            return requested
+        closed_for = (now - closed_at).total_seconds() - self.settle_sec
+        return max(float(requested), closed_for)
+
+    def _now(self, now: datetime | None) -> datetime:
+        if now is None:
+            now = self.clock()
+        if now.tzinfo is None:
+            return now.replace(tzinfo=KST)
+        return now
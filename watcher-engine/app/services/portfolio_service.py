@@ -14,7 +14,7 @@ class PortfolioService:
 
     def __init__(self, db: Database | None = None):
         self.db = db or Database()
-        self.db.create_tables()
+        self.db.ensure_schema()
 
     def buy_stock(
         self,
@@ -113,10 +113,7 @@ class PortfolioService:
         if remaining_to_sell != 0:
             raise RuntimeError("FIFO 매칭 계산에 실패했습니다.")
 
-        conn = self.db.connect()
-        try:
-            conn.execute("BEGIN")
-
+        with self.db.transaction() as conn:
             for lot_id, new_remaining_qty, is_closed in lot_updates:
                 conn.execute(
                     """
@@ -153,11 +150,6 @@ class PortfolioService:
                 ),
             )
 
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-
         return {
             "trade_id": int(cursor.lastrowid),
             "realized_pnl": realized_pnl,
@@ -166,7 +158,7 @@ class PortfolioService:
 
     def get_holdings(self) -> list[dict]:
         """현재 보유 중인 종목 목록 조회."""
-        conn = self.db.connect()
+        conn = self.db.read_connection()
         cursor = conn.execute(
             """
             SELECT
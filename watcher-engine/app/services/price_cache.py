@@ -0,0 +1,191 @@
+"""현재가 L1 캐시 (TTL + LRU) 와 single-flight 조회."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import math
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from db.price_codec import decompress_payload, extract_summary, summary_to_payload
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_TTL_SEC = 5.0
+
+
+@dataclass
+class CachedPrice:
+    """L1 캐시 항목.
+
+    ``summary``는 요약 컬럼(가격, 대비, 등락률, 거래량, 거래대금) 값이고,
+    원본 payload(``price``)는 DB에서 읽은 항목이면 처음 접근할 때 압축을 풉니다.
+    """
+
+    market: str
+    summary: dict
+    updated_at: str | None
+    fetched_at: float
+    stored_at: float
+    payload: dict | None = None
+    raw_payload: bytes | None = None
+
+    @property
+    def price(self) -> dict:
+        if self.payload is None:
+            payload = decompress_payload(self.raw_payload)
+            self.payload = payload or summary_to_payload(self.summary, self.market)
+            self.raw_payload = None
+        return self.payload
+
+
+class PriceCache:
+    """``stock_price_current`` 앞단의 프로세스 내 현재가 캐시.
+
+    - 항목은 ``ttl_sec`` 동안 유지되고, ``max_entries``를 넘으면 가장 오래 쓰지 않은
+      항목부터 제거합니다(LRU).
+    - 같은 (종목, 시장)에 대한 동시 조회는 ``load``로 진행 중인 Future 하나를 공유합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_sec: float = DEFAULT_TTL_SEC,
+        clock: Callable[[], float] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self.clock = clock or time.monotonic
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[str, str], CachedPrice] = OrderedDict()
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+
+    def get(
+        self,
+        stock_code: str,
+        market: str,
+        max_age_sec: float | None = None,
+    ) -> CachedPrice | None:
+        """유효한 캐시 항목 조회 (``max_age_sec``는 데이터 자체의 경과 시간 기준)."""
+        key = (stock_code, market)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        now = self.clock()
+        if now - entry.stored_at > self.ttl_sec:
+            del self._entries[key]
+            self.misses += 1
+            return None
+        if max_age_sec is not None and now - entry.fetched_at > max_age_sec:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def peek(self, stock_code: str, market: str) -> CachedPrice | None:
+        """계측 값과 LRU 순서를 바꾸지 않고 항목 확인 (TTL이 지난 항목도 반환)."""
+        return self._entries.get((stock_code, market))
+
+    def put(
+        self,
+        stock_code: str,
+        market: str,
+        price: dict | None,
+        updated_at: str | None,
+        age_sec: float = 0.0,
+        summary: dict | None = None,
+        raw_payload: bytes | None = None,
+    ) -> CachedPrice:
+        """캐시 항목 저장 (``age_sec``: 저장 시점에 이미 지난 데이터 경과 시간)."""
+        now = self.clock()
+        entry = CachedPrice(
+            market=market,
+            summary=summary if summary is not None else extract_summary(price),
+            updated_at=updated_at,
+            fetched_at=now - age_sec,
+            stored_at=now,
+            payload=price,
+            raw_payload=raw_payload,
+        )
+        key = (stock_code, market)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def age_sec(self, entry: CachedPrice) -> float | None:
+        """항목 데이터의 경과 시간(초), 알 수 없으면 None."""
+        age = self.clock() - entry.fetched_at
+        if not math.isfinite(age):
+            return None
+        return round(max(age, 0.0), 3)
+
+    def is_loading(self, stock_code: str, market: str) -> bool:
+        return (stock_code, market) in self._inflight
+
+    def invalidate(self, stock_code: str, market: str) -> None:
+        self._entries.pop((stock_code, market), None)
+
+    async def load(
+        self,
+        stock_code: str,
+        market: str,
+        loader: Callable[[], Awaitable[T]],
+    ) -> T:
+        """같은 키의 동시 조회를 하나의 loader 호출로 합침.
+
+        먼저 시작한 호출이 취소되면 기다리던 호출은 취소를 넘겨받지 않고 다시 조회합니다.
+        """
+        key = (stock_code, market)
+        while (future := self._inflight.get(key)) is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> dict:
+        """캐시 계측 값."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_sec": self.ttl_sec,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "inflight": len(self._inflight),
+        }
@@ -0,0 +1,245 @@
+"""watch list·보유 종목 현재가 백그라운드 갱신."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from typing import Callable
+
+from app.services.watchlist_service import WatchListService
+from external.client import RateLimiter
+from external.kis import MULTI_PRICE_LIMIT, get_kis_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SEC = 10.0
+DEFAULT_MAX_CALLS_PER_SEC = 4.0
+# 갱신에 실패한 종목은 이 시간 동안 다시 호출하지 않음 (상장폐지 등으로 다른 종목 예산을 쓰지 않도록)
+FAILURE_BACKOFF_SEC = 60.0
+
+
+class PriceRefresher:
+    """watch list와 보유(미청산) 종목 현재가를 주기적으로 ``stock_price_current``에 갱신.
+
+    - 주기마다 추적 종목 전체의 저장 시각을 한 번에 읽고, 세션 TTL 정책상 만료된 키만
+      갱신합니다. 장중에는 ``interval_sec``마다, 장 종료 후에는 종가를 한 번 받은 뒤
+      다음 장 시작 전까지 호출하지 않습니다.
+    - KIS 호출은 요청 경로와 같은 클라이언트의 초당 호출 제한(``RateLimiter``)을 거칩니다.
+      한 주기 호출 수는 ``max_calls_per_sec * interval_sec``와 그 제한의 남은 여유 중 작은 값으로
+      정하고, 오래된 값부터 갱신합니다. KRX(J) 종목은 ``MULTI_PRICE_LIMIT``개를 한 번 호출로 셉니다.
+    - 국내 종목은 KRX(J)와, NXT 상장 종목이면 NXT(NX) 시세를 함께 갱신합니다.
+    """
+
+    def __init__(
+        self,
+        watchlist_service: WatchListService,
+        interval_sec: float = DEFAULT_INTERVAL_SEC,
+        max_calls_per_sec: float = DEFAULT_MAX_CALLS_PER_SEC,
+        clock: Callable[[], float] = time.monotonic,
+        rate_limiter: RateLimiter | None = None,
+    ):
+        self.watchlist_service = watchlist_service
+        self.price_service = watchlist_service.price_service
+        self.ttl_policy = watchlist_service.ttl_policy
+        self.db = watchlist_service.db
+        self.adb = watchlist_service.adb
+        self.interval_sec = interval_sec
+        self.max_calls_per_sec = max_calls_per_sec
+        self.clock = clock
+        self.rate_limiter = rate_limiter
+        self.runs = 0
+        self.last_result: dict | None = None
+        self._failed_until: dict[tuple[str, str], float] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval_sec > 0
+
+    @property
+    def budget(self) -> int:
+        """한 주기 최대 KIS 호출 수 (공유 호출 제한의 여유는 반영하지 않음)."""
+        return max(1, int(self.max_calls_per_sec * self.interval_sec))
+
+    def cycle_budget(self) -> int:
+        """이번 주기 KIS 호출 수 (요청 경로가 이미 쓴 호출 제한 여유를 뺀 값)."""
+        limiter = self._shared_rate_limiter()
+        available = limiter.available(self.interval_sec) if limiter is not None else None
+        if available is None:
+            return self.budget
+        return min(self.budget, available)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> bool:
+        """백그라운드 갱신 시작 (비활성이거나 이미 실행 중이면 생략)."""
+        if not self.enabled or self.running:
+            return False
+        self._task = asyncio.create_task(self._run())
+        return True
+
+    async def stop(self) -> None:
+        """진행 중인 갱신을 취소하고 종료될 때까지 대기."""
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def refresh_once(self) -> dict:
+        """만료된 추적 종목 현재가를 예산 안에서 한 번 갱신."""
+        targets, exchanges = await self.adb.read(self._get_targets)
+        self._prune_failures(targets)
+        due = await self._due_keys(targets, exchanges)
+        batch = self._within_budget(due, exchanges, self.cycle_budget())
+
+        results = await self.watchlist_service.refresh_prices(batch, exchanges)
+        now = self.clock()
+        failed = 0
+        for key in batch:
+            source = results.get(key, ({}, "error"))[1]
+            if source == "error":
+                failed += 1
+                self._failed_until[key] = now + FAILURE_BACKOFF_SEC
+            else:
+                self._failed_until.pop(key, None)
+        if failed:
+            logger.warning("현재가 백그라운드 갱신 실패 %d건 (대상 %d건)", failed, len(batch))
+
+        self.runs += 1
+        self.last_result = {
+            "tracked": len(targets),
+            "due": len(due),
+            "refreshed": len(batch) - failed,
+            "failed": failed,
+        }
+        return self.last_result
+
+    @staticmethod
+    def _within_budget(
+        due: list[tuple[str, str]],
+        exchanges: dict[tuple[str, str], str | None],
+        budget: int,
+    ) -> list[tuple[str, str]]:
+        """호출 수 예산 안에서 갱신할 키 (KRX 키는 ``MULTI_PRICE_LIMIT``개마다 한 번 호출로 셈)."""
+        selected = []
+        calls = 0
+        batched = 0
+        for key in due:
+            batchable = WatchListService._is_batchable(key, exchanges)
+            cost = 0 if batchable and batched % MULTI_PRICE_LIMIT else 1
+            if calls + cost > budget:
+                continue
+            calls += cost
+            batched += batchable
+            selected.append(key)
+        return selected
+
+    def _prune_failures(self, targets: dict[tuple[str, str], dict]) -> None:
+        """더 이상 추적하지 않거나 대기 시간이 지난 실패 기록 삭제."""
+        now = self.clock()
+        self._failed_until = {
+            key: until for key, until in self._failed_until.items() if key in targets and until > now
+        }
+
+    def _shared_rate_limiter(self) -> RateLimiter | None:
+        """요청 경로와 공유하는 KIS 클라이언트의 호출 제한 (클라이언트를 만들 수 없으면 None)."""
+        if self.rate_limiter is None:
+            client = self.price_service.client
+            if client is None:
+                try:
+                    client = self.price_service.client = get_kis_client()
+                except ValueError:
+                    return None
+            self.rate_limiter = getattr(client, "rate_limiter", None)
+        return self.rate_limiter
+
+    async def _run(self) -> None:
+        while True:
+            started = self.clock()
+            try:
+                await self.refresh_once()
+            except Exception:
+                logger.exception("현재가 백그라운드 갱신 오류")
+            await asyncio.sleep(max(self.interval_sec - (self.clock() - started), 0.0))
+
+    async def _due_keys(
+        self,
+        targets: dict[tuple[str, str], dict],
+        exchanges: dict[tuple[str, str], str | None],
+    ) -> list[tuple[str, str]]:
+        """세션 정책상 만료된 키 (오래된 순, 받은 적 없는 키 먼저)."""
+        now = self.clock()
+        ages = await self.price_service.get_price_ages(list(targets))
+        due = []
+        for key, meta in targets.items():
+            if key in exchanges and exchanges[key] is None:
+                continue
+            if self._failed_until.get(key, 0.0) > now:
+                continue
+            max_age = self.ttl_policy.max_age_sec(
+                key[1],
+                self.interval_sec,
+                session_start=meta.get("session_start"),
+                session_end=meta.get("session_end"),
+            )
+            age_sec = ages.get(key, math.inf)
+            if age_sec > max_age:
+                due.append((age_sec, key))
+        due.sort(key=lambda pair: pair[0], reverse=True)
+        return [key for _, key in due]
+
+    def _get_targets(self) -> tuple[dict[tuple[str, str], dict], dict[tuple[str, str], str | None]]:
+        """watch list와 미청산 보유 종목의 갱신 키, 해외 종목 키별 거래소 코드."""
+        conn = self.db.read_connection()
+        cursor = conn.execute(
+            """
+            SELECT
+                t.stock_code,
+                s.standard_code,
+                s.market,
+                s.exchange,
+                s.session_start,
+                s.session_end,
+                EXISTS (
+                    SELECT 1
+                    FROM stock_listings l
+                    WHERE l.stock_code = t.stock_code AND l.exchange = 'NXT'
+                ) AS nxt_listed
+            FROM (
+                SELECT stock_code FROM watchlist_items
+                UNION
+                SELECT stock_code FROM holding_lots WHERE is_closed = 0
+            ) AS t
+            LEFT JOIN stocks s ON s.code = t.stock_code
+            ORDER BY t.stock_code
+            """
+        )
+        targets: dict[tuple[str, str], dict] = {}
+        exchanges: dict[tuple[str, str], str | None] = {}
+        for row in cursor.fetchall():
+            meta = {
+                "standard_code": row["standard_code"],
+                "market": row["market"],
+                "exchange": row["exchange"],
+                "session_start": row["session_start"],
+                "session_end": row["session_end"],
+            }
+            code = row["stock_code"]
+            if (row["market"] or "").upper() == "US":
+                exchange = WatchListService._resolve_overseas_exchange(meta)
+                key = (code, exchange or "US")
+                exchanges[key] = exchange
+                targets[key] = meta
+                continue
+            targets[(code, "J")] = meta
+            if row["nxt_listed"]:
+                targets[(code, "NX")] = meta
+        return targets, exchanges
@@ -3,14 +3,38 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-import json
-
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from functools import partial
+import logging
+import math
+from typing import Awaitable, Callable
+
+from app.services.market_session import KST, PriceTTLPolicy, get_active_exchanges
+from app.services.price_cache import CachedPrice, PriceCache
 from core.config import load_config
-from db import Database
+from db import AsyncDatabase, Database
+from db.price_codec import SUMMARY_COLUMNS, utc_timestamp
 from external.client import APIError
-from external.kis import get_kis_client
+from external.kis import MULTI_PRICE_LIMIT, get_kis_client
+
+logger = logging.getLogger(__name__)
+
+# 관심종목(멀티종목) 시세 응답 필드 -> 현재가(inquire-price) 응답 필드
+MULTI_PRICE_FIELDS = {
+    "inter2_prpr": "stck_prpr",
+    "inter2_prdy_vrss": "prdy_vrss",
+    "prdy_vrss_sign": "prdy_vrss_sign",
+    "prdy_ctrt": "prdy_ctrt",
+    "acml_vol": "acml_vol",
+    "acml_tr_pbmn": "acml_tr_pbmn",
+    "inter2_oprc": "stck_oprc",
+    "inter2_hgpr": "stck_hgpr",
+    "inter2_lwpr": "stck_lwpr",
+    "inter2_mxpr": "stck_mxpr",
+    "inter2_llam": "stck_llam",
+    "inter2_sdpr": "stck_sdpr",
+}
 
 
 @dataclass(frozen=True)
@@ -20,7 +44,15 @@ class CurrentPriceQuery:
     stock_code: str
     market: str
     use_cache: bool
-    max_age_sec: int | None
+    max_age_sec: float | None
+    stale_while_revalidate_sec: int | None = None
+
+    @property
+    def cache_window_sec(self) -> float | None:
+        """stale 응답까지 포함한 캐시 허용 경과초."""
+        if self.max_age_sec is None:
+            return None
+        return self.max_age_sec + (self.stale_while_revalidate_sec or 0)
 
 
 class StockCurrentPriceService:
@@ -32,10 +64,17 @@ class StockCurrentPriceService:
         self,
         db: Database | None = None,
         client: KISClient | None = None,
+        adb: AsyncDatabase | None = None,
+        cache: PriceCache | None = None,
+        ttl_policy: PriceTTLPolicy | None = None,
     ):
         self.db = db or Database()
-        self.db.create_tables()
+        self.db.ensure_schema()
+        self.adb = adb or AsyncDatabase(self.db)
+        self.cache = cache or PriceCache()
+        self.ttl_policy = ttl_policy or PriceTTLPolicy()
         self.client = client
+        self._refresh_tasks: set[asyncio.Task] = set()
 
     async def get_current_price(
         self,
@@ -43,46 +82,274 @@ class StockCurrentPriceService:
         market: str = "J",
         use_cache: bool = False,
         max_age_sec: int | None = None,
+        stale_while_revalidate_sec: int | None = None,
     ) -> dict:
         query = self._build_query(
             stock_code=stock_code,
             market=market,
             use_cache=use_cache,
             max_age_sec=max_age_sec,
+            stale_while_revalidate_sec=stale_while_revalidate_sec,
         )
 
         if query.use_cache:
-            cached = self.db.get_current_price(query.stock_code, query.market)
-            if cached and self._is_cache_valid(cached.get("updated_at"), query.max_age_sec):
+            # 장 종료 후에는 마지막 종료 이후 받은 시세를 다음 장까지 그대로 사용
+            query = replace(
+                query,
+                max_age_sec=self.ttl_policy.max_age_sec(query.market, query.max_age_sec),
+            )
+            cached = await self.get_cached_price(
+                query.stock_code, query.market, query.cache_window_sec
+            )
+            if cached is not None:
+                age_sec = self.cache.age_sec(cached)
+                stale = self.is_stale(age_sec, query.max_age_sec)
+                if stale:
+                    # 오래된 값을 바로 반환하고 갱신은 백그라운드에서 수행
+                    self.schedule_refresh(query.stock_code, query.market)
                 return self._build_response(
                     query,
-                    price=self._parse_price_json(cached.get("price_json")),
+                    price=cached.price,
                     source="db",
-                    updated_at=cached.get("updated_at"),
+                    updated_at=cached.updated_at,
+                    stale=stale,
+                    age_sec=age_sec,
                 )
 
+        # 같은 종목/시장의 동시 미스는 KIS 호출 하나를 공유
+        response = await self.cache.load(
+            query.stock_code,
+            query.market,
+            lambda: self._refresh_from_kis(query),
+        )
+        return dict(response)
+
+    async def get_cached_price(
+        self,
+        stock_code: str,
+        market: str,
+        max_age_sec: float | None = None,
+    ) -> CachedPrice | None:
+        """L1 캐시, ``stock_price_current`` 순으로 유효한 현재가 조회."""
+        entry = self.cache.get(stock_code, market, max_age_sec)
+        if entry is not None:
+            return entry
+
+        cached = await self.adb.get_current_price(stock_code, market)
+        return self._cache_row(stock_code, market, cached, max_age_sec)
+
+    async def get_cached_prices(
+        self,
+        windows: dict[tuple[str, str], float | None],
+    ) -> dict[tuple[str, str], CachedPrice]:
+        """여러 종목의 유효한 현재가 조회 (L1 캐시 확인 후 나머지는 DB 일괄 조회).
+
+        Args:
+            windows: (stock_code, market)별 캐시 허용 경과초
+
+        Returns:
+            유효한 값이 있는 (stock_code, market)별 캐시 항목
+        """
+        found = {}
+        missing = []
+        for (stock_code, market), max_age_sec in windows.items():
+            entry = self.cache.get(stock_code, market, max_age_sec)
+            if entry is not None:
+                found[(stock_code, market)] = entry
+            else:
+                missing.append((stock_code, market))
+
+        if missing:
+            rows = await self.adb.get_current_prices(missing)
+            for key, row in rows.items():
+                entry = self._cache_row(*key, row, windows[key])
+                if entry is not None:
+                    found[key] = entry
+        return found
+
+    async def get_price_ages(self, keys: list[tuple[str, str]]) -> dict[tuple[str, str], float]:
+        """여러 종목 현재가의 경과초를 L1 캐시에 올리지 않고 조회 (값이 없는 키는 제외).
+
+        L1 캐시는 계측 없이 확인만 하고, 나머지는 저장 시각만 일괄 조회합니다.
+        """
+        ages = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            entry = self.cache.peek(*key)
+            age_sec = self.cache.age_sec(entry) if entry is not None else None
+            if age_sec is not None:
+                ages[key] = age_sec
+            else:
+                missing.append(key)
+
+        if missing:
+            stored = await self.adb.get_current_price_updated_at(missing)
+            for key, updated_at in stored.items():
+                age_sec = self._age_sec(updated_at)
+                if math.isfinite(age_sec):
+                    ages[key] = age_sec
+        return ages
+
+    def _cache_row(
+        self,
+        stock_code: str,
+        market: str,
+        cached: dict | None,
+        max_age_sec: float | None,
+    ) -> CachedPrice | None:
+        """DB 행이 유효하면 L1 캐시에 올려 반환."""
+        if not cached or not self._is_cache_valid(cached.get("updated_at"), max_age_sec):
+            return None
+        summary = {column: cached.get(column) for column in SUMMARY_COLUMNS}
+        if summary["price"] is None and not cached.get("raw_payload") and not cached.get("payload"):
+            return None
+        return self.cache.put(
+            stock_code,
+            market,
+            cached.get("payload"),
+            cached.get("updated_at"),
+            age_sec=self._age_sec(cached.get("updated_at")),
+            summary=summary,
+            raw_payload=cached.get("raw_payload"),
+        )
+
+    async def store_price(self, stock_code: str, market: str, price: dict) -> CachedPrice:
+        """현재가를 ``stock_price_current``와 L1 캐시에 기록."""
+        stored = await self.store_prices([(stock_code, market, price)])
+        return stored[0]
+
+    async def store_prices(self, prices: list[tuple[str, str, dict]]) -> list[CachedPrice]:
+        """여러 현재가를 한 번에 기록 (write-behind 버퍼의 같은 트랜잭션으로 커밋)."""
+        updated_at = await self.adb.upsert_current_prices(prices)
+        return [
+            self.cache.put(stock_code, market, price, updated_at)
+            for stock_code, market, price in prices
+        ]
+
+    def refresh_loader(
+        self,
+        stock_code: str,
+        market: str,
+        store: bool = True,
+    ) -> Callable[[], Awaitable[dict]]:
+        """KIS 현재가 조회 loader (``cache.load``용, 응답 형태는 ``get_current_price``와 같음).
+
+        ``store=False``이면 저장하지 않으므로 호출자가 ``store_prices``로 모아 기록합니다.
+        """
+        query = self._build_query(stock_code, market, use_cache=False, max_age_sec=None)
+        return partial(self._refresh_from_kis, query, store)
+
+    def batch_refresh_loaders(self, stock_codes: list[str]) -> dict[str, Callable[[], Awaitable[dict]]]:
+        """KRX(J) 종목별 현재가 loader (``MULTI_PRICE_LIMIT``개씩 묶어 KIS 한 번 호출로 조회).
+
+        같은 묶음의 loader는 처음 호출될 때 시작한 조회 하나를 함께 기다립니다.
+        응답 형태는 ``refresh_loader(store=False)``와 같고, 저장은 호출자가 ``store_prices``로 합니다.
+        """
+        codes = list(dict.fromkeys(stock_codes))
+        loaders = {}
+        for start in range(0, len(codes), MULTI_PRICE_LIMIT):
+            chunk = codes[start : start + MULTI_PRICE_LIMIT]
+            fetch = self._shared_fetch(partial(self._fetch_multi_from_kis, chunk))
+            for code in chunk:
+                query = self._build_query(code, "J", use_cache=False, max_age_sec=None)
+                loaders[code] = partial(self._refresh_from_batch, query, fetch)
+        return loaders
+
+    @staticmethod
+    def is_stale(age_sec: float | None, max_age_sec: float | None) -> bool:
+        return max_age_sec is not None and age_sec is not None and age_sec > max_age_sec
+
+    def schedule_refresh(
+        self,
+        stock_code: str,
+        market: str,
+        loader: Callable[[], Awaitable[object]] | None = None,
+    ) -> bool:
+        """백그라운드 현재가 갱신 예약 (같은 종목이 갱신 중이면 생략)."""
+        if self.cache.is_loading(stock_code, market):
+            return False
+        if loader is None:
+            loader = self.refresh_loader(stock_code, market)
+
+        task = asyncio.create_task(self.cache.load(stock_code, market, loader))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._on_refresh_done)
+        return True
+
+    def _on_refresh_done(self, task: asyncio.Task) -> None:
+        self._refresh_tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning("현재가 백그라운드 갱신 실패: %s", exc)
+
+    async def aclose(self) -> None:
+        """진행 중인 백그라운드 갱신이 끝날 때까지 대기."""
+        if self._refresh_tasks:
+            await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
+
+    async def _refresh_from_kis(self, query: CurrentPriceQuery, store: bool = True) -> dict:
         response = await self._fetch_from_kis(query)
         output = response.get("output", {}) if isinstance(response, dict) else {}
+        if store:
+            stored = await self.store_price(query.stock_code, query.market, output)
+            updated_at = stored.updated_at
+        else:
+            updated_at = utc_timestamp()
 
-        self.db.upsert_current_price(
-            stock_code=query.stock_code,
-            market=query.market,
-            price_json=json.dumps(output, ensure_ascii=True),
+        return self._build_response(
+            query,
+            price=output,
+            source="kis",
+            updated_at=updated_at,
+            stale=False,
+            age_sec=0.0,
         )
 
+    async def _refresh_from_batch(
+        self,
+        query: CurrentPriceQuery,
+        fetch: Callable[[], Awaitable[dict[str, dict]]],
+    ) -> dict:
+        prices = await fetch()
+        output = prices.get(query.stock_code)
+        if output is None:
+            raise APIError(f"관심종목 시세 응답에 {query.stock_code} 종목이 없습니다.")
+
         return self._build_response(
             query,
             price=output,
             source="kis",
-            updated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            updated_at=utc_timestamp(),
+            stale=False,
+            age_sec=0.0,
         )
 
+    @staticmethod
+    def _shared_fetch(
+        fetch: Callable[[], Awaitable[dict[str, dict]]],
+    ) -> Callable[[], Awaitable[dict[str, dict]]]:
+        """처음 호출될 때 ``fetch``를 한 번 시작하고, 이후 호출은 같은 결과를 기다림."""
+        task: asyncio.Future | None = None
+
+        async def shared() -> dict[str, dict]:
+            nonlocal task
+            if task is None:
+                task = asyncio.ensure_future(fetch())
+                # 기다리던 호출이 모두 취소돼도 "exception was never retrieved" 경고가 나지 않도록
+                task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            return await asyncio.shield(task)
+
+        return shared
+
     def _build_query(
         self,
         stock_code: str,
         market: str,
         use_cache: bool,
         max_age_sec: int | None,
+        stale_while_revalidate_sec: int | None = None,
     ) -> CurrentPriceQuery:
         if not stock_code:
             raise ValueError("stock_code 값이 필요합니다.")
@@ -94,11 +361,15 @@ class StockCurrentPriceService:
         if max_age_sec is not None and max_age_sec < 0:
             raise ValueError("max_age_sec는 0 이상이어야 합니다.")
 
+        if stale_while_revalidate_sec is not None and stale_while_revalidate_sec < 0:
+            raise ValueError("stale_while_revalidate_sec는 0 이상이어야 합니다.")
+
         return CurrentPriceQuery(
             stock_code=stock_code,
             market=market,
             use_cache=use_cache,
             max_age_sec=max_age_sec,
+            stale_while_revalidate_sec=stale_while_revalidate_sec,
         )
 
     async def _fetch_from_kis(self, query: CurrentPriceQuery) -> dict:
@@ -119,42 +390,68 @@ class StockCurrentPriceService:
 
         return result
 
+    async def _fetch_multi_from_kis(self, stock_codes: list[str]) -> dict[str, dict]:
+        """관심종목 시세를 조회해 종목코드별 현재가(inquire-price 필드) payload로 변환."""
+        if self.client is None:
+            self.client = get_kis_client()
+
+        try:
+            result = await self.client.get_multi_current_prices(stock_codes=stock_codes, market="J")
+        except APIError as exc:
+            raise APIError("관심종목 시세 API 호출 실패", status_code=exc.status_code, response=exc.response) from exc
+
+        if result.get("rt_cd") != "0":
+            message = result.get("msg1", "관심종목 시세 API 응답 오류")
+            raise APIError(message, response=result)
+
+        prices = {}
+        for row in result.get("output") or []:
+            stock_code = row.get("inter_shrn_iscd")
+            if stock_code:
+                prices[stock_code] = {
+                    field: row[source] for source, field in MULTI_PRICE_FIELDS.items() if source in row
+                }
+        return prices
+
     def _build_response(
         self,
         query: CurrentPriceQuery,
         price: dict,
         source: str,
         updated_at: str | None = None,
+        stale: bool = False,
+        age_sec: float | None = None,
     ) -> dict:
         response = {
             "code": query.stock_code,
             "market": query.market,
             "source": source,
             "price": price,
+            "stale": stale,
+            "age_sec": age_sec,
         }
         if updated_at:
             response["updated_at"] = updated_at
         return response
 
-    @staticmethod
-    def _parse_price_json(value: str | None) -> dict:
-        if not value:
-            return {}
-        try:
-            return json.loads(value)
-        except json.JSONDecodeError:
-            return {}
-
     @staticmethod
     def _parse_datetime(value: str | None) -> datetime | None:
+        """``updated_at``(CURRENT_TIMESTAMP, UTC) 파싱."""
         if not value:
             return None
         try:
-            return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+            parsed = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
         except ValueError:
             return None
+        return parsed.replace(tzinfo=timezone.utc)
 
-    def _is_cache_valid(self, updated_at: str | None, max_age_sec: int | None) -> bool:
+    def _age_sec(self, updated_at: str | None) -> float:
+        parsed = self._parse_datetime(updated_at)
+        if parsed is None:
+            return float("inf")
+        return max((datetime.now(timezone.utc) - parsed).total_seconds(), 0.0)
+
+    def _is_cache_valid(self, updated_at: str | None, max_age_sec: float | None) -> bool:
         if not updated_at:
             return False
         if max_age_sec is None:
@@ -164,13 +461,14 @@ class StockCurrentPriceService:
         if parsed is None:
             return False
 
-        return datetime.now() - parsed <= timedelta(seconds=max_age_sec)
+        return datetime.now(timezone.utc) - parsed <= timedelta(seconds=max_age_sec)
 
     async def get_combined_price(
         self,
         stock_code: str,
         use_cache: bool = False,
         max_age_sec: int | None = None,
+        stale_while_revalidate_sec: int | None = None,
     ) -> dict:
         """KRX와 NXT 시세를 동시에 조회하여 통합 결과 반환.
 
@@ -178,6 +476,7 @@ class StockCurrentPriceService:
             stock_code: 종목코드
             use_cache: 캐시 사용 여부
             max_age_sec: 캐시 최대 유효 시간(초)
+            stale_while_revalidate_sec: max_age_sec 초과 후 백그라운드 갱신하며 반환할 추가 허용초
 
         Returns:
             dict: KRX/NXT 각각의 시세와 최적 가격 정보
@@ -190,10 +489,11 @@ class StockCurrentPriceService:
                     market="J",
                     use_cache=use_cache,
                     max_age_sec=max_age_sec,
+                    stale_while_revalidate_sec=stale_while_revalidate_sec,
                 )
-                return result.get("price", {}), None
+                return result, None
             except Exception as e:
-                return None, str(e)
+                return {}, str(e)
 
         async def fetch_nxt():
             try:
@@ -202,23 +502,36 @@ class StockCurrentPriceService:
                     market="NX",
                     use_cache=use_cache,
                     max_age_sec=max_age_sec,
+                    stale_while_revalidate_sec=stale_while_revalidate_sec,
                 )
-                return result.get("price", {}), None
+                return result, None
             except Exception as e:
-                return None, str(e)
+                return {}, str(e)
 
         # KRX와 NXT 동시 조회
-        (krx_price, krx_error), (nxt_price, nxt_error) = await asyncio.gather(
+        (krx_result, krx_error), (nxt_result, nxt_error) = await asyncio.gather(
             fetch_krx(),
             fetch_nxt(),
         )
+        krx_price = krx_result.get("price", {}) if not krx_error else None
+        nxt_price = nxt_result.get("price", {}) if not nxt_error else None
 
         best_price = self._select_best_price(krx_price, nxt_price)
 
         return {
             "code": stock_code,
-            "krx": {"price": krx_price, "error": krx_error},
-            "nxt": {"price": nxt_price, "error": nxt_error},
+            "krx": {
+                "price": krx_price,
+                "error": krx_error,
+                "stale": krx_result.get("stale", False),
+                "age_sec": krx_result.get("age_sec"),
+            },
+            "nxt": {
+                "price": nxt_price,
+                "error": nxt_error,
+                "stale": nxt_result.get("stale", False),
+                "age_sec": nxt_result.get("age_sec"),
+            },
             "best": best_price,
             "active_exchanges": self.get_active_exchanges(),
         }
@@ -271,28 +584,5 @@ class StockCurrentPriceService:
         그 외: 빈 리스트
         """
         if current_time is None:
-            current_time = datetime.now()
-
-        hour = current_time.hour
-        minute = current_time.minute
-        time_val = hour * 60 + minute
-
-        # 시간대 상수 (분 단위)
-        NXT_PRE_START = 8 * 60  # 08:00
-        NXT_PRE_END = 8 * 60 + 50  # 08:50
-        REGULAR_START = 9 * 60  # 09:00
-        NXT_REGULAR_END = 15 * 60 + 20  # 15:20
-        KRX_REGULAR_END = 15 * 60 + 30  # 15:30
-        NXT_POST_START = 15 * 60 + 40  # 15:40
-        NXT_POST_END = 20 * 60  # 20:00
-
-        if NXT_PRE_START <= time_val < NXT_PRE_END:
-            return ["NXT"]
-        elif REGULAR_START <= time_val < NXT_REGULAR_END:
-            return ["KRX", "NXT"]
-        elif NXT_REGULAR_END <= time_val < KRX_REGULAR_END:
-            return ["KRX"]
-        elif NXT_POST_START <= time_val <= NXT_POST_END:
-            return ["NXT"]
-        else:
-            return []
+            current_time = datetime.now(KST)
+        return get_active_exchanges(current_time)
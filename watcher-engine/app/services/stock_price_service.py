@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from core.config import load_config
-from db import Database, StockPricePeriodic
+from db import AsyncDatabase, Database, StockPricePeriodic
 from external.client import APIError
 from external.kis import get_kis_client
 
@@ -33,9 +33,11 @@ class StockPriceService:
         self,
         db: Database | None = None,
         client: KISClient | None = None,
+        adb: AsyncDatabase | None = None,
     ):
         self.db = db or Database()
-        self.db.create_tables()
+        self.db.ensure_schema()
+        self.adb = adb or AsyncDatabase(self.db)
         self.client = client
 
     async def get_periodic_prices(
@@ -58,7 +60,7 @@ class StockPriceService:
         )
 
         if use_cache:
-            cached = self.db.get_periodic_prices(
+            cached = await self.adb.get_periodic_prices(
                 stock_code=query.stock_code,
                 market=query.market,
                 period=query.period,
@@ -78,7 +80,7 @@ class StockPriceService:
 
         prices = [self._map_output_to_model(query, item) for item in output2]
         prices.sort(key=lambda item: item.business_date)
-        self.db.insert_periodic_prices(prices)
+        await self.adb.insert_periodic_prices(prices)
 
         return self._build_response(
             query, [self._model_to_response(p) for p in prices], source="kis"
@@ -27,6 +27,8 @@ class StockService:
                     name=stock.name,
                     market=stock.market,
                     exchange=stock.exchange,
+                    session_start=stock.session_start,
+                    session_end=stock.session_end,
                 )
             else:
                 current = base_by_code[stock.code]
@@ -49,7 +51,7 @@ class StockService:
                 )
 
         with Database() as db:
-            db.create_tables()
+            db.ensure_schema()
             count = db.insert_stocks(list(base_by_code.values()))
             db.insert_stock_listings(listings)
 
@@ -81,7 +83,7 @@ class StockService:
         offset: int = 0,
     ) -> list[dict]:
         """종목 목록 조회"""
-        conn = self.db.connect()
+        conn = self.db.read_connection()
         if exchange:
             query = (
                 "SELECT s.code, s.standard_code, s.name, s.market, l.exchange AS exchange "
@@ -119,7 +121,7 @@ class StockService:
 
     def get_stock_by_code(self, code: str) -> dict | None:
         """종목 코드로 조회"""
-        conn = self.db.connect()
+        conn = self.db.read_connection()
         cursor = conn.execute(
             "SELECT code, standard_code, name, market, exchange FROM stocks WHERE code = ?",
             (code,),
@@ -139,7 +141,7 @@ class StockService:
 
     def search_stocks(self, query: str, limit: int = 20) -> list[dict]:
         """종목 검색 (이름 또는 코드)"""
-        conn = self.db.connect()
+        conn = self.db.read_connection()
         search_term = f"%{query}%"
 
         cursor = conn.execute(
@@ -3,40 +3,55 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import sqlite3
 
-from db import Database
+from db import AsyncDatabase, Database
+from db.price_codec import extract_summary, format_number
+from app.services.market_session import PriceTTLPolicy
 from app.services.stock_current_price_service import StockCurrentPriceService
 from app.services.oversea_stock_price_service import OverseaStockPriceService
 
+# 캐시 미스 종목 KIS 동시 조회 수 (KIS 클라이언트 기본 동시 호출 제한과 같음)
+REFRESH_CONCURRENCY = 5
+
 
 class WatchListService:
     """Watch list + 폴더 + 종목 관리 서비스."""
 
     DEFAULT_FOLDER_NAME = "기본"
 
-    def __init__(self, db: Database | None = None):
+    def __init__(
+        self,
+        db: Database | None = None,
+        price_service: StockCurrentPriceService | None = None,
+        overseas_service: OverseaStockPriceService | None = None,
+        adb: AsyncDatabase | None = None,
+        ttl_policy: PriceTTLPolicy | None = None,
+        refresh_concurrency: int = REFRESH_CONCURRENCY,
+    ):
         self.db = db or Database()
-        self.db.create_tables()
+        self.db.ensure_schema()
+        self.adb = adb or AsyncDatabase(self.db)
+        self.price_service = price_service or StockCurrentPriceService(db=self.db, adb=self.adb)
+        self.overseas_service = overseas_service or OverseaStockPriceService()
+        self.ttl_policy = ttl_policy or self.price_service.ttl_policy
+        self.refresh_concurrency = refresh_concurrency
 
     def create_watchlist(self, name: str, description: str | None = None) -> dict:
         if not name:
             raise ValueError("name 값이 필요합니다.")
 
-        conn = self.db.connect()
         try:
-            cursor = conn.execute(
-                "INSERT INTO watchlists (name, description) VALUES (?, ?)",
-                (name, description),
-            )
+            with self.db.transaction() as conn:
+                cursor = conn.execute(
+                    "INSERT INTO watchlists (name, description) VALUES (?, ?)",
+                    (name, description),
+                )
+                watchlist_id = cursor.lastrowid
+                default_folder = self._create_default_folder(conn, watchlist_id)
         except sqlite3.IntegrityError as exc:
             raise ValueError("이미 존재하는 watch list 이름입니다.") from exc
 
-        watchlist_id = cursor.lastrowid
-        default_folder = self._create_default_folder(watchlist_id)
-
-        conn.commit()
         return {
             "id": watchlist_id,
             "name": name,
@@ -45,7 +60,7 @@ class WatchListService:
         }
 
     def list_watchlists(self) -> list[dict]:
-        conn = self.db.connect()
+        conn = self.db.read_connection()
         cursor = conn.execute(
             "SELECT id, name, description, created_at, updated_at FROM watchlists ORDER BY id"
         )
@@ -62,7 +77,7 @@ class WatchListService:
         ]
 
     def get_watchlist(self, watchlist_id: int) -> dict | None:
-        conn = self.db.connect()
+        conn = self.db.read_connection()
         cursor = conn.execute(
             "SELECT id, name, description, created_at, updated_at FROM watchlists WHERE id = ?",
             (watchlist_id,),
@@ -79,9 +94,8 @@ class WatchListService:
         }
 
     def delete_watchlist(self, watchlist_id: int) -> None:
-        conn = self.db.connect()
-        conn.execute("DELETE FROM watchlists WHERE id = ?", (watchlist_id,))
-        conn.commit()
+        with self.db.transaction() as conn:
+            conn.execute("DELETE FROM watchlists WHERE id = ?", (watchlist_id,))
 
     def create_folder(
         self,
@@ -92,19 +106,18 @@ class WatchListService:
         if not name:
             raise ValueError("name 값이 필요합니다.")
 
-        conn = self.db.connect()
         try:
-            cursor = conn.execute(
-                """
-                INSERT INTO watchlist_folders (watchlist_id, name, description)
-                VALUES (?, ?, ?)
-                """,
-                (watchlist_id, name, description),
-            )
+            with self.db.transaction() as conn:
+                cursor = conn.execute(
+                    """
+                    INSERT INTO watchlist_folders (watchlist_id, name, description)
+                    VALUES (?, ?, ?)
+                    """,
+                    (watchlist_id, name, description),
+                )
         except sqlite3.IntegrityError as exc:
             raise ValueError("이미 존재하는 폴더 이름입니다.") from exc
 
-        conn.commit()
         return {
             "id": cursor.lastrowid,
             "watchlist_id": watchlist_id,
@@ -113,7 +126,7 @@ class WatchListService:
         }
 
     def list_folders(self, watchlist_id: int) -> list[dict]:
-        conn = self.db.connect()
+        conn = self.db.read_connection()
         cursor = conn.execute(
             """
             SELECT id, watchlist_id, name, description, is_default, created_at, updated_at
@@ -144,7 +157,6 @@ class WatchListService:
         name: str | None = None,
         description: str | None = None,
     ) -> dict | None:
-        conn = self.db.connect()
         current = self._get_folder(watchlist_id, folder_id)
         if not current:
             return None
@@ -153,15 +165,15 @@ class WatchListService:
         new_description = description if description is not None else current["description"]
 
         try:
-            conn.execute(
-                """
-                UPDATE watchlist_folders
-                SET name = ?, description = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ? AND watchlist_id = ?
-                """,
-                (new_name, new_description, folder_id, watchlist_id),
-            )
-            conn.commit()
+            with self.db.transaction() as conn:
+                conn.execute(
+                    """
+                    UPDATE watchlist_folders
+                    SET name = ?, description = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ? AND watchlist_id = ?
+                    """,
+                    (new_name, new_description, folder_id, watchlist_id),
+                )
         except sqlite3.IntegrityError as exc:
             raise ValueError("이미 존재하는 폴더 이름입니다.") from exc
 
@@ -179,12 +191,11 @@ class WatchListService:
         if folder["is_default"]:
             raise ValueError("기본 폴더는 삭제할 수 없습니다.")
 
-        conn = self.db.connect()
-        conn.execute(
-            "DELETE FROM watchlist_folders WHERE id = ? AND watchlist_id = ?",
-            (folder_id, watchlist_id),
-        )
-        conn.commit()
+        with self.db.transaction() as conn:
+            conn.execute(
+                "DELETE FROM watchlist_folders WHERE id = ? AND watchlist_id = ?",
+                (folder_id, watchlist_id),
+            )
 
     def add_item(
         self,
@@ -201,44 +212,43 @@ class WatchListService:
             if not folder:
                 raise ValueError("폴더를 찾을 수 없습니다.")
 
-        conn = self.db.connect()
-        if folder_id is None:
-            try:
-                conn.execute(
-                    """
-                    INSERT INTO watchlist_items (watchlist_id, folder_id, stock_code, memo)
-                    VALUES (?, NULL, ?, ?)
-                    """,
-                    (watchlist_id, stock_code, memo),
-                )
-            except sqlite3.IntegrityError:
-                conn.execute(
-                    """
-                    UPDATE watchlist_items
-                    SET memo = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE watchlist_id = ? AND stock_code = ? AND folder_id IS NULL
-                    """,
-                    (memo, watchlist_id, stock_code),
-                )
-        else:
-            try:
-                conn.execute(
-                    """
-                    INSERT INTO watchlist_items (watchlist_id, folder_id, stock_code, memo)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (watchlist_id, folder_id, stock_code, memo),
-                )
-            except sqlite3.IntegrityError:
-                conn.execute(
-                    """
-                    UPDATE watchlist_items
-                    SET memo = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE watchlist_id = ? AND stock_code = ? AND folder_id = ?
-                    """,
-                    (memo, watchlist_id, stock_code, folder_id),
-                )
-        conn.commit()
+        with self.db.transaction() as conn:
+            if folder_id is None:
+                try:
+                    conn.execute(
+                        """
+                        INSERT INTO watchlist_items (watchlist_id, folder_id, stock_code, memo)
+                        VALUES (?, NULL, ?, ?)
+                        """,
+                        (watchlist_id, stock_code, memo),
+                    )
+                except sqlite3.IntegrityError:
+                    conn.execute(
+                        """
+                        UPDATE watchlist_items
+                        SET memo = ?, updated_at = CURRENT_TIMESTAMP
+                        WHERE watchlist_id = ? AND stock_code = ? AND folder_id IS NULL
+                        """,
+                        (memo, watchlist_id, stock_code),
+                    )
+            else:
+                try:
+                    conn.execute(
+                        """
+                        INSERT INTO watchlist_items (watchlist_id, folder_id, stock_code, memo)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        (watchlist_id, folder_id, stock_code, memo),
+                    )
+                except sqlite3.IntegrityError:
+                    conn.execute(
+                        """
+                        UPDATE watchlist_items
+                        SET memo = ?, updated_at = CURRENT_TIMESTAMP
+                        WHERE watchlist_id = ? AND stock_code = ? AND folder_id = ?
+                        """,
+                        (memo, watchlist_id, stock_code, folder_id),
+                    )
 
         return {
             "watchlist_id": watchlist_id,
@@ -248,7 +258,7 @@ class WatchListService:
         }
 
     def list_items(self, watchlist_id: int, folder_id: int | None = None) -> list[dict]:
-        conn = self.db.connect()
+        conn = self.db.read_connection()
         if folder_id is None:
             cursor = conn.execute(
                 """
@@ -284,12 +294,11 @@ class WatchListService:
         ]
 
     def delete_item(self, watchlist_id: int, item_id: int) -> None:
-        conn = self.db.connect()
-        conn.execute(
-            "DELETE FROM watchlist_items WHERE id = ? AND watchlist_id = ?",
-            (item_id, watchlist_id),
-        )
-        conn.commit()
+        with self.db.transaction() as conn:
+            conn.execute(
+                "DELETE FROM watchlist_items WHERE id = ? AND watchlist_id = ?",
+                (item_id, watchlist_id),
+            )
 
     async def list_items_with_price(
         self,
@@ -300,8 +309,13 @@ class WatchListService:
         refresh_missing: bool = False,
         market: str = "J",
         include_nxt: bool = False,
+        stale_while_revalidate_sec: int | None = None,
     ) -> list[dict]:
-        """종목 목록과 현재가 조회 (비동기, 동시 조회).
+        """종목 목록과 현재가 조회 (비동기, 일괄 조회).
+
+        1. 조회할 (종목, 시장) 키를 중복 없이 모아 캐시를 한 번에 조회
+        2. 캐시 미스만 모아 동시 호출 수를 제한해 KIS 조회
+        3. 조회 결과를 한 번에 기록
 
         Args:
             watchlist_id: watch list ID
@@ -311,166 +325,228 @@ class WatchListService:
             refresh_missing: 캐시 없을 때 API 호출 여부
             market: 시장 구분 (J/NX)
             include_nxt: NXT 시세 추가 포함 여부
+            stale_while_revalidate_sec: max_age_sec 초과 후 백그라운드 갱신하며 반환할 추가 허용초
         """
-        items = self.list_items(watchlist_id, folder_id)
-        price_service = StockCurrentPriceService(db=self.db)
-        overseas_service = OverseaStockPriceService()
-        stock_meta_by_code = self._get_stock_meta_map([item["stock_code"] for item in items])
-
-        def _map_overseas_payload(payload: dict) -> dict:
-            price = payload.get("price", {}) if isinstance(payload, dict) else {}
-            change = payload.get("change", {}) if isinstance(payload, dict) else {}
-            volume = payload.get("volume", {}) if isinstance(payload, dict) else {}
-            return {
-                "current_price": price.get("last"),
-                "volume": volume.get("current"),
-                "change": change.get("diff"),
-                "change_rate": change.get("rate"),
-            }
+        if stale_while_revalidate_sec is not None and stale_while_revalidate_sec < 0:
+            raise ValueError("stale_while_revalidate_sec는 0 이상이어야 합니다.")
 
-        async def fetch_overseas_price(item: dict, meta: dict) -> dict:
-            exchange = self._resolve_overseas_exchange(meta)
-            market_key = exchange or "US"
-            price_payload = {}
-            source = None
-
-            if use_cache:
-                cached = self.db.get_current_price(item["stock_code"], market_key)
-                if cached:
-                    cached_payload = price_service._parse_price_json(cached.get("price_json"))
-                    if cached_payload and price_service._is_cache_valid(
-                        cached.get("updated_at"), max_age_sec
-                    ):
-                        price_payload = cached_payload
-                        source = "db"
-
-            if refresh_missing and not price_payload:
-                if not exchange:
-                    source = "error"
-                else:
-                    try:
-                        live = await overseas_service.get_current_price(
-                            symbol=item["stock_code"],
-                            exchange=exchange,
-                        )
-                        price_payload = live if isinstance(live, dict) else {}
-                        source = "kis"
-                        if price_payload:
-                            self.db.upsert_current_price(
-                                stock_code=item["stock_code"],
-                                market=market_key,
-                                price_json=json.dumps(price_payload, ensure_ascii=True),
-                            )
-                    except Exception:
-                        price_payload = {}
-                        source = "error"
-
-            return {
-                **item,
-                "market": meta.get("market"),
-                "exchange": meta.get("exchange"),
-                "price_source": source,
-                **_map_overseas_payload(price_payload),
-            }
+        items = await self.adb.read(self.list_items, watchlist_id, folder_id)
+        stock_meta_by_code = await self.adb.read(
+            self._get_stock_meta_map, [item["stock_code"] for item in items]
+        )
 
-        async def fetch_item_price(item: dict) -> dict:
+        # 항목별 조회 키 (응답 필드 접두어 -> (stock_code, market)), 같은 키는 한 번만 조회
+        item_keys: list[dict[str, tuple[str, str]]] = []
+        metas: dict[tuple[str, str], dict] = {}
+        # 해외 종목 키별 거래소 코드 (확인할 수 없으면 None)
+        exchanges: dict[tuple[str, str], str | None] = {}
+        for item in items:
             meta = stock_meta_by_code.get(item["stock_code"], {})
             if (meta.get("market") or "").upper() == "US":
-                return await fetch_overseas_price(item, meta)
-
-            price_payload = {}
-            source = None
-            nxt_price_payload = {}
-            nxt_source = None
-
-            # 캐시 조회
-            if use_cache:
-                cached = self.db.get_current_price(item["stock_code"], market)
-                if cached:
-                    price_payload = price_service._parse_price_json(cached.get("price_json"))
-                    if price_payload and price_service._is_cache_valid(
-                        cached.get("updated_at"), max_age_sec
-                    ):
-                        source = "db"
-                    else:
-                        price_payload = {}
-
-            # 캐시 없으면 API 호출
-            if refresh_missing and not price_payload:
-                try:
-                    live = await price_service.get_current_price(
-                        stock_code=item["stock_code"],
-                        market=market,
-                        use_cache=False,
-                    )
-                    price_payload = live.get("price", {}) if isinstance(live, dict) else {}
-                    source = live.get("source") if isinstance(live, dict) else "kis"
-                except Exception:
-                    price_payload = {}
-                    source = "error"
-
-            # NXT 시세 추가 조회
-            if include_nxt:
-                if use_cache:
-                    nxt_cached = self.db.get_current_price(item["stock_code"], "NX")
-                    if nxt_cached:
-                        nxt_price_payload = price_service._parse_price_json(
-                            nxt_cached.get("price_json")
-                        )
-                        if nxt_price_payload and price_service._is_cache_valid(
-                            nxt_cached.get("updated_at"), max_age_sec
-                        ):
-                            nxt_source = "db"
-                        else:
-                            nxt_price_payload = {}
-
-                if refresh_missing and not nxt_price_payload:
-                    try:
-                        nxt_live = await price_service.get_current_price(
-                            stock_code=item["stock_code"],
-                            market="NX",
-                            use_cache=False,
-                        )
-                        nxt_price_payload = (
-                            nxt_live.get("price", {}) if isinstance(nxt_live, dict) else {}
-                        )
-                        nxt_source = nxt_live.get("source") if isinstance(nxt_live, dict) else "kis"
-                    except Exception:
-                        nxt_price_payload = {}
-                        nxt_source = "error"
+                exchange = self._resolve_overseas_exchange(meta)
+                keys = {"": (item["stock_code"], exchange or "US")}
+                exchanges[keys[""]] = exchange
+            else:
+                keys = {"": (item["stock_code"], market)}
+                if include_nxt:
+                    keys["nxt_"] = (item["stock_code"], "NX")
+            for key in keys.values():
+                metas.setdefault(key, meta)
+            item_keys.append(keys)
+
+        prices = await self._load_prices(
+            metas,
+            exchanges,
+            use_cache=use_cache,
+            max_age_sec=max_age_sec,
+            refresh_missing=refresh_missing,
+            stale_while_revalidate_sec=stale_while_revalidate_sec,
+        )
 
+        results = []
+        for item, keys in zip(items, item_keys):
+            meta = stock_meta_by_code.get(item["stock_code"], {})
             result_item = {
                 **item,
                 "market": meta.get("market"),
                 "exchange": meta.get("exchange"),
-                "price_source": source,
-                "current_price": price_payload.get("stck_prpr"),
-                "volume": price_payload.get("acml_vol"),
-                "change": price_payload.get("prdy_vrss"),
-                "change_rate": price_payload.get("prdy_ctrt"),
             }
+            for prefix, key in keys.items():
+                summary, source, stale, age_sec = prices.get(key, ({}, None, False, None))
+                result_item[f"{prefix}price_source"] = source
+                result_item[f"{prefix}price_stale"] = stale
+                result_item[f"{prefix}price_age_sec"] = age_sec
+                fields = self._price_fields(summary, domestic=key not in exchanges)
+                for field, value in fields.items():
+                    result_item[f"{prefix}{field}"] = value
+            results.append(result_item)
+        return results
+
+    async def _load_prices(
+        self,
+        metas: dict[tuple[str, str], dict],
+        exchanges: dict[tuple[str, str], str | None],
+        use_cache: bool,
+        max_age_sec: int | None,
+        refresh_missing: bool,
+        stale_while_revalidate_sec: int | None,
+    ) -> dict[tuple[str, str], tuple]:
+        """(stock_code, market)별 (요약 값, 출처, stale, age_sec) 조회."""
+        price_service = self.price_service
+        prices: dict[tuple[str, str], tuple] = {}
+
+        if use_cache:
+            max_ages = {
+                key: self.ttl_policy.max_age_sec(
+                    key[1],
+                    max_age_sec,
+                    session_start=metas[key].get("session_start"),
+                    session_end=metas[key].get("session_end"),
+                )
+                for key in metas
+            }
+            windows = {
+                key: value + stale_while_revalidate_sec
+                if value is not None and stale_while_revalidate_sec
+                else value
+                for key, value in max_ages.items()
+            }
+            cached = await price_service.get_cached_prices(windows)
+            for key, entry in cached.items():
+                age_sec = price_service.cache.age_sec(entry)
+                stale = price_service.is_stale(age_sec, max_ages[key])
+                if stale and self._is_refreshable(key, exchanges):
+                    price_service.schedule_refresh(*key, self._loader_for(key, exchanges))
+                prices[key] = (entry.summary, "db", stale, age_sec)
+
+        if refresh_missing:
+            missing = [key for key in metas if key not in prices]
+            prices.update(await self.refresh_prices(missing, exchanges))
+        return prices
+
+    async def refresh_prices(
+        self,
+        keys: list[tuple[str, str]],
+        exchanges: dict[tuple[str, str], str | None] | None = None,
+    ) -> dict[tuple[str, str], tuple]:
+        """종목 현재가를 KIS에서 조회하고 결과를 한 번에 기록.
 
-            if include_nxt:
-                result_item["nxt_price_source"] = nxt_source
-                result_item["nxt_current_price"] = nxt_price_payload.get("stck_prpr")
-                result_item["nxt_volume"] = nxt_price_payload.get("acml_vol")
-                result_item["nxt_change"] = nxt_price_payload.get("prdy_vrss")
-                result_item["nxt_change_rate"] = nxt_price_payload.get("prdy_ctrt")
+        KRX(J) 종목은 관심종목(멀티종목) 시세 API로 ``MULTI_PRICE_LIMIT``개씩 묶어 조회하고,
+        NXT·해외 종목은 종목별로 호출합니다. 같은 키는 한 번만, 단일 조회 캐시를 거쳐
+        ``refresh_concurrency``개까지 동시에 조회합니다.
 
-            return result_item
+        Args:
+            keys: 조회할 (stock_code, market) 목록 (중복은 한 번만 조회)
+            exchanges: 해외 종목 키별 거래소 코드 (확인할 수 없으면 None)
 
-        # 모든 종목 동시 조회
-        results = await asyncio.gather(*[fetch_item_price(item) for item in items])
-        return list(results)
+        Returns:
+            키별 (요약 값, 출처, stale, age_sec)
+        """
+        exchanges = exchanges or {}
+        price_service = self.price_service
+        prices: dict[tuple[str, str], tuple] = {}
+
+        loaders = {}
+        batched = []
+        for key in dict.fromkeys(keys):
+            if not self._is_refreshable(key, exchanges):
+                prices[key] = ({}, "error", False, None)
+            elif self._is_batchable(key, exchanges):
+                batched.append(key)
+            else:
+                loaders[key] = self._loader_for(key, exchanges, store=False)
+        if batched:
+            batch_loaders = price_service.batch_refresh_loaders([code for code, _ in batched])
+            for key in batched:
+                loaders[key] = batch_loaders[key[0]]
+        if not loaders:
+            return prices
+
+        semaphore = asyncio.Semaphore(self.refresh_concurrency)
+
+        async def fetch(key: tuple[str, str], loader) -> dict:
+            async with semaphore:
+                return await price_service.cache.load(*key, loader)
+
+        fetched = await asyncio.gather(
+            *(fetch(key, loader) for key, loader in loaders.items()),
+            return_exceptions=True,
+        )
+
+        rows = []
+        for key, result in zip(loaders, fetched):
+            if isinstance(result, BaseException):
+                prices[key] = ({}, "error", False, None)
+                continue
+            if key in exchanges:
+                payload = result if isinstance(result, dict) else {}
+            else:
+                payload = result.get("price", {}) if isinstance(result, dict) else {}
+            if payload:
+                rows.append((*key, payload))
+            prices[key] = (extract_summary(payload) if payload else {}, "kis", False, 0.0)
+
+        if rows:
+            await price_service.store_prices(rows)
+        return prices
+
+    def _is_refreshable(
+        self,
+        key: tuple[str, str],
+        exchanges: dict[tuple[str, str], str | None],
+    ) -> bool:
+        if key in exchanges:
+            return exchanges[key] is not None
+        return key[1].upper() in self.price_service.VALID_MARKETS
+
+    @staticmethod
+    def _is_batchable(
+        key: tuple[str, str],
+        exchanges: dict[tuple[str, str], str | None],
+    ) -> bool:
+        """관심종목 시세 API로 묶어 조회할 수 있는 KRX(J) 키인지 여부."""
+        return key not in exchanges and key[1].upper() == "J"
+
+    def _loader_for(
+        self,
+        key: tuple[str, str],
+        exchanges: dict[tuple[str, str], str | None],
+        store: bool = True,
+    ):
+        if key in exchanges:
+            return self._overseas_loader(key[0], exchanges[key], store)
+        return self.price_service.refresh_loader(*key, store=store)
+
+    def _overseas_loader(self, symbol: str, exchange: str, store: bool = True):
+        """해외 현재가 조회 loader (``cache.load``용)."""
+
+        async def load() -> dict:
+            live = await self.overseas_service.get_current_price(symbol=symbol, exchange=exchange)
+            live = live if isinstance(live, dict) else {}
+            if live and store:
+                await self.price_service.store_price(symbol, exchange, live)
+            return live
+
+        return load
+
+    @staticmethod
+    def _price_fields(summary: dict, domestic: bool = True) -> dict:
+        """요약 컬럼 값을 응답 필드(문자열)로 변환 (국내 등락률은 소수 둘째 자리)."""
+        return {
+            "current_price": format_number(summary.get("price")),
+            "volume": format_number(summary.get("volume")),
+            "change": format_number(summary.get("change")),
+            "change_rate": format_number(summary.get("change_rate"), 2 if domestic else None),
+        }
 
     def _get_stock_meta_map(self, codes: list[str]) -> dict[str, dict]:
         if not codes:
             return {}
-        conn = self.db.connect()
+        conn = self.db.read_connection()
         placeholders = ",".join("?" for _ in codes)
         cursor = conn.execute(
             f"""
-            SELECT code, standard_code, name, market, exchange
+            SELECT code, standard_code, name, market, exchange, session_start, session_end
             FROM stocks
             WHERE code IN ({placeholders})
             """,
@@ -484,6 +560,8 @@ class WatchListService:
                 "name": row["name"],
                 "market": row["market"],
                 "exchange": row["exchange"],
+                "session_start": row["session_start"],
+                "session_end": row["session_end"],
             }
             for row in rows
         }
@@ -502,8 +580,7 @@ class WatchListService:
 
         return None
 
-    def _create_default_folder(self, watchlist_id: int) -> dict:
-        conn = self.db.connect()
+    def _create_default_folder(self, conn: sqlite3.Connection, watchlist_id: int) -> dict:
         cursor = conn.execute(
             """
             INSERT INTO watchlist_folders (watchlist_id, name, description, is_default)
@@ -520,26 +597,25 @@ class WatchListService:
         }
 
     def _ensure_default_folder(self, watchlist_id: int) -> int:
-        conn = self.db.connect()
-        cursor = conn.execute(
-            """
-            SELECT id
-            FROM watchlist_folders
-            WHERE watchlist_id = ? AND is_default = 1
-            LIMIT 1
-            """,
-            (watchlist_id,),
-        )
-        row = cursor.fetchone()
-        if row:
-            return row["id"]
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                """
+                SELECT id
+                FROM watchlist_folders
+                WHERE watchlist_id = ? AND is_default = 1
+                LIMIT 1
+                """,
+                (watchlist_id,),
+            )
+            row = cursor.fetchone()
+            if row:
+                return row["id"]
 
-        default_folder = self._create_default_folder(watchlist_id)
-        conn.commit()
+            default_folder = self._create_default_folder(conn, watchlist_id)
         return default_folder["id"]
 
     def _get_folder(self, watchlist_id: int, folder_id: int) -> dict | None:
-        conn = self.db.connect()
+        conn = self.db.read_connection()
         cursor = conn.execute(
             """
             SELECT id, watchlist_id, name, description, is_default
@@ -23,6 +23,7 @@ class KISConfig:
     kis_timeout_sec: float = 30.0  # KIS 요청 타임아웃 (초)
     kis_max_retries: int = 2  # KIS 재시도 횟수
     kis_retry_backoff_sec: float = 0.5  # 재시도 백오프 기본값 (초)
+    kis_max_calls_per_sec: float = 15.0  # KIS 초당 호출 제한 (요청·백그라운드 갱신 공유, 0이면 제한 없음)
 
     @property
     def base_url(self) -> str:
@@ -32,6 +33,14 @@ class KISConfig:
         return "https://openapivts.koreainvestment.com:29443"
 
 
+@dataclass
+class PriceRefreshConfig:
+    """현재가 백그라운드 갱신 설정"""
+
+    interval_sec: float = 10.0  # 갱신 주기 (초, 0이면 사용 안 함)
+    max_calls_per_sec: float = 4.0  # KIS 초당 호출 제한 중 백그라운드 갱신이 쓸 수 있는 최대 몫
+
+
 def load_config() -> KISConfig:
     """
     환경 변수에서 설정을 로드합니다.
@@ -42,16 +51,7 @@ def load_config() -> KISConfig:
     Raises:
         ValueError: 필수 환경 변수가 없을 경우
     """
-    # .env 파일 로드 (프로젝트 루트 우선)
-    base_dir = Path(__file__).resolve().parent
-    env_candidates = [
-        base_dir.parent / ".env",
-        base_dir / ".env",
-    ]
-    for env_path in env_candidates:
-        if env_path.exists():
-            load_dotenv(env_path)
-            break
+    _load_env_file()
 
     app_key = os.getenv("KIS_APP_KEY")
     app_secret = os.getenv("KIS_APP_SECRET")
@@ -61,6 +61,7 @@ def load_config() -> KISConfig:
     kis_timeout_sec = _get_env_float("WATCHER_KIS_TIMEOUT_SEC", 30.0, min_value=0.1)
     kis_max_retries = _get_env_int("WATCHER_KIS_MAX_RETRIES", 2, min_value=0)
     kis_retry_backoff_sec = _get_env_float("WATCHER_KIS_RETRY_BACKOFF_SEC", 0.5, min_value=0.0)
+    kis_max_calls_per_sec = _get_env_float("WATCHER_KIS_MAX_CALLS_PER_SEC", 15.0, min_value=0.0)
 
     if not app_key:
         raise ValueError("KIS_APP_KEY 환경 변수가 설정되지 않았습니다.")
@@ -76,9 +77,41 @@ def load_config() -> KISConfig:
         kis_timeout_sec=kis_timeout_sec,
         kis_max_retries=kis_max_retries,
         kis_retry_backoff_sec=kis_retry_backoff_sec,
+        kis_max_calls_per_sec=kis_max_calls_per_sec,
+    )
+
+
+def load_price_refresh_config() -> PriceRefreshConfig:
+    """
+    환경 변수에서 현재가 백그라운드 갱신 설정을 로드합니다.
+
+    KIS 인증 정보가 없어도 로드되며, 없으면 갱신 시 호출이 실패로 기록됩니다.
+
+    Returns:
+        PriceRefreshConfig: 현재가 백그라운드 갱신 설정 객체
+    """
+    _load_env_file()
+    return PriceRefreshConfig(
+        interval_sec=_get_env_float("WATCHER_PRICE_REFRESH_SEC", 10.0, min_value=0.0),
+        max_calls_per_sec=_get_env_float(
+            "WATCHER_PRICE_REFRESH_MAX_CALLS_PER_SEC", 4.0, min_value=0.1
+        ),
     )
 
 
+def _load_env_file() -> None:
+    """.env 파일 로드 (프로젝트 루트 우선)"""
+    base_dir = Path(__file__).resolve().parent
+    env_candidates = [
+        base_dir.parent / ".env",
+        base_dir / ".env",
+    ]
+    for env_path in env_candidates:
+        if env_path.exists():
+            load_dotenv(env_path)
+            break
+
+
 def _get_env_int(name: str, default: int, min_value: int | None = None) -> int:
     raw = os.getenv(name)
     if raw is None or raw == "":
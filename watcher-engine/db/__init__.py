@@ -1,8 +1,10 @@
 # DB Module
+from .async_database import AsyncDatabase
 from .database import Database
 from .models import HoldingLot, Stock, StockListing, StockPricePeriodic, Trade
 
 __all__ = [
+    "AsyncDatabase",
     "Database",
     "Stock",
     "StockListing",
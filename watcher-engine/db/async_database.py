@@ -0,0 +1,148 @@
+"""이벤트 루프를 막지 않는 비동기 DB 접근 계층."""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from .database import Database
+from .models import StockPricePeriodic
+from .write_buffer import DEFAULT_FLUSH_INTERVAL_MS, DEFAULT_MAX_ROWS, CurrentPriceWriteBuffer
+
+T = TypeVar("T")
+
+READER_THREADS = 4
+
+
+class AsyncDatabase:
+    """``Database`` 호출을 전용 스레드에서 실행하고 awaitable로 돌려주는 래퍼.
+
+    읽기는 스레드 풀(스레드마다 읽기 전용 연결)에서, 쓰기는 단일 writer 스레드에서
+    순서대로 실행합니다. ``:memory:`` DB는 연결이 하나뿐이므로 읽기도 writer
+    스레드에서 실행합니다.
+
+    현재가 upsert는 ``price_buffer``에 모았다가 한 트랜잭션으로 기록하고(write-behind),
+    현재가 조회는 버퍼를 먼저 확인하므로 기록 전 값도 바로 보입니다.
+    """
+
+    def __init__(
+        self,
+        db: Database | None = None,
+        reader_threads: int = READER_THREADS,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        max_buffered_rows: int = DEFAULT_MAX_ROWS,
+        keep_raw_payload: bool = True,
+    ):
+        self.db = db or Database()
+        self.price_buffer = CurrentPriceWriteBuffer(
+            self,
+            flush_interval_ms=flush_interval_ms,
+            max_rows=max_buffered_rows,
+            keep_raw=keep_raw_payload,
+        )
+        self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        if self.db.is_memory:
+            self._read_executor = self._write_executor
+        else:
+            self._read_executor = ThreadPoolExecutor(
+                max_workers=reader_threads,
+                thread_name_prefix="db-reader",
+            )
+
+    async def read(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """읽기 작업을 읽기 스레드 풀에서 실행."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_executor, partial(func, *args, **kwargs))
+
+    async def write(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """쓰기 작업을 writer 스레드에서 쓰기 잠금을 잡고 실행."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._write_executor,
+            partial(self._locked, func, *args, **kwargs),
+        )
+
+    def _locked(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self.db.write_lock:
+            return func(*args, **kwargs)
+
+    async def get_current_price(self, stock_code: str, market: str) -> dict | None:
+        buffered = self.price_buffer.get(stock_code, market)
+        if buffered is not None:
+            return buffered
+        return await self.read(self.db.get_current_price, stock_code, market)
+
+    async def get_current_prices(
+        self,
+        keys: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], dict]:
+        """버퍼를 먼저 확인하고 나머지는 DB에서 한 번에 조회."""
+        result = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            buffered = self.price_buffer.get(*key)
+            if buffered is not None:
+                result[key] = buffered
+            else:
+                missing.append(key)
+        if missing:
+            result.update(await self.read(self.db.get_current_prices, missing))
+        return result
+
+    async def get_current_price_updated_at(
+        self,
+        keys: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], str | None]:
+        """버퍼를 먼저 확인하고 나머지는 DB에서 저장 시각만 한 번에 조회."""
+        result = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            buffered = self.price_buffer.get(*key)
+            if buffered is not None:
+                result[key] = buffered["updated_at"]
+            else:
+                missing.append(key)
+        if missing:
+            result.update(await self.read(self.db.get_current_price_updated_at, missing))
+        return result
+
+    async def upsert_current_price(self, stock_code: str, market: str, payload: dict) -> str:
+        return await self.price_buffer.put(stock_code, market, payload)
+
+    async def upsert_current_prices(self, rows: list[tuple[str, str, dict]]) -> str:
+        """(stock_code, market, payload) 목록을 버퍼에 한 번에 넣고 기록할 ``updated_at`` 반환."""
+        return await self.price_buffer.put_many(rows)
+
+    async def get_periodic_prices(
+        self,
+        stock_code: str,
+        market: str,
+        period: str,
+        adj_price: int,
+        start_date: str,
+        end_date: str,
+    ) -> list[dict]:
+        return await self.read(
+            self.db.get_periodic_prices,
+            stock_code,
+            market,
+            period,
+            adj_price,
+            start_date,
+            end_date,
+        )
+
+    async def insert_periodic_prices(self, prices: list[StockPricePeriodic]) -> int:
+        return await self.write(self.db.insert_periodic_prices, prices)
+
+    async def aclose(self) -> None:
+        """버퍼에 남은 현재가를 기록하고 스레드 종료."""
+        await self.price_buffer.close()
+        self.close()
+
+    def close(self) -> None:
+        """실행 중인 작업을 마치고 스레드 종료 (버퍼는 기록하지 않음)."""
+        self._write_executor.shutdown(wait=True)
+        if self._read_executor is not self._write_executor:
+            self._read_executor.shutdown(wait=True)
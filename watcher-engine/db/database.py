@@ -1,41 +1,203 @@
 """SQLite 데이터베이스 연결 관리."""
+from contextlib import contextmanager
+import json
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from .models import HoldingLot, Stock, StockListing, StockPricePeriodic, Trade
+from .price_codec import encode_row, utc_timestamp
+
+MEMORY_PATH = ":memory:"
+BUSY_TIMEOUT_MS = 5000
+CACHE_SIZE_KIB = 16384
+MMAP_SIZE_BYTES = 128 * 1024 * 1024
+# 일괄 현재가 조회 한 번에 묶는 키 수 (바인딩 변수 2개/키, SQLite 기본 한도 999 이내)
+CURRENT_PRICE_BATCH_SIZE = 400
+
+
+def _configure(conn: sqlite3.Connection, read_only: bool = False) -> sqlite3.Connection:
+    """연결 단위 PRAGMA 적용."""
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE_BYTES}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    if read_only:
+        conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+class ConnectionPool:
+    """DB 파일 하나에 대한 공유 연결 풀.
+
+    쓰기 연결은 하나를 공유하고, 읽기 전용 연결은 스레드마다 하나씩 둡니다.
+    WAL 모드에서는 읽기 연결이 진행 중인 쓰기 트랜잭션에 막히지 않고
+    마지막 커밋 시점의 데이터를 읽습니다.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.write_lock = threading.RLock()
+        self.schema_ready = False
+        self._writer: sqlite3.Connection | None = None
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+    @property
+    def writer(self) -> sqlite3.Connection:
+        """쓰기 연결 (최초 연결 시 WAL 모드로 전환)."""
+        with self.write_lock:
+            if self._writer is None:
+                conn = self._open()
+                conn.execute("PRAGMA journal_mode = WAL")
+                self._writer = _configure(conn)
+            return self._writer
+
+    @property
+    def reader(self) -> sqlite3.Connection:
+        """현재 스레드의 읽기 전용 연결."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.writer
+            conn = _configure(self._open(), read_only=True)
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """풀의 모든 연결 종료."""
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            conn.close()
+        self._local = threading.local()
+        with self.write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def _open(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            str(self.db_path),
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+        )
+
+
+_pools: dict[Path, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Path) -> ConnectionPool:
+    """경로별 공유 연결 풀 조회 (없으면 생성)."""
+    key = db_path.resolve()
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(key)
+        return pool
+
+
+def close_pools() -> None:
+    """열려 있는 모든 연결 풀 종료."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
 
 
 class Database:
-    """SQLite 데이터베이스 연결 및 테이블 관리."""
+    """SQLite 데이터베이스 연결 및 테이블 관리.
+
+    파일 DB는 경로별 공유 연결 풀(WAL, 쓰기 1 + 스레드별 읽기)을 쓰므로
+    요청마다 인스턴스를 만들어도 연결을 새로 열지 않습니다.
+    ``:memory:`` DB는 인스턴스마다 연결 하나를 읽기/쓰기에 함께 씁니다.
+    """
 
     def __init__(self, db_path: str = "data/stocks.db"):
         """데이터베이스 초기화.
 
         Args:
-            db_path: SQLite 파일 경로
+            db_path: SQLite 파일 경로 (``:memory:`` 가능)
         """
+        self.is_memory = db_path == MEMORY_PATH
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.is_memory:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.conn: Optional[sqlite3.Connection] = None
+        self._pool: ConnectionPool | None = None
+        self._memory_lock = threading.RLock()
+        self._schema_ready = False
+
+    def connect(self) -> None:
+        """연결 준비 (쓰기 연결은 ``transaction()``으로만 사용)."""
+        self._writer_connection()
 
-    def connect(self) -> sqlite3.Connection:
-        """데이터베이스 연결."""
+    def _writer_connection(self) -> sqlite3.Connection:
+        """쓰기 연결 (파일 DB는 풀의 공유 연결). 쓰기 잠금 없이 밖으로 내보내지 않음."""
         if self.conn is None:
-            self.conn = sqlite3.connect(str(self.db_path))
-            self.conn.row_factory = sqlite3.Row
-            self.conn.execute("PRAGMA foreign_keys = ON")
+            if self.is_memory:
+                self.conn = _configure(sqlite3.connect(MEMORY_PATH, check_same_thread=False))
+            else:
+                self._pool = get_pool(self.db_path)
+                self.conn = self._pool.writer
         return self.conn
 
+    def read_connection(self) -> sqlite3.Connection:
+        """읽기 전용 연결 반환 (메모리 DB는 쓰기 연결과 동일)."""
+        conn = self._writer_connection()
+        if self._pool is None:
+            return conn
+        return self._pool.reader
+
+    @property
+    def write_lock(self) -> threading.RLock:
+        """쓰기 연결을 공유하는 모든 인스턴스가 함께 쓰는 잠금."""
+        self.connect()
+        return self._pool.write_lock if self._pool is not None else self._memory_lock
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 잠금을 잡고 커밋/롤백까지 처리하는 트랜잭션."""
+        conn = self._writer_connection()
+        with self.write_lock:
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
     def close(self):
-        """연결 종료."""
-        if self.conn:
+        """연결 종료 (풀에서 빌린 공유 연결은 닫지 않음)."""
+        if self.conn and self._pool is None:
             self.conn.close()
-            self.conn = None
+        self.conn = None
+        self._pool = None
+
+    def ensure_schema(self) -> None:
+        """스키마가 아직 준비되지 않은 경우에만 테이블 생성 (DB 경로별 1회)."""
+        self.connect()
+        ready = self._pool.schema_ready if self._pool is not None else self._schema_ready
+        if not ready:
+            self.create_tables()
 
     def create_tables(self):
         """테이블 생성."""
-        conn = self.connect()
+        with self.transaction() as conn:
+            self._create_tables(conn)
+        self._schema_ready = True
+        if self._pool is not None:
+            self._pool.schema_ready = True
+
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
         conn.execute("""
             CREATE TABLE IF NOT EXISTS stocks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -44,9 +206,12 @@ class Database:
                 name TEXT NOT NULL,
                 market TEXT NOT NULL,
                 exchange TEXT NOT NULL,
+                session_start TEXT,
+                session_end TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
+        self._migrate_stock_session_columns(conn)
         conn.execute("CREATE INDEX IF NOT EXISTS idx_stocks_market ON stocks(market)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_stocks_exchange ON stocks(exchange)")
         conn.execute("""
@@ -126,12 +291,18 @@ class Database:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 stock_code TEXT NOT NULL,
                 market TEXT NOT NULL,
-                price_json TEXT NOT NULL,
+                price NUMERIC,
+                change NUMERIC,
+                change_rate REAL,
+                volume INTEGER,
+                trade_amount NUMERIC,
+                raw_payload BLOB,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 UNIQUE (stock_code, market)
             )
         """)
+        self._migrate_stock_price_current_columns(conn)
         conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_stock_price_current_code "
             "ON stock_price_current(stock_code)"
@@ -220,7 +391,6 @@ class Database:
             "CREATE INDEX IF NOT EXISTS idx_watchlist_items_stock_code "
             "ON watchlist_items(stock_code)"
         )
-        conn.commit()
 
     def _migrate_watchlist_items_nullable(self, conn: sqlite3.Connection) -> None:
         """folder_id가 NOT NULL로 생성된 기존 DB를 NULL 허용 스키마로 마이그레이션."""
@@ -269,22 +439,36 @@ class Database:
         Returns:
             삽입된 종목 수
         """
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self.transaction() as conn:
+            cursor = conn.cursor()
 
-        cursor.executemany(
-            """
-            INSERT INTO stocks (code, standard_code, name, market, exchange)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(code) DO UPDATE SET
-                standard_code = excluded.standard_code,
-                name = excluded.name,
-                market = excluded.market,
-                exchange = excluded.exchange
-            """,
-            [(s.code, s.standard_code, s.name, s.market, s.exchange) for s in stocks],
-        )
-        conn.commit()
+            cursor.executemany(
+                """
+                INSERT INTO stocks (
+                    code, standard_code, name, market, exchange, session_start, session_end
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(code) DO UPDATE SET
+                    standard_code = excluded.standard_code,
+                    name = excluded.name,
+                    market = excluded.market,
+                    exchange = excluded.exchange,
+                    session_start = excluded.session_start,
+                    session_end = excluded.session_end
+                """,
+                [
+                    (
+                        s.code,
+                        s.standard_code,
+                        s.name,
+                        s.market,
+                        s.exchange,
+                        s.session_start,
+                        s.session_end,
+                    )
+                    for s in stocks
+                ],
+            )
         return len(stocks)
 
     def insert_stock_listings(self, listings: list[StockListing]) -> int:
@@ -292,19 +476,18 @@ class Database:
         if not listings:
             return 0
 
-        conn = self.connect()
-        cursor = conn.cursor()
-        cursor.executemany(
-            """
-            INSERT INTO stock_listings (stock_code, exchange, is_primary)
-            VALUES (?, ?, ?)
-            ON CONFLICT(stock_code, exchange) DO UPDATE SET
-                is_primary = excluded.is_primary,
-                updated_at = CURRENT_TIMESTAMP
-            """,
-            [(l.stock_code, l.exchange, l.is_primary) for l in listings],
-        )
-        conn.commit()
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT INTO stock_listings (stock_code, exchange, is_primary)
+                VALUES (?, ?, ?)
+                ON CONFLICT(stock_code, exchange) DO UPDATE SET
+                    is_primary = excluded.is_primary,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                [(l.stock_code, l.exchange, l.is_primary) for l in listings],
+            )
         return len(listings)
 
     def insert_periodic_prices(self, prices: list[StockPricePeriodic]) -> int:
@@ -312,117 +495,114 @@ class Database:
         if not prices:
             return 0
 
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self.transaction() as conn:
+            cursor = conn.cursor()
 
-        cursor.executemany(
-            """
-            INSERT INTO stock_price_periodic (
-                stock_code,
-                market,
-                period,
-                adj_price,
-                business_date,
-                open_price,
-                high_price,
-                low_price,
-                close_price,
-                volume,
-                trade_amount,
-                flng_cls_code,
-                prtt_rate,
-                mod_yn,
-                prdy_vrss_sign,
-                prdy_vrss,
-                revl_issu_reas
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(stock_code, market, period, adj_price, business_date) DO UPDATE SET
-                open_price = excluded.open_price,
-                high_price = excluded.high_price,
-                low_price = excluded.low_price,
-                close_price = excluded.close_price,
-                volume = excluded.volume,
-                trade_amount = excluded.trade_amount,
-                flng_cls_code = excluded.flng_cls_code,
-                prtt_rate = excluded.prtt_rate,
-                mod_yn = excluded.mod_yn,
-                prdy_vrss_sign = excluded.prdy_vrss_sign,
-                prdy_vrss = excluded.prdy_vrss,
-                revl_issu_reas = excluded.revl_issu_reas,
-                updated_at = CURRENT_TIMESTAMP
-            """,
-            [
-                (
-                    p.stock_code,
-                    p.market,
-                    p.period,
-                    p.adj_price,
-                    p.business_date,
-                    p.open_price,
-                    p.high_price,
-                    p.low_price,
-                    p.close_price,
-                    p.volume,
-                    p.trade_amount,
-                    p.flng_cls_code,
-                    p.prtt_rate,
-                    p.mod_yn,
-                    p.prdy_vrss_sign,
-                    p.prdy_vrss,
-                    p.revl_issu_reas,
+            cursor.executemany(
+                """
+                INSERT INTO stock_price_periodic (
+                    stock_code,
+                    market,
+                    period,
+                    adj_price,
+                    business_date,
+                    open_price,
+                    high_price,
+                    low_price,
+                    close_price,
+                    volume,
+                    trade_amount,
+                    flng_cls_code,
+                    prtt_rate,
+                    mod_yn,
+                    prdy_vrss_sign,
+                    prdy_vrss,
+                    revl_issu_reas
                 )
-                for p in prices
-            ],
-        )
-        conn.commit()
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(stock_code, market, period, adj_price, business_date) DO UPDATE SET
+                    open_price = excluded.open_price,
+                    high_price = excluded.high_price,
+                    low_price = excluded.low_price,
+                    close_price = excluded.close_price,
+                    volume = excluded.volume,
+                    trade_amount = excluded.trade_amount,
+                    flng_cls_code = excluded.flng_cls_code,
+                    prtt_rate = excluded.prtt_rate,
+                    mod_yn = excluded.mod_yn,
+                    prdy_vrss_sign = excluded.prdy_vrss_sign,
+                    prdy_vrss = excluded.prdy_vrss,
+                    revl_issu_reas = excluded.revl_issu_reas,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                [
+                    (
+                        p.stock_code,
+                        p.market,
+                        p.period,
+                        p.adj_price,
+                        p.business_date,
+                        p.open_price,
+                        p.high_price,
+                        p.low_price,
+                        p.close_price,
+                        p.volume,
+                        p.trade_amount,
+                        p.flng_cls_code,
+                        p.prtt_rate,
+                        p.mod_yn,
+                        p.prdy_vrss_sign,
+                        p.prdy_vrss,
+                        p.revl_issu_reas,
+                    )
+                    for p in prices
+                ],
+            )
         return len(prices)
 
     def insert_holding_lot(self, lot: HoldingLot) -> int:
         """매수 Lot 삽입."""
-        conn = self.connect()
-        cursor = conn.execute(
-            """
-            INSERT INTO holding_lots (
-                stock_code,
-                quantity,
-                buy_price,
-                buy_date,
-                remaining_qty,
-                is_closed,
-                memo
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO holding_lots (
+                    stock_code,
+                    quantity,
+                    buy_price,
+                    buy_date,
+                    remaining_qty,
+                    is_closed,
+                    memo
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    lot.stock_code,
+                    lot.quantity,
+                    lot.buy_price,
+                    lot.buy_date,
+                    lot.remaining_qty,
+                    1 if lot.is_closed else 0,
+                    lot.memo,
+                ),
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                lot.stock_code,
-                lot.quantity,
-                lot.buy_price,
-                lot.buy_date,
-                lot.remaining_qty,
-                1 if lot.is_closed else 0,
-                lot.memo,
-            ),
-        )
-        conn.commit()
         return int(cursor.lastrowid)
 
     def update_lot_remaining_qty(self, lot_id: int, remaining_qty: int, is_closed: bool) -> None:
         """Lot의 남은 수량/종결 상태 갱신."""
-        conn = self.connect()
-        conn.execute(
-            """
-            UPDATE holding_lots
-            SET remaining_qty = ?, is_closed = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """,
-            (remaining_qty, 1 if is_closed else 0, lot_id),
-        )
-        conn.commit()
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                UPDATE holding_lots
+                SET remaining_qty = ?, is_closed = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                (remaining_qty, 1 if is_closed else 0, lot_id),
+            )
 
     def get_open_lots(self, stock_code: str) -> list[HoldingLot]:
         """미종결 Lot 조회 (FIFO 순서)."""
-        conn = self.connect()
+        conn = self.read_connection()
         cursor = conn.execute(
             """
             SELECT
@@ -461,40 +641,39 @@ class Database:
 
     def insert_trade(self, trade: Trade) -> int:
         """거래 내역 삽입."""
-        conn = self.connect()
-        cursor = conn.execute(
-            """
-            INSERT INTO trades (
-                stock_code,
-                trade_type,
-                quantity,
-                price,
-                trade_date,
-                realized_pnl,
-                matched_lots,
-                memo
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO trades (
+                    stock_code,
+                    trade_type,
+                    quantity,
+                    price,
+                    trade_date,
+                    realized_pnl,
+                    matched_lots,
+                    memo
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    trade.stock_code,
+                    trade.trade_type,
+                    trade.quantity,
+                    trade.price,
+                    trade.trade_date,
+                    trade.realized_pnl,
+                    trade.matched_lots,
+                    trade.memo,
+                ),
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                trade.stock_code,
-                trade.trade_type,
-                trade.quantity,
-                trade.price,
-                trade.trade_date,
-                trade.realized_pnl,
-                trade.matched_lots,
-                trade.memo,
-            ),
-        )
-        conn.commit()
         return int(cursor.lastrowid)
 
     def get_trades(
         self, stock_code: str | None = None, trade_type: str | None = None
     ) -> list[Trade]:
         """거래 내역 조회."""
-        conn = self.connect()
+        conn = self.read_connection()
 
         conditions = []
         params = []
@@ -551,7 +730,7 @@ class Database:
         end_date: str,
     ) -> list[dict]:
         """기간별 시세 데이터 조회."""
-        conn = self.connect()
+        conn = self.read_connection()
         cursor = conn.execute(
             """
             SELECT
@@ -616,32 +795,31 @@ class Database:
         expired_at: str | None,
     ) -> None:
         """KIS 토큰 저장/갱신."""
-        conn = self.connect()
-        conn.execute(
-            """
-            INSERT INTO kis_tokens (
-                app_key,
-                base_url,
-                access_token,
-                token_type,
-                expires_in,
-                expired_at
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO kis_tokens (
+                    app_key,
+                    base_url,
+                    access_token,
+                    token_type,
+                    expires_in,
+                    expired_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(app_key, base_url) DO UPDATE SET
+                    access_token = excluded.access_token,
+                    token_type = excluded.token_type,
+                    expires_in = excluded.expires_in,
+                    expired_at = excluded.expired_at,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (app_key, base_url, access_token, token_type, expires_in, expired_at),
             )
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(app_key, base_url) DO UPDATE SET
-                access_token = excluded.access_token,
-                token_type = excluded.token_type,
-                expires_in = excluded.expires_in,
-                expired_at = excluded.expired_at,
-                updated_at = CURRENT_TIMESTAMP
-            """,
-            (app_key, base_url, access_token, token_type, expires_in, expired_at),
-        )
-        conn.commit()
 
     def get_kis_token(self, app_key: str, base_url: str) -> dict | None:
         """KIS 저장 토큰 조회."""
-        conn = self.connect()
+        conn = self.read_connection()
         cursor = conn.execute(
             """
             SELECT access_token, token_type, expires_in, expired_at
@@ -663,38 +841,78 @@ class Database:
 
     def delete_kis_token(self, app_key: str, base_url: str) -> None:
         """저장된 KIS 토큰 삭제."""
-        conn = self.connect()
-        conn.execute(
-            "DELETE FROM kis_tokens WHERE app_key = ? AND base_url = ?",
-            (app_key, base_url),
-        )
-        conn.commit()
+        with self.transaction() as conn:
+            conn.execute(
+                "DELETE FROM kis_tokens WHERE app_key = ? AND base_url = ?",
+                (app_key, base_url),
+            )
 
-    def upsert_current_price(self, stock_code: str, market: str, price_json: str) -> None:
+    def upsert_current_price(
+        self,
+        stock_code: str,
+        market: str,
+        payload: dict,
+        keep_raw: bool = True,
+    ) -> None:
         """현재가 데이터 저장/갱신."""
-        conn = self.connect()
-        conn.execute(
-            """
-            INSERT INTO stock_price_current (
-                stock_code,
-                market,
-                price_json
+        self.upsert_current_prices([(stock_code, market, payload, utc_timestamp())], keep_raw)
+
+    def upsert_current_prices(
+        self,
+        rows: list[tuple[str, str, dict, str]],
+        keep_raw: bool = True,
+    ) -> int:
+        """현재가 일괄 저장/갱신 (단일 트랜잭션).
+
+        Args:
+            rows: (stock_code, market, payload, updated_at) 목록.
+                updated_at은 CURRENT_TIMESTAMP와 같은 UTC "YYYY-MM-DD HH:MM:SS" 형식
+            keep_raw: 원본 payload를 압축해 raw_payload에 보관할지 여부
+
+        Returns:
+            저장한 행 수
+        """
+        if not rows:
+            return 0
+
+        encoded = [
+            encode_row(stock_code, market, payload, updated_at, keep_raw)
+            for stock_code, market, payload, updated_at in rows
+        ]
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO stock_price_current (
+                    stock_code,
+                    market,
+                    price,
+                    change,
+                    change_rate,
+                    volume,
+                    trade_amount,
+                    raw_payload,
+                    updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(stock_code, market) DO UPDATE SET
+                    price = excluded.price,
+                    change = excluded.change,
+                    change_rate = excluded.change_rate,
+                    volume = excluded.volume,
+                    trade_amount = excluded.trade_amount,
+                    raw_payload = excluded.raw_payload,
+                    updated_at = excluded.updated_at
+                """,
+                encoded,
             )
-            VALUES (?, ?, ?)
-            ON CONFLICT(stock_code, market) DO UPDATE SET
-                price_json = excluded.price_json,
-                updated_at = CURRENT_TIMESTAMP
-            """,
-            (stock_code, market, price_json),
-        )
-        conn.commit()
+        return len(rows)
 
     def get_current_price(self, stock_code: str, market: str) -> dict | None:
-        """저장된 현재가 조회."""
-        conn = self.connect()
+        """저장된 현재가 조회 (요약 컬럼과 압축된 원본, JSON은 해석하지 않음)."""
+        conn = self.read_connection()
         cursor = conn.execute(
             """
-            SELECT price_json, updated_at
+            SELECT price, change, change_rate, volume, trade_amount, raw_payload, updated_at
             FROM stock_price_current
             WHERE stock_code = ? AND market = ?
             LIMIT 1
@@ -704,8 +922,85 @@ class Database:
         row = cursor.fetchone()
         if not row:
             return None
+        return self._current_price_row(row)
+
+    def get_current_prices(
+        self,
+        keys: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], dict]:
+        """여러 종목의 저장된 현재가를 ``(stock_code, market) IN (...)``로 일괄 조회.
+
+        Args:
+            keys: (stock_code, market) 목록 (중복은 한 번만 조회)
+
+        Returns:
+            (stock_code, market)별 ``get_current_price``와 같은 형태의 행 (없는 키는 제외)
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        conn = self.read_connection()
+        result = {}
+        for start in range(0, len(keys), CURRENT_PRICE_BATCH_SIZE):
+            chunk = keys[start:start + CURRENT_PRICE_BATCH_SIZE]
+            placeholders = ",".join("(?, ?)" for _ in chunk)
+            cursor = conn.execute(
+                f"""
+                SELECT
+                    stock_code,
+                    market,
+                    price,
+                    change,
+                    change_rate,
+                    volume,
+                    trade_amount,
+                    raw_payload,
+                    updated_at
+                FROM stock_price_current
+                WHERE (stock_code, market) IN (VALUES {placeholders})
+                """,
+                [value for key in chunk for value in key],
+            )
+            for row in cursor.fetchall():
+                result[(row["stock_code"], row["market"])] = self._current_price_row(row)
+        return result
+
+    def get_current_price_updated_at(
+        self,
+        keys: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], str | None]:
+        """여러 종목 현재가의 저장 시각(``updated_at``)만 일괄 조회 (없는 키는 제외)."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        conn = self.read_connection()
+        result = {}
+        for start in range(0, len(keys), CURRENT_PRICE_BATCH_SIZE):
+            chunk = keys[start:start + CURRENT_PRICE_BATCH_SIZE]
+            placeholders = ",".join("(?, ?)" for _ in chunk)
+            cursor = conn.execute(
+                f"""
+                SELECT stock_code, market, updated_at
+                FROM stock_price_current
+                WHERE (stock_code, market) IN (VALUES {placeholders})
+                """,
+                [value for key in chunk for value in key],
+            )
+            for row in cursor.fetchall():
+                result[(row["stock_code"], row["market"])] = row["updated_at"]
+        return result
+
+    @staticmethod
+    def _current_price_row(row: sqlite3.Row) -> dict:
         return {
-            "price_json": row["price_json"],
+            "price": row["price"],
+            "change": row["change"],
+            "change_rate": row["change_rate"],
+            "volume": row["volume"],
+            "trade_amount": row["trade_amount"],
+            "raw_payload": row["raw_payload"],
             "updated_at": row["updated_at"],
         }
 
@@ -719,7 +1014,7 @@ class Database:
         Returns:
             종목 수
         """
-        conn = self.connect()
+        conn = self.read_connection()
         params = []
         if exchange:
             query = """
@@ -741,6 +1036,60 @@ class Database:
         cursor = conn.execute(query, params)
         return cursor.fetchone()[0]
 
+    def _migrate_stock_price_current_columns(self, conn: sqlite3.Connection) -> None:
+        """price_json 단일 컬럼 스키마를 요약 컬럼 + 압축 원본 스키마로 마이그레이션."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(stock_price_current)")}
+        if "price_json" not in columns:
+            return
+
+        rows = conn.execute(
+            """
+            SELECT stock_code, market, price_json, created_at, updated_at
+            FROM stock_price_current
+            """
+        ).fetchall()
+        conn.execute("""
+            CREATE TABLE stock_price_current_new (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                stock_code TEXT NOT NULL,
+                market TEXT NOT NULL,
+                price NUMERIC,
+                change NUMERIC,
+                change_rate REAL,
+                volume INTEGER,
+                trade_amount NUMERIC,
+                raw_payload BLOB,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (stock_code, market)
+            )
+        """)
+        for row in rows:
+            try:
+                payload = json.loads(row["price_json"]) if row["price_json"] else {}
+            except ValueError:
+                payload = {}
+            encoded = encode_row(row["stock_code"], row["market"], payload, row["updated_at"])
+            conn.execute(
+                """
+                INSERT INTO stock_price_current_new (
+                    stock_code, market, price, change, change_rate, volume, trade_amount,
+                    raw_payload, updated_at, created_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (*encoded, row["created_at"]),
+            )
+        conn.execute("DROP TABLE stock_price_current")
+        conn.execute("ALTER TABLE stock_price_current_new RENAME TO stock_price_current")
+
+    def _migrate_stock_session_columns(self, conn: sqlite3.Connection) -> None:
+        """stocks 테이블에 정규장 시간 컬럼 추가."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(stocks)").fetchall()}
+        for column in ("session_start", "session_end"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE stocks ADD COLUMN {column} TEXT")
+
     def _migrate_stock_listings(self, conn: sqlite3.Connection) -> None:
         """stock_listings 테이블 초기 데이터 마이그레이션."""
         cursor = conn.execute(
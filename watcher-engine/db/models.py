@@ -11,6 +11,8 @@ class Stock:
     name: str  # 종목명 (예: 삼성전자)
     market: str  # 시장 (KOSPI/KOSDAQ)
     exchange: str  # 거래소 (KRX/NXT)
+    session_start: str | None = None  # 정규장 시작 시각 (HHMM, 현지 시각, 해외 종목만)
+    session_end: str | None = None  # 정규장 종료 시각 (HHMM, 현지 시각, 해외 종목만)
 
 
 @dataclass
@@ -0,0 +1,135 @@
+"""현재가 payload와 ``stock_price_current`` 컬럼 간 변환.
+
+자주 읽는 값(가격, 대비, 등락률, 거래량, 거래대금)은 숫자 컬럼에 두고,
+원본 payload는 선택적으로 zlib 압축 JSON(``raw_payload``)으로 보관합니다.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+import zlib
+
+SUMMARY_COLUMNS = ("price", "change", "change_rate", "volume", "trade_amount")
+
+# 국내 현재가(KIS output) 키
+DOMESTIC_KEYS = {
+    "price": "stck_prpr",
+    "change": "prdy_vrss",
+    "change_rate": "prdy_ctrt",
+    "volume": "acml_vol",
+    "trade_amount": "acml_tr_pbmn",
+}
+
+# 해외 현재가(OverseaStockPriceService 응답) 경로
+OVERSEAS_KEYS = {
+    "price": ("price", "last"),
+    "change": ("change", "diff"),
+    "change_rate": ("change", "rate"),
+    "volume": ("volume", "current"),
+    "trade_amount": ("volume", "amount"),
+}
+
+DOMESTIC_MARKETS = {"J", "NX", "UN"}
+COMPRESS_LEVEL = 6
+
+
+def utc_timestamp() -> str:
+    """SQLite CURRENT_TIMESTAMP와 같은 형식의 현재 UTC 시각."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def to_number(value) -> int | float | None:
+    """KIS 문자열 숫자를 int/float로 변환 (빈 값/오류는 None)."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    text = str(value).strip().replace(",", "")
+    if not text:
+        return None
+    try:
+        if "." in text or "e" in text.lower():
+            return float(text)
+        return int(text)
+    except ValueError:
+        return None
+
+
+def format_number(value: int | float | None, decimals: int | None = None) -> str | None:
+    """숫자 컬럼 값을 API 응답용 문자열로 변환."""
+    if value is None:
+        return None
+    if decimals is not None:
+        return f"{value:.{decimals}f}"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def is_overseas_payload(payload: dict) -> bool:
+    return isinstance(payload.get("price"), dict)
+
+
+def extract_summary(payload: dict | None) -> dict[str, int | float | None]:
+    """payload에서 요약 컬럼 값 추출."""
+    if not isinstance(payload, dict) or not payload:
+        return dict.fromkeys(SUMMARY_COLUMNS)
+    if is_overseas_payload(payload):
+        summary = {}
+        for column, (group, key) in OVERSEAS_KEYS.items():
+            section = payload.get(group)
+            summary[column] = to_number(section.get(key) if isinstance(section, dict) else None)
+        return summary
+    return {column: to_number(payload.get(key)) for column, key in DOMESTIC_KEYS.items()}
+
+
+def summary_to_payload(summary: dict, market: str) -> dict:
+    """원본 없이 저장된 행을 요약 값만으로 payload 형태로 복원."""
+    if all(summary.get(column) is None for column in SUMMARY_COLUMNS):
+        return {}
+    if market.upper() in DOMESTIC_MARKETS:
+        payload = {
+            key: format_number(summary.get(column), 2 if column == "change_rate" else None)
+            for column, key in DOMESTIC_KEYS.items()
+        }
+        return {key: value for key, value in payload.items() if value is not None}
+
+    payload: dict[str, dict] = {}
+    for column, (group, key) in OVERSEAS_KEYS.items():
+        payload.setdefault(group, {})[key] = format_number(summary.get(column))
+    return payload
+
+
+def compress_payload(payload: dict | None) -> bytes | None:
+    if not payload:
+        return None
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(data, COMPRESS_LEVEL)
+
+
+def decompress_payload(raw: bytes | None) -> dict:
+    if not raw:
+        return {}
+    try:
+        return json.loads(zlib.decompress(raw))
+    except (zlib.error, ValueError):
+        return {}
+
+
+def encode_row(
+    stock_code: str,
+    market: str,
+    payload: dict | None,
+    updated_at: str,
+    keep_raw: bool = True,
+) -> tuple:
+    """``stock_price_current`` upsert 파라미터 생성."""
+    summary = extract_summary(payload)
+    return (
+        stock_code,
+        market,
+        *(summary[column] for column in SUMMARY_COLUMNS),
+        compress_payload(payload) if keep_raw else None,
+        updated_at,
+    )
@@ -0,0 +1,132 @@
+"""현재가 upsert write-behind 버퍼."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from .price_codec import extract_summary, utc_timestamp
+
+if TYPE_CHECKING:
+    from .async_database import AsyncDatabase
+
+DEFAULT_FLUSH_INTERVAL_MS = 200
+DEFAULT_MAX_ROWS = 500
+
+logger = logging.getLogger(__name__)
+
+
+class CurrentPriceWriteBuffer:
+    """현재가 upsert를 모아 한 트랜잭션으로 기록하는 write-behind 버퍼.
+
+    같은 (stock_code, market)은 마지막 값만 남기고, ``flush_interval_ms``마다
+    또는 ``max_rows``개가 쌓이면 한 번에 커밋합니다. 아직 기록되지 않은 값과
+    커밋 중인 값도 ``get``으로 조회할 수 있고, 기록에 실패한 값은 다시 넣어
+    다음 주기에 재시도합니다. 요약 컬럼 추출과 원본 압축은 기록 시
+    writer 스레드에서 수행합니다.
+    """
+
+    def __init__(
+        self,
+        adb: AsyncDatabase,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        keep_raw: bool = True,
+    ):
+        self.adb = adb
+        self.flush_interval_sec = flush_interval_ms / 1000
+        self.max_rows = max_rows
+        self.keep_raw = keep_raw
+        self.flushes = 0
+        self._pending: dict[tuple[str, str], tuple[dict, str]] = {}
+        self._inflight: dict[tuple[str, str], tuple[dict, str]] = {}
+        self._closed = False
+        self._flush_task: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def get(self, stock_code: str, market: str) -> dict | None:
+        """버퍼에 남아 있는 현재가 조회 (``Database.get_current_price``와 같은 형태)."""
+        key = (stock_code, market)
+        pending = self._pending.get(key) or self._inflight.get(key)
+        if pending is None:
+            return None
+        payload, updated_at = pending
+        return {
+            **extract_summary(payload),
+            "raw_payload": None,
+            "payload": payload,
+            "updated_at": updated_at,
+        }
+
+    async def put(self, stock_code: str, market: str, payload: dict) -> str:
+        """현재가를 버퍼에 넣고, 가득 차면 바로 기록 (기록할 ``updated_at`` 반환)."""
+        return await self.put_many([(stock_code, market, payload)])
+
+    async def put_many(self, rows: list[tuple[str, str, dict]]) -> str:
+        """여러 현재가를 같은 시각으로 한 번에 넣어 같은 트랜잭션으로 기록되게 함.
+
+        Returns:
+            행들에 기록할 ``updated_at``
+        """
+        updated_at = utc_timestamp()
+        if not rows:
+            return updated_at
+        for stock_code, market, payload in rows:
+            self._pending[(stock_code, market)] = (payload, updated_at)
+        if len(self._pending) >= self.max_rows:
+            await self.flush()
+        else:
+            self._schedule_flush()
+        return updated_at
+
+    async def flush(self) -> int:
+        """버퍼의 현재가를 단일 트랜잭션으로 기록."""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            self._inflight, self._pending = self._pending, {}
+            rows = [
+                (stock_code, market, payload, updated_at)
+                for (stock_code, market), (payload, updated_at) in self._inflight.items()
+            ]
+            try:
+                await self.adb.write(self.adb.db.upsert_current_prices, rows, self.keep_raw)
+            except Exception:
+                for key, value in self._inflight.items():
+                    self._pending.setdefault(key, value)
+                self._schedule_flush()
+                raise
+            finally:
+                self._inflight = {}
+            self.flushes += 1
+            return len(rows)
+
+    async def close(self) -> None:
+        """대기 중인 예약 기록을 취소하고 남은 값을 기록."""
+        self._closed = True
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    def _schedule_flush(self) -> None:
+        """예약된 기록이 없으면 ``flush_interval_ms`` 뒤 기록을 예약."""
+        if self._closed:
+            return
+        task = self._flush_task
+        if task is None or task.done() or task is asyncio.current_task():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval_sec)
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("현재가 일괄 저장 실패 (%d건 대기)", len(self._pending))
@@ -10,7 +10,7 @@ from datetime import datetime, timedelta
 
 import httpx
 
-from db import Database
+from db import AsyncDatabase, Database
 from external.client import RETRY_STATUS_CODES, is_retryable_request_error
 
 
@@ -47,6 +47,7 @@ class TokenManager:
         timeout: float = 30.0,
         max_retries: int = 0,
         retry_backoff_sec: float = 0.0,
+        storage: AsyncDatabase | None = None,
     ):
         """
         Args:
@@ -56,6 +57,7 @@ class TokenManager:
             timeout: 요청 타임아웃 (초)
             max_retries: 토큰 요청 재시도 횟수
             retry_backoff_sec: 재시도 기본 대기 시간(초)
+            storage: 토큰 저장소 (DB 호출은 이벤트 루프 밖 스레드에서 실행)
         """
         self.app_key = app_key
         self.app_secret = app_secret
@@ -64,7 +66,7 @@ class TokenManager:
         self.max_retries = max_retries
         self.retry_backoff_sec = retry_backoff_sec
         self._token_info: TokenInfo | None = None
-        self._storage = Database()
+        self._storage = storage or AsyncDatabase(Database())
         self._lock = asyncio.Lock()
         self._refresh_task: asyncio.Task | None = None
 
@@ -85,7 +87,7 @@ class TokenManager:
 
         async with self._lock:
             if self._token_info is None:
-                self._token_info = self._load_token_from_storage()
+                self._token_info = await self._load_token_from_storage()
 
             if self._token_info is None or self._token_info.is_expired:
                 refresh_task = self._refresh_task
@@ -160,18 +162,19 @@ class TokenManager:
             expires_in=result.get("expires_in", 86400),
             expired_at=expired_at,
         )
-        self._save_token_to_storage(self._token_info)
+        await self._save_token_to_storage(self._token_info)
 
     async def _sleep_backoff(self, attempt: int) -> None:
         delay = self.retry_backoff_sec * (2**attempt)
         if delay > 0:
             await asyncio.sleep(delay)
 
-    def _load_token_from_storage(self) -> TokenInfo | None:
+    async def _load_token_from_storage(self) -> TokenInfo | None:
         """저장된 토큰을 조회하여 TokenInfo로 복원."""
+        db = self._storage.db
         try:
-            self._storage.create_tables()
-            stored = self._storage.get_kis_token(self.app_key, self.base_url)
+            await self._storage.write(db.ensure_schema)
+            stored = await self._storage.read(db.get_kis_token, self.app_key, self.base_url)
         except Exception:
             return None
 
@@ -199,11 +202,13 @@ class TokenManager:
             expired_at=expired_at,
         )
 
-    def _save_token_to_storage(self, token_info: TokenInfo) -> None:
+    async def _save_token_to_storage(self, token_info: TokenInfo) -> None:
         """발급된 토큰을 저장."""
+        db = self._storage.db
         try:
-            self._storage.create_tables()
-            self._storage.upsert_kis_token(
+            await self._storage.write(db.ensure_schema)
+            await self._storage.write(
+                db.upsert_kis_token,
                 app_key=self.app_key,
                 base_url=self.base_url,
                 access_token=token_info.access_token,
@@ -219,11 +224,11 @@ class TokenManager:
         """현재 토큰 정보 반환"""
         return self._token_info
 
-    def invalidate(self) -> None:
+    async def invalidate(self) -> None:
         """캐싱된 토큰 무효화"""
         self._token_info = None
         try:
-            self._storage.delete_kis_token(self.app_key, self.base_url)
+            await self._storage.write(self._storage.db.delete_kis_token, self.app_key, self.base_url)
         except Exception:
             pass
 
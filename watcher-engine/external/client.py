@@ -5,6 +5,8 @@ HTTP API 클라이언트 기본 모듈
 """
 
 import asyncio
+import math
+import time
 from typing import Any
 
 import httpx
@@ -26,6 +28,33 @@ class APIError(Exception):
         self.response = response
 
 
+class RateLimiter:
+    """초당 호출 수 제한 (호출 간격을 ``1 / rate_per_sec``로 벌림, 0 이하이면 제한 없음)."""
+
+    def __init__(self, rate_per_sec: float = 0.0, clock=time.monotonic):
+        self.rate_per_sec = rate_per_sec
+        self.clock = clock
+        self._next_at = 0.0
+
+    async def acquire(self) -> None:
+        """다음 호출 슬롯까지 대기."""
+        if self.rate_per_sec <= 0:
+            return
+        now = self.clock()
+        scheduled = max(now, self._next_at)
+        self._next_at = scheduled + 1 / self.rate_per_sec
+        if scheduled > now:
+            await asyncio.sleep(scheduled - now)
+
+    def available(self, window_sec: float) -> int | None:
+        """앞으로 ``window_sec`` 안에 대기 없이 더 쓸 수 있는 호출 수 (제한 없으면 None)."""
+        if self.rate_per_sec <= 0:
+            return None
+        now = self.clock()
+        free_sec = now + window_sec - max(now, self._next_at)
+        return max(0, math.floor(free_sec * self.rate_per_sec))
+
+
 class BaseAPIClient:
     """
     비동기 HTTP API 클라이언트 기본 클래스
@@ -40,6 +69,7 @@ class BaseAPIClient:
         max_concurrency: int | None = None,
         max_retries: int = 0,
         retry_backoff_sec: float = 0.0,
+        max_calls_per_sec: float = 0.0,
     ):
         """
         Args:
@@ -48,12 +78,14 @@ class BaseAPIClient:
             max_concurrency: 동시 호출 제한 (None이면 제한 없음)
             max_retries: 요청 재시도 횟수
             retry_backoff_sec: 재시도 기본 대기 시간(초)
+            max_calls_per_sec: 초당 호출 제한 (0이면 제한 없음, 재시도 포함)
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
         self.max_retries = max_retries
         self.retry_backoff_sec = retry_backoff_sec
+        self.rate_limiter = RateLimiter(max_calls_per_sec)
         self._client: httpx.AsyncClient | None = None
 
     async def _get_client(self) -> httpx.AsyncClient:
@@ -102,6 +134,7 @@ class BaseAPIClient:
 
         attempt = 0
         while True:
+            await self.rate_limiter.acquire()
             try:
                 if self._semaphore is None:
                     response = await client.request(
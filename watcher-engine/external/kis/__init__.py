@@ -1,6 +1,6 @@
 """한국투자증권 API 모듈 패키지"""
 
-from external.kis.client import KISClient
+from external.kis.client import MULTI_PRICE_LIMIT, KISClient
 from external.kis.singleton import get_kis_client, reset_kis_client
 
-__all__ = ["KISClient", "get_kis_client", "reset_kis_client"]
+__all__ = ["MULTI_PRICE_LIMIT", "KISClient", "get_kis_client", "reset_kis_client"]
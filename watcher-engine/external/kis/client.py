@@ -10,6 +10,9 @@ from external.auth import TokenManager
 from external.client import BaseAPIClient
 from core.config import KISConfig
 
+# 관심종목(멀티종목) 시세 조회 한 번에 넣을 수 있는 최대 종목 수
+MULTI_PRICE_LIMIT = 30
+
 
 class KISClient(BaseAPIClient):
     """
@@ -29,6 +32,7 @@ class KISClient(BaseAPIClient):
             max_concurrency=config.kis_max_concurrency,
             max_retries=config.kis_max_retries,
             retry_backoff_sec=config.kis_retry_backoff_sec,
+            max_calls_per_sec=config.kis_max_calls_per_sec,
         )
         self.config = config
         self.token_manager = TokenManager(
@@ -110,6 +114,40 @@ class KISClient(BaseAPIClient):
             extra_headers=extra_headers,
         )
 
+    async def get_multi_current_prices(
+        self,
+        stock_codes: list[str],
+        market: str = "J",
+        custtype: str = "P",
+    ) -> dict[str, Any]:
+        """국내주식 관심종목(멀티종목) 시세 조회.
+
+        Args:
+            stock_codes: 종목코드 목록 (최대 ``MULTI_PRICE_LIMIT``개)
+            market: 시장 분류 코드 (J: KRX)
+            custtype: 고객 타입 (P: 개인, B: 법인)
+
+        Returns:
+            dict: 종목별 시세 목록(``output``)
+        """
+        if not stock_codes or len(stock_codes) > MULTI_PRICE_LIMIT:
+            raise ValueError(f"stock_codes는 1~{MULTI_PRICE_LIMIT}개여야 합니다.")
+
+        params = {}
+        for index, stock_code in enumerate(stock_codes, start=1):
+            params[f"FID_COND_MRKT_DIV_CODE_{index}"] = market
+            params[f"FID_INPUT_ISCD_{index}"] = stock_code
+        extra_headers = {
+            "content-type": "application/json; charset=utf-8",
+            "custtype": custtype,
+        }
+        return await self.get(
+            endpoint="/uapi/domestic-stock/v1/quotations/intstock-multprice",
+            tr_id="FHKST11300006",
+            params=params,
+            extra_headers=extra_headers,
+        )
+
     async def get_nxt_current_price(
         self,
         stock_code: str,
@@ -255,5 +293,5 @@ class KISClient(BaseAPIClient):
 
     async def refresh_token(self) -> str:
         """토큰 강제 갱신"""
-        self.token_manager.invalidate()
+        await self.token_manager.invalidate()
         return await self.token_manager.get_token()
@@ -38,6 +38,8 @@ class StockParser:
     US_RSYM = 5
     US_KNAM = 6
     US_ENAM = 7
+    US_MSTM = 15
+    US_METM = 16
     US_FIELD_COUNT = 24
 
     def __init__(self, data_dir: str = "../docs/stocks"):
@@ -99,6 +101,8 @@ class StockParser:
         korea_name = fields[self.US_KNAM].strip()
         english_name = fields[self.US_ENAM].strip()
         exchange_code = fields[self.US_EXCD].strip()
+        session_start = fields[self.US_MSTM].strip()
+        session_end = fields[self.US_METM].strip()
 
         name = korea_name or english_name
         if not symbol or not name:
@@ -110,6 +114,8 @@ class StockParser:
             name=name,
             market=market,
             exchange=exchange or exchange_code,
+            session_start=session_start or None,
+            session_end=session_end or None,
         )
 
     def parse_file(
@@ -0,0 +1,59 @@
+"""테스트 공용 테스트 더블."""
+
+import asyncio
+
+DEFAULT_RESPONSE = {"rt_cd": "0", "output": {"stck_prpr": "72000"}}
+FAILED_RESPONSE = {"rt_cd": "1", "msg1": "조회할 수 없는 종목입니다."}
+
+# 현재가(inquire-price) 필드 -> 관심종목(멀티종목) 시세 필드
+MULTI_PRICE_FIELDS = {
+    "stck_prpr": "inter2_prpr",
+    "prdy_vrss": "inter2_prdy_vrss",
+    "prdy_ctrt": "prdy_ctrt",
+    "acml_vol": "acml_vol",
+    "acml_tr_pbmn": "acml_tr_pbmn",
+}
+
+
+class FakeKISClient:
+    """KIS 클라이언트 테스트 더블.
+
+    ``responses``에 없는 종목은 ``DEFAULT_RESPONSE``를, ``failing`` 종목은 오류 응답을
+    반환합니다(멀티종목 시세에서는 빠짐). ``blocked=True``이면 ``release``가 설정될 때까지
+    응답을 미룹니다. ``calls``에는 종목별 (stock_code, market)을, ``multi_calls``에는
+    멀티종목 시세 호출마다 종목코드 목록을 기록합니다.
+    """
+
+    def __init__(
+        self,
+        responses: dict[str, dict] | None = None,
+        failing: tuple[str, ...] = (),
+        blocked: bool = False,
+    ):
+        self.responses = responses or {}
+        self.failing = set(failing)
+        self.calls: list[tuple[str, str]] = []
+        self.multi_calls: list[list[str]] = []
+        self.release = asyncio.Event()
+        if not blocked:
+            self.release.set()
+
+    async def get_current_price(self, stock_code: str, market: str = "J") -> dict:
+        self.calls.append((stock_code, market))
+        await self.release.wait()
+        if stock_code in self.failing:
+            return FAILED_RESPONSE
+        return self.responses.get(stock_code, DEFAULT_RESPONSE)
+
+    async def get_multi_current_prices(self, stock_codes: list[str], market: str = "J") -> dict:
+        self.calls.extend((stock_code, market) for stock_code in stock_codes)
+        self.multi_calls.append(list(stock_codes))
+        await self.release.wait()
+        output = []
+        for stock_code in stock_codes:
+            if stock_code in self.failing:
+                continue
+            price = self.responses.get(stock_code, DEFAULT_RESPONSE)["output"]
+            row = {MULTI_PRICE_FIELDS[field]: value for field, value in price.items() if field in MULTI_PRICE_FIELDS}
+            output.append({"inter_shrn_iscd": stock_code, **row})
+        return {"rt_cd": "0", "output": output}
@@ -0,0 +1,174 @@
+"""비동기 DB 접근 계층 테스트."""
+
+import asyncio
+from pathlib import Path
+import sqlite3
+import sys
+import threading
+import time
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from db import AsyncDatabase, Database  # noqa: E402
+from db.database import close_pools  # noqa: E402
+
+
+@pytest.fixture
+def adb(tmp_path: Path):
+    db = Database(str(tmp_path / "stocks.db"))
+    db.create_tables()
+    adb = AsyncDatabase(db)
+    yield adb
+    adb.close()
+    close_pools()
+
+
+@pytest.mark.asyncio
+async def test_slow_query_does_not_block_event_loop(adb: AsyncDatabase):
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    await adb.read(time.sleep, 0.2)
+    task.cancel()
+
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_writes_run_on_single_writer_thread(adb: AsyncDatabase):
+    write_threads = set()
+    read_threads = set()
+
+    def upsert(code: str) -> None:
+        write_threads.add(threading.current_thread().name)
+        adb.db.upsert_current_price(code, "J", {"stck_prpr": code})
+
+    def read(code: str) -> dict | None:
+        read_threads.add(threading.current_thread().name)
+        return adb.db.get_current_price(code, "J")
+
+    codes = [f"{index:06d}" for index in range(20)]
+    await asyncio.gather(*(adb.write(upsert, code) for code in codes))
+    rows = await asyncio.gather(*(adb.read(read, code) for code in codes))
+
+    assert len(write_threads) == 1
+    assert next(iter(write_threads)).startswith("db-writer")
+    assert all(name.startswith("db-reader") for name in read_threads)
+    assert [row["price"] for row in rows] == [int(code) for code in codes]
+
+
+@pytest.mark.asyncio
+async def test_memory_database_runs_reads_on_writer_thread():
+    db = Database(":memory:")
+    db.create_tables()
+    adb = AsyncDatabase(db)
+
+    await adb.upsert_current_price("005930", "J", {"stck_prpr": "71000"})
+    cached = await adb.get_current_price("005930", "J")
+    thread_name = await adb.read(lambda: threading.current_thread().name)
+    adb.close()
+
+    assert cached["price"] == 71000
+    assert thread_name.startswith("db-writer")
+
+
+@pytest.mark.asyncio
+async def test_price_upserts_are_coalesced_and_visible_before_flush(adb: AsyncDatabase):
+    for version in range(4):
+        for index in range(50):
+            await adb.upsert_current_price(f"{index:06d}", "J", {"stck_prpr": str(version)})
+
+    assert len(adb.price_buffer) == 50
+    assert adb.db.get_current_price("000001", "J") is None
+    buffered = await adb.get_current_price("000001", "J")
+    assert buffered["price"] == 3
+
+    assert await adb.price_buffer.flush() == 50
+    assert adb.price_buffer.flushes == 1
+    assert adb.db.get_current_price("000001", "J")["price"] == 3
+
+
+@pytest.mark.asyncio
+async def test_price_buffer_flushes_on_size_interval_and_close(tmp_path: Path):
+    db = Database(str(tmp_path / "stocks.db"))
+    db.create_tables()
+    adb = AsyncDatabase(db, flush_interval_ms=20, max_buffered_rows=3)
+
+    for code in ("000001", "000002", "000003"):
+        await adb.upsert_current_price(code, "J", {})
+    assert len(adb.price_buffer) == 0
+    assert db.get_current_price("000003", "J") is not None
+
+    await adb.upsert_current_price("000004", "J", {})
+    await asyncio.sleep(0.1)
+    assert db.get_current_price("000004", "J") is not None
+
+    await adb.upsert_current_price("000005", "J", {})
+    await adb.aclose()
+    close_pools()
+
+    reopened = Database(str(tmp_path / "stocks.db"))
+    assert reopened.get_current_price("000005", "J") is not None
+    close_pools()
+
+
+@pytest.mark.asyncio
+async def test_price_buffer_keeps_inflight_rows_visible_until_commit(adb: AsyncDatabase):
+    in_transaction = threading.Event()
+    release = threading.Event()
+
+    def hold_transaction():
+        with adb.db.transaction():
+            in_transaction.set()
+            release.wait(timeout=5)
+
+    holder = threading.Thread(target=hold_transaction)
+    holder.start()
+    in_transaction.wait(timeout=5)
+
+    await adb.upsert_current_price("005930", "J", {"stck_prpr": "71000"})
+    flush = asyncio.create_task(adb.price_buffer.flush())
+    await asyncio.sleep(0.05)
+    assert len(adb.price_buffer) == 0
+    assert adb.price_buffer.get("005930", "J")["price"] == 71000
+
+    release.set()
+    assert await flush == 1
+    holder.join(timeout=5)
+    assert adb.price_buffer.get("005930", "J") is None
+    assert adb.db.get_current_price("005930", "J")["price"] == 71000
+
+
+@pytest.mark.asyncio
+async def test_price_buffer_retries_failed_flush(tmp_path: Path, monkeypatch):
+    db = Database(str(tmp_path / "stocks.db"))
+    db.create_tables()
+    adb = AsyncDatabase(db, flush_interval_ms=20)
+    upsert = db.upsert_current_prices
+    failures = []
+
+    def failing_once(rows, keep_raw=True):
+        if not failures:
+            failures.append(rows)
+            raise sqlite3.OperationalError("database is locked")
+        return upsert(rows, keep_raw)
+
+    monkeypatch.setattr(db, "upsert_current_prices", failing_once)
+
+    await adb.upsert_current_price("005930", "J", {"stck_prpr": "71000"})
+    await asyncio.sleep(0.15)
+
+    assert len(failures) == 1
+    assert adb.price_buffer.flushes == 1
+    assert db.get_current_price("005930", "J")["price"] == 71000
+    await adb.aclose()
+    close_pools()
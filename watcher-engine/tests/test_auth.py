@@ -0,0 +1,71 @@
+"""KIS 토큰 관리자 저장소 테스트."""
+
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+import threading
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from db import AsyncDatabase, Database  # noqa: E402
+from db.database import close_pools  # noqa: E402
+from external.auth import TokenManager  # noqa: E402
+
+BASE_URL = "https://openapi.example.com"
+
+
+@pytest.fixture
+def adb(tmp_path: Path):
+    db = Database(str(tmp_path / "stocks.db"))
+    db.create_tables()
+    adb = AsyncDatabase(db)
+    yield adb
+    adb.close()
+    close_pools()
+
+
+def _store_token(db: Database, access_token: str) -> None:
+    expired_at = datetime.now() + timedelta(hours=6)
+    db.upsert_kis_token(
+        "key", BASE_URL, access_token, "Bearer", 86400, expired_at.strftime("%Y-%m-%d %H:%M:%S")
+    )
+
+
+@pytest.mark.asyncio
+async def test_token_manager_reuses_stored_token(adb: AsyncDatabase):
+    _store_token(adb.db, "stored-token")
+    manager = TokenManager("key", "secret", BASE_URL, storage=adb)
+
+    assert await manager.get_token() == "stored-token"
+
+
+@pytest.mark.asyncio
+async def test_token_invalidate_waits_for_open_transaction_off_the_loop(adb: AsyncDatabase):
+    _store_token(adb.db, "stored-token")
+    manager = TokenManager("key", "secret", BASE_URL, storage=adb)
+    in_transaction = threading.Event()
+    release = threading.Event()
+
+    def hold_transaction():
+        with adb.db.transaction() as conn:
+            conn.execute("UPDATE kis_tokens SET token_type = 'held'")
+            in_transaction.set()
+            release.wait(timeout=5)
+
+    holder = threading.Thread(target=hold_transaction)
+    holder.start()
+    in_transaction.wait(timeout=5)
+
+    invalidate = asyncio.create_task(manager.invalidate())
+    await asyncio.sleep(0.05)
+    assert not invalidate.done()
+
+    release.set()
+    await invalidate
+    holder.join(timeout=5)
+
+    assert adb.db.get_kis_token("key", BASE_URL) is None
@@ -1,5 +1,6 @@
 """현재가 조회 API 샘플 테스트."""
 
+from datetime import datetime
 from pathlib import Path
 import sys
 
@@ -8,24 +9,14 @@ import pytest
 ROOT_DIR = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT_DIR))
 
+from app.services.market_session import PriceTTLPolicy  # noqa: E402
 from app.services.stock_current_price_service import StockCurrentPriceService  # noqa: E402
+from conftest import FakeKISClient  # noqa: E402
 from db import Database  # noqa: E402
 
 
-class FakeKISClient:
-    """KIS 클라이언트 테스트 더블."""
-
-    def __init__(self, responses: dict[str, dict]):
-        self.responses = responses
-        self.calls: list[str] = []
-
-    async def get_current_price(
-        self,
-        stock_code: str,
-        market: str = "J",
-    ) -> dict:
-        self.calls.append(stock_code)
-        return self.responses[stock_code]
+# 평일 장중 (KST)
+SESSION_OPEN = datetime(2026, 1, 26, 10, 0, 0)
 
 
 @pytest.mark.asyncio
@@ -54,7 +45,7 @@ async def test_current_price_cache_flow():
 
     assert result["source"] == "kis"
     assert result["price"]["stck_prpr"] == "72000"
-    assert client.calls == ["005930"]
+    assert client.calls == [("005930", "J")]
 
     cached = await service.get_current_price(
         stock_code="005930",
@@ -64,4 +55,116 @@ async def test_current_price_cache_flow():
 
     assert cached["source"] == "db"
     assert cached["price"]["stck_prpr"] == "72000"
-    assert client.calls == ["005930"]
+    assert client.calls == [("005930", "J")]
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate_returns_cached_price_and_refreshes():
+    responses = {
+        "005930": {"rt_cd": "0", "output": {"stck_prpr": "73000"}},
+    }
+
+    db = Database(":memory:")
+    client = FakeKISClient(responses)
+    service = StockCurrentPriceService(
+        db=db,
+        client=client,
+        ttl_policy=PriceTTLPolicy(clock=lambda: SESSION_OPEN),
+    )
+    service.cache.put("005930", "J", {"stck_prpr": "72000"}, "2024-01-02 10:00:00", age_sec=20)
+
+    stale = await service.get_current_price(
+        stock_code="005930",
+        market="J",
+        use_cache=True,
+        max_age_sec=10,
+        stale_while_revalidate_sec=30,
+    )
+
+    assert stale["source"] == "db"
+    assert stale["stale"] is True
+    assert stale["age_sec"] >= 20
+    assert stale["price"]["stck_prpr"] == "72000"
+
+    await service.aclose()
+    assert client.calls == [("005930", "J")]
+
+    fresh = await service.get_current_price(
+        stock_code="005930",
+        market="J",
+        use_cache=True,
+        max_age_sec=10,
+        stale_while_revalidate_sec=30,
+    )
+
+    assert fresh["stale"] is False
+    assert fresh["price"]["stck_prpr"] == "73000"
+    assert client.calls == [("005930", "J")]
+
+
+@pytest.mark.asyncio
+async def test_price_older_than_revalidate_window_is_fetched_inline():
+    responses = {
+        "005930": {"rt_cd": "0", "output": {"stck_prpr": "73000"}},
+    }
+
+    db = Database(":memory:")
+    client = FakeKISClient(responses)
+    service = StockCurrentPriceService(
+        db=db,
+        client=client,
+        ttl_policy=PriceTTLPolicy(clock=lambda: SESSION_OPEN),
+    )
+    service.cache.put("005930", "J", {"stck_prpr": "72000"}, "2024-01-02 10:00:00", age_sec=60)
+
+    result = await service.get_current_price(
+        stock_code="005930",
+        market="J",
+        use_cache=True,
+        max_age_sec=10,
+        stale_while_revalidate_sec=30,
+    )
+
+    assert result["source"] == "kis"
+    assert result["stale"] is False
+    assert result["price"]["stck_prpr"] == "73000"
+
+
+@pytest.mark.asyncio
+async def test_cached_row_returns_full_payload_from_compressed_column():
+    payload = {"stck_prpr": "72000", "prdy_ctrt": "0.70", "hts_kor_isnm": "삼성전자"}
+    db = Database(":memory:")
+    db.create_tables()
+    db.upsert_current_price("005930", "J", payload)
+    client = FakeKISClient({})
+    service = StockCurrentPriceService(db=db, client=client)
+
+    result = await service.get_current_price(stock_code="005930", market="J", use_cache=True)
+
+    assert result["source"] == "db"
+    assert result["price"] == payload
+    assert client.calls == []
+
+
+@pytest.mark.asyncio
+async def test_stored_prices_share_buffered_timestamp(monkeypatch):
+    monkeypatch.setattr("db.write_buffer.utc_timestamp", lambda: "2026-01-26 01:00:00")
+    service = StockCurrentPriceService(db=Database(":memory:"), client=FakeKISClient({}))
+
+    stored = await service.store_prices([("005930", "J", {"stck_prpr": "72000"})])
+
+    assert stored[0].updated_at == "2026-01-26 01:00:00"
+    assert service.adb.price_buffer.get("005930", "J")["updated_at"] == "2026-01-26 01:00:00"
+
+
+@pytest.mark.asyncio
+async def test_unstored_refresh_returns_same_fields_as_stored_refresh():
+    responses = {"005930": {"rt_cd": "0", "output": {"stck_prpr": "72000"}}}
+    service = StockCurrentPriceService(db=Database(":memory:"), client=FakeKISClient(responses))
+
+    stored = await service.refresh_loader("005930", "J")()
+    unstored = await service.refresh_loader("005930", "J", store=False)()
+
+    assert unstored.keys() == stored.keys()
+    assert unstored["updated_at"]
+    assert unstored["price"] == stored["price"]
@@ -0,0 +1,217 @@
+"""Database 연결 풀 테스트."""
+
+from pathlib import Path
+import sqlite3
+import sys
+import threading
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from db import Database  # noqa: E402
+from db.database import BUSY_TIMEOUT_MS, close_pools  # noqa: E402
+from db.models import HoldingLot  # noqa: E402
+from db.price_codec import decompress_payload  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path: Path):
+    yield str(tmp_path / "stocks.db")
+    close_pools()
+
+
+def test_file_database_uses_wal_and_tuned_pragmas(db_path: str):
+    db = Database(db_path)
+
+    with db.transaction() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == BUSY_TIMEOUT_MS
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] < 0
+
+
+def test_instances_share_pooled_connections(db_path: str):
+    first = Database(db_path)
+    second = Database(db_path)
+
+    assert first.write_lock is second.write_lock
+    with first.transaction() as first_writer, second.transaction() as second_writer:
+        assert first_writer is second_writer
+    assert first.read_connection() is second.read_connection()
+    assert first.read_connection() is not first_writer
+
+    first.close()
+    with second.transaction() as conn:
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+
+def test_reader_is_not_blocked_by_open_write_transaction(db_path: str):
+    db = Database(db_path)
+    db.create_tables()
+    db.upsert_current_price("005930", "J", {"stck_prpr": "70000"})
+
+    with db.transaction() as writer:
+        writer.execute(
+            "UPDATE stock_price_current SET price = ? WHERE stock_code = ?",
+            (71000, "005930"),
+        )
+        assert writer.in_transaction
+
+        cached = db.get_current_price("005930", "J")
+        assert cached["price"] == 70000
+
+    cached = db.get_current_price("005930", "J")
+    assert cached["price"] == 71000
+
+
+def test_write_methods_wait_for_open_transaction(db_path: str):
+    db = Database(db_path)
+    db.create_tables()
+    lot = HoldingLot(stock_code="005930", quantity=1, buy_price=70000, buy_date="2026-01-02", remaining_qty=1)
+    inserted = threading.Event()
+
+    def insert_lot():
+        db.insert_holding_lot(lot)
+        inserted.set()
+
+    with pytest.raises(RuntimeError):
+        with db.transaction() as conn:
+            conn.execute("DELETE FROM holding_lots")
+            worker = threading.Thread(target=insert_lot)
+            worker.start()
+            assert not inserted.wait(timeout=0.1)
+            raise RuntimeError("boom")
+    worker.join(timeout=5)
+
+    assert inserted.is_set()
+    assert [open_lot.quantity for open_lot in db.get_open_lots("005930")] == [1]
+
+
+def test_reader_connection_is_read_only(db_path: str):
+    db = Database(db_path)
+    db.create_tables()
+
+    with pytest.raises(sqlite3.OperationalError):
+        db.read_connection().execute("DELETE FROM stock_price_current")
+
+
+def test_transaction_rolls_back_on_error():
+    db = Database(":memory:")
+    db.create_tables()
+
+    with pytest.raises(RuntimeError):
+        with db.transaction() as conn:
+            conn.execute(
+                "INSERT INTO stock_price_current (stock_code, market, price) VALUES (?, ?, ?)",
+                ("005930", "J", 70000),
+            )
+            raise RuntimeError("boom")
+
+    with db.transaction() as conn:
+        assert db.read_connection() is conn
+    assert db.get_current_price("005930", "J") is None
+
+
+def test_create_tables_adds_session_columns_to_existing_stocks_table():
+    db = Database(":memory:")
+    with db.transaction() as conn:
+        conn.execute(
+            """
+            CREATE TABLE stocks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                code TEXT NOT NULL UNIQUE,
+                standard_code TEXT,
+                name TEXT NOT NULL,
+                market TEXT NOT NULL,
+                exchange TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+
+    db.create_tables()
+
+    columns = {row[1] for row in db.read_connection().execute("PRAGMA table_info(stocks)").fetchall()}
+    assert {"session_start", "session_end"} <= columns
+
+
+def test_current_price_keeps_typed_columns_and_compressed_payload():
+    db = Database(":memory:")
+    db.create_tables()
+    payload = {
+        "stck_prpr": "72000",
+        "prdy_vrss": "-500",
+        "prdy_ctrt": "-0.69",
+        "acml_vol": "1500000",
+        "acml_tr_pbmn": "108000000000",
+        "hts_kor_isnm": "삼성전자",
+    }
+
+    db.upsert_current_price("005930", "J", payload)
+    row = db.get_current_price("005930", "J")
+
+    assert row["price"] == 72000
+    assert row["change"] == -500
+    assert row["change_rate"] == -0.69
+    assert row["volume"] == 1500000
+    assert row["trade_amount"] == 108000000000
+    assert decompress_payload(row["raw_payload"]) == payload
+
+    db.upsert_current_price("005930", "J", payload, keep_raw=False)
+    assert db.get_current_price("005930", "J")["raw_payload"] is None
+
+
+def test_get_current_prices_reads_keys_in_bulk(monkeypatch):
+    monkeypatch.setattr("db.database.CURRENT_PRICE_BATCH_SIZE", 2)
+    db = Database(":memory:")
+    db.create_tables()
+    db.upsert_current_prices(
+        [
+            ("005930", "J", {"stck_prpr": "70000"}, "2026-01-02 00:00:00"),
+            ("005930", "NX", {"stck_prpr": "70100"}, "2026-01-02 00:00:00"),
+            ("000660", "J", {"stck_prpr": "130000"}, "2026-01-02 00:00:00"),
+        ]
+    )
+
+    rows = db.get_current_prices(
+        [("005930", "J"), ("005930", "NX"), ("000660", "J"), ("000660", "NX"), ("005930", "J")]
+    )
+
+    assert set(rows) == {("005930", "J"), ("005930", "NX"), ("000660", "J")}
+    assert rows[("005930", "NX")]["price"] == 70100
+    assert rows[("000660", "J")]["updated_at"] == "2026-01-02 00:00:00"
+    assert db.get_current_prices([]) == {}
+
+
+def test_create_tables_migrates_price_json_rows():
+    db = Database(":memory:")
+    with db.transaction() as conn:
+        conn.execute(
+            """
+            CREATE TABLE stock_price_current (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                stock_code TEXT NOT NULL,
+                market TEXT NOT NULL,
+                price_json TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (stock_code, market)
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO stock_price_current (stock_code, market, price_json, updated_at) "
+            "VALUES (?, ?, ?, ?)",
+            ("AAPL", "NAS", '{"price": {"last": "189.5000"}, "change": {"rate": "1.2"}}', "2026-01-02 00:00:00"),
+        )
+
+    db.create_tables()
+
+    row = db.get_current_price("AAPL", "NAS")
+    assert row["price"] == 189.5
+    assert row["change_rate"] == 1.2
+    assert row["updated_at"] == "2026-01-02 00:00:00"
+    assert decompress_payload(row["raw_payload"])["price"]["last"] == "189.5000"
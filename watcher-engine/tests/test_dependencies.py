@@ -0,0 +1,58 @@
+"""앱 단위 서비스 주입 테스트."""
+
+from pathlib import Path
+import sys
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from app.dependencies import init_services  # noqa: E402
+from app.routers import watchlists  # noqa: E402
+from db import Database  # noqa: E402
+from db.database import close_pools  # noqa: E402
+
+
+def test_ensure_schema_runs_ddl_once_per_path(tmp_path: Path, monkeypatch):
+    calls = []
+    create_tables = Database.create_tables
+
+    def counting_create_tables(self):
+        calls.append(self.db_path)
+        create_tables(self)
+
+    monkeypatch.setattr(Database, "create_tables", counting_create_tables)
+    db_path = str(tmp_path / "stocks.db")
+    try:
+        Database(db_path).ensure_schema()
+        Database(db_path).ensure_schema()
+        Database(":memory:").ensure_schema()
+    finally:
+        close_pools()
+
+    assert len(calls) == 2
+
+
+def test_routes_use_app_scoped_services(monkeypatch):
+    app = FastAPI()
+    app.include_router(watchlists.router, prefix="/watchlists")
+    services = init_services(app, Database(":memory:"))
+
+    def unexpected_ddl(self):
+        raise AssertionError("요청 처리 중 DDL이 실행되면 안 됩니다.")
+
+    monkeypatch.setattr(Database, "create_tables", unexpected_ddl)
+
+    with TestClient(app) as client:
+        created = client.post("/watchlists", params={"name": "관심종목"})
+        assert created.status_code == 200
+        watchlist_id = created.json()["id"]
+
+        client.post(f"/watchlists/{watchlist_id}/items", params={"stock_code": "005930"})
+        listed = client.get("/watchlists")
+
+    assert listed.json()["count"] == 1
+    assert services.watchlist_service.price_service is services.current_price_service
+    assert services.watchlist_service.list_items(watchlist_id)[0]["stock_code"] == "005930"
@@ -0,0 +1,71 @@
+"""시장 세션 기반 캐시 TTL 정책 테스트."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from app.services.market_session import KST, PriceTTLPolicy, US_EASTERN  # noqa: E402
+
+
+def test_session_uses_requested_ttl_while_market_is_open():
+    policy = PriceTTLPolicy()
+    regular = datetime(2026, 1, 26, 10, 0, tzinfo=KST)  # 월요일
+
+    assert policy.is_open("J", regular)
+    assert policy.max_age_sec("J", 5, regular) == 5
+    assert policy.max_age_sec("J", None, regular) is None
+
+
+def test_after_close_prices_fetched_after_close_stay_valid_until_next_session():
+    policy = PriceTTLPolicy(settle_sec=60)
+    evening = datetime(2026, 1, 26, 18, 0, tzinfo=KST)
+
+    # KRX 15:30 종료 후 2시간 30분 경과 (정산 여유 60초 제외)
+    assert not policy.is_open("J", evening)
+    assert policy.max_age_sec("J", 5, evening) == 2.5 * 3600 - 60
+
+    # NXT 애프터마켓은 아직 거래 중
+    assert policy.is_open("NX", evening)
+    assert policy.max_age_sec("NX", 5, evening) == 5
+
+
+def test_weekend_extends_back_to_friday_close():
+    policy = PriceTTLPolicy(settle_sec=0)
+    sunday = datetime(2026, 1, 25, 12, 0, tzinfo=KST)
+
+    assert not policy.is_open("NX", sunday)
+    # 금요일 20:00 종료 후 40시간
+    assert policy.max_age_sec("NX", 5, sunday) == 40 * 3600
+
+
+def test_us_session_comes_from_master_file_hours():
+    policy = PriceTTLPolicy(settle_sec=0)
+    open_time = datetime(2026, 1, 26, 10, 0, tzinfo=US_EASTERN)
+    before_open = datetime(2026, 1, 26, 9, 0, tzinfo=US_EASTERN)
+
+    assert policy.is_open("NAS", open_time, session_start="930", session_end="1600")
+    assert not policy.is_open("NAS", before_open, session_start="930", session_end="1600")
+    # 잘못된 값이면 기본 정규장(09:30-16:00) 사용
+    assert policy.is_open("NAS", open_time, session_start="", session_end="x")
+
+    # 개장 전에는 직전 거래일(금요일) 16:00 종료 기준
+    age = policy.max_age_sec(
+        "NAS", 5, before_open.astimezone(timezone.utc), session_start="930", session_end="1600"
+    )
+    assert age == 17 * 3600 + 24 * 3600 * 2
+
+
+def test_us_session_accepts_midnight_end_and_rejects_other_hour_24_values():
+    policy = PriceTTLPolicy(settle_sec=0)
+    before_open = datetime(2026, 1, 26, 9, 0, tzinfo=US_EASTERN)
+    late_evening = datetime(2026, 1, 26, 23, 0, tzinfo=US_EASTERN)
+
+    assert policy.is_open("NAS", late_evening, session_start="930", session_end="2400")
+    # 2400 종료는 금요일 24:00(토요일 0시) 기준
+    age = policy.max_age_sec("NAS", 5, before_open, session_start="930", session_end="2400")
+    assert age == 9 * 3600 + 24 * 3600 * 2
+    # 2430 같은 값은 잘못된 값으로 보고 기본 정규장 사용
+    assert not policy.is_open("NAS", late_evening, session_start="930", session_end="2430")
@@ -0,0 +1,106 @@
+"""현재가 L1 캐시 테스트."""
+
+import asyncio
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from app.services.price_cache import PriceCache  # noqa: E402
+from app.services.stock_current_price_service import StockCurrentPriceService  # noqa: E402
+from conftest import FakeKISClient  # noqa: E402
+from db import Database  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_expires_after_ttl_and_evicts_least_recently_used():
+    clock = FakeClock()
+    cache = PriceCache(max_entries=2, ttl_sec=5, clock=clock)
+
+    cache.put("005930", "J", {"stck_prpr": "1"}, None)
+    cache.put("000660", "J", {"stck_prpr": "2"}, None)
+    assert cache.get("005930", "J") is not None
+
+    cache.put("035420", "J", {"stck_prpr": "3"}, None)
+    assert cache.get("000660", "J") is None
+    assert cache.evictions == 1
+
+    clock.now += 6
+    assert cache.get("005930", "J") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["size"] == 1
+
+
+def test_cache_respects_max_age_of_data():
+    clock = FakeClock()
+    cache = PriceCache(ttl_sec=60, clock=clock)
+
+    cache.put("005930", "J", {"stck_prpr": "1"}, None, age_sec=10)
+
+    assert cache.get("005930", "J", max_age_sec=5) is None
+    assert cache.get("005930", "J", max_age_sec=30) is not None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_kis_call():
+    client = FakeKISClient(blocked=True)
+    service = StockCurrentPriceService(db=Database(":memory:"), client=client)
+
+    tasks = [
+        asyncio.create_task(service.get_current_price("005930", market="J", use_cache=True))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0.05)
+    client.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert client.calls == [("005930", "J")]
+    assert all(result["price"]["stck_prpr"] == "72000" for result in results)
+    assert service.cache.coalesced == 4
+
+    cached = await service.get_current_price("005930", market="J", use_cache=True)
+    assert cached["source"] == "db"
+    assert service.cache.hits == 1
+    await service.adb.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_lets_followers_retry():
+    cache = PriceCache()
+    started = asyncio.Event()
+    calls = 0
+
+    async def loader() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await asyncio.sleep(10)
+        await asyncio.sleep(0.01)
+        return "fresh"
+
+    leader = asyncio.create_task(cache.load("005930", "J", loader))
+    await started.wait()
+    followers = [asyncio.create_task(cache.load("005930", "J", loader)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    results = await asyncio.gather(*followers)
+
+    assert leader.cancelled()
+    assert results == ["fresh"] * 3
+    assert calls == 2
+    assert not cache.is_loading("005930", "J")
@@ -0,0 +1,203 @@
+"""현재가 백그라운드 갱신 테스트."""
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_DIR))
+
+from app.services.market_session import PriceTTLPolicy  # noqa: E402
+from app.services.price_refresher import PriceRefresher  # noqa: E402
+from app.services.stock_current_price_service import StockCurrentPriceService  # noqa: E402
+from app.services.watchlist_service import WatchListService  # noqa: E402
+from conftest import FakeKISClient  # noqa: E402
+from db import Database, HoldingLot, Stock, StockListing  # noqa: E402
+from db.price_codec import utc_timestamp  # noqa: E402
+from external.client import RateLimiter  # noqa: E402
+
+# 평일 장중 / 장 종료 후 (KST)
+SESSION_OPEN = datetime(2026, 1, 26, 10, 0, 0)
+AFTER_CLOSE = datetime(2026, 1, 26, 21, 0, 0)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def build_refresher(
+    now: datetime,
+    failing: tuple[str, ...] = (),
+    **kwargs,
+) -> tuple[PriceRefresher, FakeKISClient, Database]:
+    db = Database(":memory:")
+    client = FakeKISClient(failing=failing)
+    price_service = StockCurrentPriceService(
+        db=db,
+        client=client,
+        ttl_policy=PriceTTLPolicy(clock=lambda: now),
+    )
+    service = WatchListService(db=db, price_service=price_service)
+
+    db.insert_stocks(
+        [
+            Stock("005930", "KR7005930003", "삼성전자", "KOSPI", "KRX"),
+            Stock("000660", "KR7000660001", "SK하이닉스", "KOSPI", "KRX"),
+            Stock("035720", "KR7035720002", "카카오", "KOSPI", "KRX"),
+        ]
+    )
+    db.insert_stock_listings([StockListing("005930", "NXT", 0)])
+
+    watchlist = service.create_watchlist("관심종목")
+    folder = service.create_folder(watchlist["id"], "반도체")
+    service.add_item(watchlist["id"], "005930")
+    service.add_item(watchlist["id"], "005930", folder_id=folder["id"])
+    db.insert_holding_lot(
+        HoldingLot(stock_code="000660", quantity=10, buy_price=130000, buy_date="2026-01-02", remaining_qty=10)
+    )
+    db.insert_holding_lot(
+        HoldingLot(
+            stock_code="035720",
+            quantity=10,
+            buy_price=50000,
+            buy_date="2026-01-02",
+            remaining_qty=0,
+            is_closed=True,
+        )
+    )
+    return PriceRefresher(service, **kwargs), client, db
+
+
+@pytest.mark.asyncio
+async def test_refresh_once_tracks_watchlist_and_open_holdings():
+    refresher, client, db = build_refresher(SESSION_OPEN, interval_sec=10)
+
+    result = await refresher.refresh_once()
+
+    assert sorted(client.calls) == [("000660", "J"), ("005930", "J"), ("005930", "NX")]
+    assert result == {"tracked": 3, "due": 3, "refreshed": 3, "failed": 0}
+
+    await refresher.price_service.adb.price_buffer.flush()
+    assert db.get_current_price("005930", "NX")["price"] == 72000
+
+    # 주기 안에서는 다시 호출하지 않음
+    result = await refresher.refresh_once()
+    assert len(client.calls) == 3
+    assert result["due"] == 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_once_respects_call_budget_oldest_first():
+    refresher, client, _ = build_refresher(SESSION_OPEN, interval_sec=10, max_calls_per_sec=0.2)
+    cache = refresher.price_service.cache
+    cache.put("000660", "J", {"stck_prpr": "130000"}, None, age_sec=30)
+    cache.put("005930", "J", {"stck_prpr": "71000"}, None, age_sec=20)
+    cache.put("005930", "NX", {"stck_prpr": "71100"}, None, age_sec=1)
+
+    result = await refresher.refresh_once()
+
+    assert refresher.budget == 2
+    assert client.calls == [("000660", "J"), ("005930", "J")]
+    assert result == {"tracked": 3, "due": 2, "refreshed": 2, "failed": 0}
+
+
+@pytest.mark.asyncio
+async def test_refresh_once_leaves_budget_used_by_request_path_on_shared_limiter():
+    limiter = RateLimiter(0.2)
+    refresher, client, _ = build_refresher(SESSION_OPEN, interval_sec=10, rate_limiter=limiter)
+    assert refresher.cycle_budget() == 2
+
+    # 요청 경로에서 같은 클라이언트로 한 번 호출 → KRX 두 종목을 묶은 한 번만 남음
+    await limiter.acquire()
+    result = await refresher.refresh_once()
+
+    assert client.multi_calls == [["000660", "005930"]]
+    assert client.calls == [("000660", "J"), ("005930", "J")]
+    assert result == {"tracked": 3, "due": 3, "refreshed": 2, "failed": 0}
+
+
+@pytest.mark.asyncio
+async def test_due_check_reads_stored_ages_without_touching_l1_cache():
+    refresher, client, db = build_refresher(SESSION_OPEN, interval_sec=10)
+    updated_at = utc_timestamp()
+    db.upsert_current_prices(
+        [
+            ("000660", "J", {"stck_prpr": "130000"}, updated_at),
+            ("005930", "J", {"stck_prpr": "71000"}, updated_at),
+            ("005930", "NX", {"stck_prpr": "71100"}, updated_at),
+        ]
+    )
+
+    result = await refresher.refresh_once()
+
+    assert client.calls == []
+    assert result["due"] == 0
+    stats = refresher.price_service.cache.stats()
+    assert (stats["size"], stats["hits"], stats["misses"]) == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_refresh_once_skips_prices_fetched_after_close():
+    refresher, client, _ = build_refresher(AFTER_CLOSE, interval_sec=10)
+    cache = refresher.price_service.cache
+    # 21:00 기준 KRX(15:30 종료)는 종가 이후 값, NXT(20:00 종료)는 종료 전 값
+    cache.put("000660", "J", {"stck_prpr": "130000"}, None, age_sec=3600)
+    cache.put("005930", "J", {"stck_prpr": "71000"}, None, age_sec=3600)
+    cache.put("005930", "NX", {"stck_prpr": "71100"}, None, age_sec=7200)
+
+    await refresher.refresh_once()
+
+    assert client.calls == [("005930", "NX")]
+
+
+@pytest.mark.asyncio
+async def test_failed_keys_back_off_and_are_pruned():
+    clock = FakeClock()
+    refresher, client, db = build_refresher(SESSION_OPEN, failing=("000660",), interval_sec=10, clock=clock)
+
+    result = await refresher.refresh_once()
+    assert result["failed"] == 1
+    assert set(refresher._failed_until) == {("000660", "J")}
+
+    clock.now += 20
+    await refresher.refresh_once()
+    assert ("000660", "J") not in client.calls[3:]
+
+    # 청산된 종목은 대기 시간이 남아 있어도 실패 기록을 지움
+    with db.transaction() as conn:
+        conn.execute("UPDATE holding_lots SET is_closed = 1 WHERE stock_code = '000660'")
+    await refresher.refresh_once()
+    assert refresher._failed_until == {}
+
+    client.failing.clear()
+    refresher._failed_until[("005930", "J")] = clock.now + 1
+    clock.now += 2
+    await refresher.refresh_once()
+    assert refresher._failed_until == {}
+
+
+@pytest.mark.asyncio
+async def test_start_and_stop_background_task():
+    refresher, client, _ = build_refresher(SESSION_OPEN, interval_sec=10)
+
+    assert refresher.start() is True
+    assert refresher.start() is False
+    for _ in range(20):
+        if refresher.runs:
+            break
+        await asyncio.sleep(0.01)
+    await refresher.stop()
+
+    assert refresher.running is False
+    assert refresher.runs == 1
+    assert len(client.calls) == 3
+
+    disabled, _, _ = build_refresher(SESSION_OPEN, interval_sec=0)
+    assert disabled.start() is False
@@ -38,6 +38,8 @@ def test_parse_korean_and_us_lines():
     assert us_stock.code == fields[4].strip()
     assert us_stock.standard_code == fields[5].strip()
     assert us_stock.name == (fields[6].strip() or fields[7].strip())
+    assert us_stock.session_start == fields[15].strip()
+    assert us_stock.session_end == fields[16].strip()
 
 
 def test_parse_all_includes_kr_and_us():
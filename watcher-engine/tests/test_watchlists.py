@@ -1,5 +1,7 @@
 """Watch list 서비스 샘플 테스트."""
 
+import asyncio
+from datetime import datetime
 from pathlib import Path
 import sys
 
@@ -8,9 +10,15 @@ import pytest
 ROOT_DIR = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT_DIR))
 
+from app.services.market_session import PriceTTLPolicy  # noqa: E402
+from app.services.stock_current_price_service import StockCurrentPriceService  # noqa: E402
 from app.services.watchlist_service import WatchListService  # noqa: E402
+from conftest import FakeKISClient  # noqa: E402
 from db import Database  # noqa: E402
 
+# 평일 장중 (KST)
+SESSION_OPEN = datetime(2026, 1, 26, 10, 0, 0)
+
 
 def test_watchlist_flow():
     db = Database(":memory:")
@@ -50,7 +58,7 @@ async def test_watchlist_summary_cache():
     db.upsert_current_price(
         stock_code="005930",
         market="J",
-        price_json='{"stck_prpr":"71000","acml_vol":"1000","prdy_vrss":"500","prdy_ctrt":"0.70"}',
+        payload={"stck_prpr": "71000", "acml_vol": "1000", "prdy_vrss": "500", "prdy_ctrt": "0.70"},
     )
 
     items = await service.list_items_with_price(
@@ -64,4 +72,115 @@ async def test_watchlist_summary_cache():
     assert items[0]["current_price"] == "71000"
     assert items[0]["volume"] == "1000"
     assert items[0]["change"] == "500"
+    assert items[0]["change_rate"] == "0.70"
+
+
+@pytest.mark.asyncio
+async def test_watchlist_summary_serves_stale_price_while_revalidating():
+    db = Database(":memory:")
+    client = FakeKISClient()
+    price_service = StockCurrentPriceService(
+        db=db,
+        client=client,
+        ttl_policy=PriceTTLPolicy(clock=lambda: SESSION_OPEN),
+    )
+    service = WatchListService(db=db, price_service=price_service)
+    watchlist = service.create_watchlist("관심종목", "stale 테스트")
+    service.add_item(watchlist["id"], "005930", memo="삼성전자")
+    price_service.cache.put("005930", "J", {"stck_prpr": "71000"}, None, age_sec=20)
+
+    items = await service.list_items_with_price(
+        watchlist_id=watchlist["id"],
+        use_cache=True,
+        max_age_sec=10,
+        stale_while_revalidate_sec=30,
+        refresh_missing=False,
+        market="J",
+    )
+
+    assert items[0]["current_price"] == "71000"
+    assert items[0]["price_stale"] is True
+    assert items[0]["price_age_sec"] >= 20
+
+    await price_service.aclose()
+    assert client.calls == [("005930", "J")]
+    assert price_service.cache.get("005930", "J", max_age_sec=10).price["stck_prpr"] == "72000"
+
 
+@pytest.mark.asyncio
+async def test_watchlist_summary_fetches_each_missing_symbol_once():
+    db = Database(":memory:")
+    client = FakeKISClient()
+    price_service = StockCurrentPriceService(db=db, client=client)
+    service = WatchListService(db=db, price_service=price_service)
+    watchlist = service.create_watchlist("관심종목", "일괄 조회 테스트")
+    folder = service.create_folder(watchlist["id"], "반도체")
+    service.add_item(watchlist["id"], "005930", memo="삼성전자")
+    service.add_item(watchlist["id"], "005930", folder_id=folder["id"])
+    service.add_item(watchlist["id"], "000660", folder_id=folder["id"])
+    db.upsert_current_price("000660", "J", {"stck_prpr": "130000"})
+    db.upsert_current_price("000660", "NX", {"stck_prpr": "130100"})
+
+    items = await service.list_items_with_price(
+        watchlist_id=watchlist["id"],
+        use_cache=True,
+        refresh_missing=True,
+        market="J",
+        include_nxt=True,
+    )
+
+    assert sorted(client.calls) == [("005930", "J"), ("005930", "NX")]
+    by_code = {}
+    for item in items:
+        by_code.setdefault(item["stock_code"], []).append(item)
+    assert [item["price_source"] for item in by_code["005930"]] == ["kis", "kis"]
+    assert by_code["005930"][0]["current_price"] == "72000"
+    assert by_code["000660"][0]["price_source"] == "db"
+    assert by_code["000660"][0]["nxt_current_price"] == "130100"
+
+    assert len(price_service.adb.price_buffer) == 2
+    assert await price_service.adb.price_buffer.flush() == 2
+    assert price_service.adb.price_buffer.flushes == 1
+    assert db.get_current_price("005930", "NX")["price"] == 72000
+
+
+@pytest.mark.asyncio
+async def test_refresh_prices_batches_krx_misses_in_chunks():
+    db = Database(":memory:")
+    codes = [f"{index:06d}" for index in range(31)]
+    client = FakeKISClient(failing=(codes[1],))
+    price_service = StockCurrentPriceService(db=db, client=client)
+    service = WatchListService(db=db, price_service=price_service)
+    keys = [(code, "J") for code in codes] + [(codes[0], "J"), (codes[0], "NX")]
+
+    prices = await service.refresh_prices(keys)
+
+    assert client.multi_calls == [codes[:30], codes[30:]]
+    assert client.calls.count((codes[0], "NX")) == 1
+    assert prices[(codes[0], "J")][0]["price"] == 72000
+    assert prices[(codes[30], "J")][1] == "kis"
+    assert prices[(codes[1], "J")][1] == "error"
+    await price_service.adb.price_buffer.flush()
+    assert db.get_current_price(codes[30], "J")["price"] == 72000
+
+
+@pytest.mark.asyncio
+async def test_batched_refresh_seeds_single_flight_per_key():
+    db = Database(":memory:")
+    client = FakeKISClient(blocked=True)
+    price_service = StockCurrentPriceService(db=db, client=client)
+    service = WatchListService(db=db, price_service=price_service)
+
+    refresh = asyncio.create_task(service.refresh_prices([("005930", "J"), ("000660", "J")]))
+    await asyncio.sleep(0.01)
+    assert price_service.cache.is_loading("000660", "J")
+    follower = asyncio.create_task(price_service.get_current_price("000660", market="J", use_cache=True))
+    await asyncio.sleep(0.01)
+    client.release.set()
+    await refresh
+    result = await follower
+
+    assert client.multi_calls == [["005930", "000660"]]
+    assert client.calls == [("005930", "J"), ("000660", "J")]
+    assert result["price"]["stck_prpr"] == "72000"
+    assert price_service.cache.coalesced == 1